@@ -10,6 +10,9 @@ from .models import (
     Experience,
     Project,
     Skill,
+    Tag,
+    Task,
+    Technology,
     UserProfile,
 )
 
@@ -90,3 +93,35 @@ class BlogPostAdmin(admin.ModelAdmin):
         ("SEO", {"fields": ("meta_description", "meta_keywords"), "classes": ("collapse",)}),
         ("Timestamps", {"fields": ("created_at", "updated_at"), "classes": ("collapse",)}),
     )
+
+
+class TermAdmin(admin.ModelAdmin):
+    """
+    Terms are synced from the comma-separated fields of their rows: renaming or
+    adding one here would not reach those fields, nor invalidate the cache.
+    """
+
+    list_display = ["name", "normalized_name"]
+    search_fields = ["name"]
+    readonly_fields = ["name", "normalized_name"]
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(Tag)
+class TagAdmin(TermAdmin):
+    pass
+
+
+@admin.register(Technology)
+class TechnologyAdmin(TermAdmin):
+    pass
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ["name", "status", "priority", "attempts", "max_attempts", "run_after", "locked_by"]
+    list_filter = ["status", "name"]
+    search_fields = ["name", "last_error"]
+    readonly_fields = ["created_at", "updated_at", "locked_by", "locked_at", "last_error"]
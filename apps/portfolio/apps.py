@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class PortfolioConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.portfolio"
+
+    def ready(self):
+        from . import checks, instrumentation, signals  # noqa: F401
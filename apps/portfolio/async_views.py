@@ -0,0 +1,116 @@
+"""
+Async read path for the public portfolio API.
+
+Native Django async views serving the anonymous read-only endpoints under
+``/api/portfolio/async/``. Under an ASGI server (uvicorn workers) a request
+waiting on the database or on a slow client no longer pins a worker: queries
+go through the async ORM (``aiterator``/``afirst``/``acount``) and the event
+loop serves other requests meanwhile.
+
+Querysets and serializers are shared with the DRF viewsets, and responses are
+rendered with DRF's JSONRenderer, so the JSON is byte-identical to what the
+DRF endpoints return to anonymous clients. Everything the serializers read
+must be loaded up front (``select_related``/``prefetch_related``): a lazy
+query from the serializer raises SynchronousOnlyOperation.
+"""
+
+from django.http import HttpResponse
+from django.views.decorators.http import require_safe
+
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .columns import prune_columns
+from .renderers import JSONRenderer
+from .serializers import (
+    BlogPostListSerializer,
+    BlogPostSerializer,
+    PortfolioBundleSerializer,
+    ProjectListSerializer,
+    ProjectSerializer,
+)
+from .views import BlogPostViewSet, PortfolioBundleViewSet, ProjectViewSet, get_bundle_queryset
+
+
+def render(data, status=200):
+    return HttpResponse(JSONRenderer().render(data), status=status, content_type="application/json")
+
+
+def not_found(detail):
+    return render({"detail": detail}, status=404)
+
+
+async def render_page(request, queryset, serializer_class):
+    """Render one page of ``queryset`` like PageNumberPagination does."""
+    page_size = api_settings.PAGE_SIZE
+    try:
+        page = int(request.GET.get("page", 1))
+    except ValueError:
+        page = 0
+    count = await queryset.acount()
+    last_page = max(1, -(-count // page_size))
+    if not 1 <= page <= last_page:
+        return not_found("Invalid page.")
+
+    offset = (page - 1) * page_size
+    queryset = prune_columns(queryset, serializer_class())
+    rows = [row async for row in queryset[offset : offset + page_size].aiterator(chunk_size=page_size)]
+    context = {"request": request}
+
+    url = request.build_absolute_uri()
+    if page == 1:
+        previous = None
+    elif page == 2:
+        previous = remove_query_param(url, "page")
+    else:
+        previous = replace_query_param(url, "page", page - 1)
+    return render(
+        {
+            "count": count,
+            "next": replace_query_param(url, "page", page + 1) if page < last_page else None,
+            "previous": previous,
+            "results": serializer_class(rows, many=True, context=context).data,
+        }
+    )
+
+
+async def render_object(request, queryset, serializer_class):
+    instance = await queryset.afirst()
+    if instance is None:
+        return not_found(f"No {queryset.model._meta.object_name} matches the given query.")
+    return render(serializer_class(instance, context={"request": request}).data)
+
+
+@require_safe
+async def project_list(request):
+    """Published projects."""
+    queryset = ProjectViewSet.queryset.filter(is_published=True)
+    return await render_page(request, queryset, ProjectListSerializer)
+
+
+@require_safe
+async def project_detail(request, slug):
+    """A published project."""
+    queryset = ProjectViewSet.queryset.filter(is_published=True, slug=slug)
+    return await render_object(request, queryset, ProjectSerializer)
+
+
+@require_safe
+async def blogpost_list(request):
+    """Published blog posts."""
+    queryset = BlogPostViewSet.queryset.filter(status="published")
+    return await render_page(request, queryset, BlogPostListSerializer)
+
+
+@require_safe
+async def blogpost_detail(request, slug):
+    """A published blog post."""
+    queryset = BlogPostViewSet.queryset.filter(status="published", slug=slug)
+    return await render_object(request, queryset, BlogPostSerializer)
+
+
+@require_safe
+async def user_bundle(request, username):
+    """The complete public portfolio of a user."""
+    queryset = get_bundle_queryset(PortfolioBundleViewSet.recent_posts_count).filter(username=username)
+    return await render_object(request, queryset, PortfolioBundleSerializer)
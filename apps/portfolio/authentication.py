@@ -0,0 +1,150 @@
+"""
+Stateless JWT authentication.
+
+simplejwt's ``JWTAuthentication`` loads the user row on every authenticated
+request. ``StatelessJWTAuthentication`` trusts the access token instead on read
+requests: ``request.user`` is a ``ClaimsUser`` built from the ``user_id``,
+``username`` and ``is_staff`` claims that ``TokenObtainPairSerializer`` adds
+to the tokens. Write requests, and tokens issued without these claims, still
+load the user: the ``user``/``author`` foreign keys need a real instance and
+users deactivated or deleted since the token was issued are rejected there.
+Read requests keep working with such a token until it expires
+(``JWT_ACCESS_TOKEN_LIFETIME_MINUTES``).
+
+Verified tokens are kept in a bounded in-process LRU keyed by the SHA-256 of
+the raw token, so the signature and claims of a token are only checked once
+per worker; its expiry and revocation are still checked on every request.
+
+Tokens are revoked through ``POST /api/token/revoke/`` (logout, ``views.TokenRevokeView``), and refresh
+tokens replaced by a rotation when ``BLACKLIST_AFTER_ROTATION`` is set (see
+revocation.py).
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils.functional import cached_property
+
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer as BaseTokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer as BaseTokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+from .revocation import revocations
+
+# Claims a TokenUser is built from, besides the user id
+USER_CLAIMS = ("username", "is_staff")
+
+
+class TokenObtainPairSerializer(BaseTokenObtainPairSerializer):
+    """Token pair serializer adding the claims of ``USER_CLAIMS`` (copied to the refreshed access tokens)."""
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token["username"] = user.get_username()
+        token["is_staff"] = user.is_staff
+        return token
+
+
+class TokenRefreshSerializer(BaseTokenRefreshSerializer):
+    """Refresh serializer refusing revoked refresh tokens and revoking the ones replaced by a rotation."""
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        if revocations.is_revoked(refresh):
+            raise InvalidToken({"detail": "Token is revoked"})
+        data = super().validate(attrs)
+        if api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION:
+            revocations.revoke(refresh)
+        return data
+
+
+class TokenRevokeSerializer(serializers.Serializer):
+    refresh = serializers.CharField(write_only=True)
+
+    def validate(self, attrs):
+        revocations.revoke(RefreshToken(attrs["refresh"]))
+        return {}
+
+
+class ClaimsUser(TokenUser):
+    """``TokenUser`` whose id has the type of the user model's primary key (the token holds a string)."""
+
+    @cached_property
+    def id(self):
+        return get_user_model()._meta.pk.to_python(self.token[api_settings.USER_ID_CLAIM])
+
+
+class TokenCache:
+    """Thread-safe LRU of validated tokens, bounded by ``API_AUTH_TOKEN_CACHE_SIZE``."""
+
+    def __init__(self):
+        self.tokens = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            token = self.tokens.get(key)
+            if token is not None:
+                self.tokens.move_to_end(key)
+            return token
+
+    def set(self, key, token):
+        with self.lock:
+            self.tokens[key] = token
+            while len(self.tokens) > settings.API_AUTH_TOKEN_CACHE_SIZE:
+                self.tokens.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.tokens.clear()
+
+    def __len__(self):
+        return len(self.tokens)
+
+
+token_cache = TokenCache()
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """JWT authentication without a user query on read requests (see the module docstring)."""
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        if revocations.is_revoked(validated_token):
+            raise InvalidToken({"detail": "Token is revoked"})
+        if request.method in SAFE_METHODS and all(claim in validated_token for claim in USER_CLAIMS):
+            return ClaimsUser(validated_token), validated_token
+        return self.get_user(validated_token), validated_token
+
+    def get_validated_token(self, raw_token):
+        key = hashlib.sha256(raw_token).digest()
+        token = token_cache.get(key)
+        if token is None:
+            token = super().get_validated_token(raw_token)
+            token_cache.set(key, token)
+            return token
+        try:
+            # The token keeps the time it was decoded at: compare with the current time
+            token.check_exp(current_time=aware_utcnow())
+        except TokenError as exc:
+            raise InvalidToken({"detail": exc.args[0]}) from exc
+        return token
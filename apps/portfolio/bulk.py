@@ -0,0 +1,293 @@
+"""
+Bulk writes on the list endpoints of the portfolio API.
+
+``BulkWriteMixin`` extends the list route of a ModelViewSet (routed by
+``BulkRouter``):
+
+- ``POST`` with a JSON array creates every item;
+- ``PATCH`` with an array of partial objects updates them by ``id``;
+- ``DELETE`` deletes the rows matching the list filters (``?ids=1,2,3``,
+  ``?category=tool``...) and is refused without any filter.
+
+Items are validated in one pass, with one query per uniqueness constraint
+instead of one per item, and nothing is written unless every item is valid.
+Rows are written with ``bulk_create``/``bulk_update`` in a single transaction
+and only the requesting user's rows can be updated or deleted. When a model is
+unique per user (``Skill``: user and name), ``POST`` upserts: an item matching
+an existing row overwrites it.
+
+Bulk writes skip ``save()`` and the post_save signals, so term relations are
+synced and the response cache invalidated here. Images cannot be sent as JSON:
+they stay read-only and are uploaded one item at a time.
+"""
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from rest_framework import serializers, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.routers import DefaultRouter
+from rest_framework.settings import api_settings
+from rest_framework.validators import UniqueTogetherValidator, UniqueValidator
+
+from django_filters.rest_framework import DjangoFilterBackend
+
+from .cache import bump_generation
+from .models import sync_terms_many
+
+LIST_ROUTE = DefaultRouter.routes[0]
+
+
+class BulkRouter(DefaultRouter):
+    """Router sending ``PATCH`` and ``DELETE`` on list routes to ``bulk_update`` and ``bulk_destroy``."""
+
+    routes = [
+        LIST_ROUTE._replace(mapping={**LIST_ROUTE.mapping, "patch": "bulk_update", "delete": "bulk_destroy"}),
+        *DefaultRouter.routes[1:],
+    ]
+
+
+def get_upsert_fields(model, owner_field):
+    """Return the fields of the ``unique_together`` constraint scoping ``model`` per owner, if any."""
+    if model._meta.get_field(owner_field).unique:
+        # One row per owner, like the profiles
+        return [owner_field]
+    for fields in model._meta.unique_together:
+        if owner_field in fields:
+            return list(fields)
+    return None
+
+
+class BulkListSerializer(serializers.ListSerializer):
+    """
+    Validate the items of a bulk write.
+
+    For updates, ``instance`` maps ids to the rows that can be updated and
+    every item must carry the ``id`` of one of them.
+    """
+
+    def __init__(self, *args, owner_field, owner, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.owner_field = owner_field
+        self.owner = owner
+        self.targets = []
+        child = self.child
+        self.model = child.Meta.model
+        # Uniqueness is checked for all the items at once in check_unique()
+        child.validators = [
+            validator for validator in child.validators if not isinstance(validator, UniqueTogetherValidator)
+        ]
+        read_only = {owner_field, *getattr(self.model, "image_fields", {})}
+        for field in child.fields.values():
+            field.validators = [
+                validator for validator in field.validators if not isinstance(validator, UniqueValidator)
+            ]
+            if field.source in read_only:
+                field.read_only = True
+
+    def to_internal_value(self, data):
+        if self.instance is not None and isinstance(data, list):
+            self.check_ids(data)
+            self.targets = [self.instance[item["id"]] for item in data]
+        validated = super().to_internal_value(data)
+        self.check_unique(validated)
+        return validated
+
+    def run_child_validation(self, data):
+        if self.instance is not None:
+            self.child.instance = self.instance[data["id"]]
+        return super().run_child_validation(data)
+
+    def check_ids(self, data):
+        errors = []
+        seen = set()
+        for item in data:
+            pk = item.get("id") if isinstance(item, dict) else None
+            if pk not in self.instance:
+                errors.append({"id": ["Not found."]})
+            elif pk in seen:
+                errors.append({"id": ["This item is updated more than once."]})
+            else:
+                errors.append({})
+            seen.add(pk)
+        if any(errors):
+            raise ValidationError(errors)
+
+    def check_unique(self, validated):
+        """Check the unique fields and per-owner constraints of all the items with one query each."""
+        errors = [{} for _ in validated]
+        targets = self.targets or [None] * len(validated)
+        meta = self.model._meta
+
+        for field in meta.concrete_fields:
+            if not field.unique or field.primary_key or field.name == self.owner_field:
+                continue
+            values = {index: attrs[field.name] for index, attrs in enumerate(validated) if field.name in attrs}
+            if not values:
+                continue
+            existing = dict(
+                self.model._default_manager.filter(**{f"{field.name}__in": values.values()}).values_list(
+                    field.name, "pk"
+                )
+            )
+            message = f"{meta.verbose_name} with this {field.verbose_name} already exists."
+            seen = set()
+            for index, value in values.items():
+                target_pk = targets[index].pk if targets[index] else None
+                if value in seen or existing.get(value, target_pk) != target_pk:
+                    errors[index].setdefault(field.name, []).append(message)
+                seen.add(value)
+
+        upsert_fields = get_upsert_fields(self.model, self.owner_field)
+        if upsert_fields:
+            key_fields = [name for name in upsert_fields if name != self.owner_field]
+            keys = [
+                tuple(attrs[name] if name in attrs else getattr(target, name, None) for name in key_fields)
+                for attrs, target in zip(validated, targets)
+            ]
+            message = f"The fields {', '.join(upsert_fields)} must make a unique set."
+            existing = {}
+            if self.targets:
+                lookups = {f"{name}__in": {key[i] for key in keys} for i, name in enumerate(key_fields)}
+                rows = self.model._default_manager.filter(**{self.owner_field: self.owner}, **lookups)
+                existing = {tuple(key): pk for pk, *key in rows.values_list("pk", *key_fields)}
+            seen = set()
+            for index, key in enumerate(keys):
+                target_pk = targets[index].pk if targets[index] else None
+                # New items matching an existing row update it
+                if key in seen or (self.targets and existing.get(key, target_pk) != target_pk):
+                    errors[index].setdefault(api_settings.NON_FIELD_ERRORS_KEY, []).append(message)
+                seen.add(key)
+
+        if any(errors):
+            raise ValidationError(errors)
+
+
+def sync_bulk_terms(model, objs, fields=None):
+    """Rebuild the term relations of ``objs`` whose source field is in ``fields`` (all if None)."""
+    for source_field, relation_name in getattr(model, "term_fields", {}).items():
+        if fields is None or source_field in fields:
+            sync_terms_many(objs, source_field, relation_name)
+
+
+def bulk_create_items(serializer):
+    """
+    Insert the validated items of a ``BulkListSerializer`` for its owner and return the rows.
+
+    Items matching an existing row of a model unique per owner update it. The
+    caller runs this in a transaction and invalidates the response cache.
+    """
+    model = serializer.model
+    objs = [model(**attrs, **{serializer.owner_field: serializer.owner}) for attrs in serializer.validated_data]
+    upsert_fields = get_upsert_fields(model, serializer.owner_field)
+    if upsert_fields:
+        writable = {field.source for field in serializer.child._writable_fields}
+        model._default_manager.bulk_create(
+            objs,
+            update_conflicts=True,
+            unique_fields=upsert_fields,
+            update_fields=sorted(writable - set(upsert_fields) | {"updated_at"}),
+        )
+    else:
+        model._default_manager.bulk_create(objs)
+    sync_bulk_terms(model, objs)
+    return objs
+
+
+class BulkWriteMixin:
+    """Bulk create, update and delete on the list route of a ModelViewSet (see the module docstring)."""
+
+    # Field holding the user owning a row
+    owner_field = "user"
+    # Rate limits of the bulk routes (see throttling.py)
+    throttle_scopes = {"bulk_create": "bulk", "bulk_update": "bulk", "bulk_destroy": "bulk"}
+
+    def get_throttle_action(self):
+        """Name the action for the throttles: bulk creates share the ``create`` action with single creates."""
+        if self.action == "create" and isinstance(self.request.data, list):
+            return "bulk_create"
+        return self.action
+
+    def get_bulk_queryset(self):
+        """Return the rows the requesting user can update or delete."""
+        return self.queryset.model._default_manager.filter(**{self.owner_field: self.request.user})
+
+    def get_bulk_serializer(self, data, instance=None, partial=False):
+        context = self.get_serializer_context()
+        return BulkListSerializer(
+            instance,
+            data=data,
+            child=self.get_serializer_class()(context=context, partial=partial),
+            context=context,
+            partial=partial,
+            owner_field=self.owner_field,
+            owner=self.request.user,
+            allow_empty=False,
+            max_length=settings.API_BULK_MAX_ITEMS,
+        )
+
+    def get_bulk_response(self, objs, status_code):
+        """Serialize the written rows, reloaded with the prefetches of the viewset."""
+        rows = self.get_queryset().in_bulk([obj.pk for obj in objs])
+        serializer = self.get_serializer([rows[obj.pk] for obj in objs], many=True)
+        return Response(serializer.data, status=status_code)
+
+    def create(self, request, *args, **kwargs):
+        if not isinstance(request.data, list):
+            return super().create(request, *args, **kwargs)
+
+        serializer = self.get_bulk_serializer(request.data)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            objs = bulk_create_items(serializer)
+        bump_generation(serializer.model)
+        return self.get_bulk_response(objs, status.HTTP_201_CREATED)
+
+    def bulk_update(self, request, *args, **kwargs):
+        """Partially update several rows, identified by the ``id`` of each item."""
+        ids = []
+        if isinstance(request.data, list):
+            ids = [item["id"] for item in request.data if isinstance(item, dict) and isinstance(item.get("id"), int)]
+        serializer = self.get_bulk_serializer(
+            request.data, instance=self.get_bulk_queryset().in_bulk(ids), partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+
+        now = timezone.now()
+        fields = {"updated_at"}
+        for obj, attrs in zip(serializer.targets, serializer.validated_data):
+            for name, value in attrs.items():
+                setattr(obj, name, value)
+            obj.updated_at = now
+            fields.update(attrs)
+
+        model = serializer.model
+        with transaction.atomic():
+            model._default_manager.bulk_update(serializer.targets, sorted(fields))
+            sync_bulk_terms(model, serializer.targets, fields)
+        bump_generation(model)
+        return self.get_bulk_response(serializer.targets, status.HTTP_200_OK)
+
+    def bulk_destroy(self, request, *args, **kwargs):
+        """Delete the requesting user's rows matching the filters of the query string."""
+        queryset = self.get_bulk_queryset()
+        filterset_class = DjangoFilterBackend().get_filterset_class(self, queryset)
+        allowed = {"ids", api_settings.SEARCH_PARAM, *(filterset_class.base_filters if filterset_class else ())}
+        params = set(request.query_params) - {api_settings.URL_FORMAT_OVERRIDE}
+        if not params:
+            raise ValidationError({"detail": "Bulk deletion requires at least one filter."})
+        if params - allowed:
+            raise ValidationError({"detail": f"Unknown filters: {', '.join(sorted(params - allowed))}."})
+
+        ids = request.query_params.get("ids")
+        if ids is not None:
+            values = ids.split(",")
+            if not all(value.isdigit() for value in values):
+                raise ValidationError({"ids": "A comma-separated list of ids is required."})
+            queryset = queryset.filter(pk__in=values)
+
+        # Deleted rows invalidate the response cache through the post_delete signal
+        _, deleted = self.filter_queryset(queryset).delete()
+        return Response({"deleted": deleted.get(queryset.model._meta.label, 0)})
@@ -0,0 +1,162 @@
+"""
+Versioned read-through response cache for the portfolio API.
+
+Rendered responses are stored under a key built from the request URL, the
+authentication state, the negotiated renderer and the current generation of
+every model the view depends on. Writes bump the generation of the affected
+model (see ``signals.py``), so entries built from stale data are never looked
+up again and simply age out of the cache.
+
+Compressible responses are stored with their compressed content in every
+supported encoding (see compression.py), so hits are served pre-compressed.
+"""
+
+import hashlib
+import time
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+from .compression import compress_all, compress_response, is_compressible
+from .metrics import CACHE_REQUESTS
+
+GENERATION_KEY = "portfolio:gen:{}"
+RESPONSE_KEY = "portfolio:response:{}"
+
+# Response headers stored along with the cached content
+VALIDATOR_HEADERS = ("ETag", "Last-Modified")
+
+
+def get_cache():
+    """Return the cache backend used for API responses."""
+    return caches[settings.API_CACHE_ALIAS]
+
+
+def generation_key(model):
+    return GENERATION_KEY.format(model._meta.label_lower)
+
+
+def get_generations(models):
+    """Return the current generation counter of each model."""
+    cache = get_cache()
+    keys = [generation_key(model) for model in models]
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            # Seed missing counters from the clock so that an evicted counter
+            # never rewinds to a value older entries were stored under.
+            cache.add(key, time.time_ns(), timeout=None)
+            generations[key] = cache.get(key)
+    return [generations[key] for key in keys]
+
+
+def bump_generation(model):
+    """Invalidate every cached response that depends on ``model``."""
+    cache = get_cache()
+    key = generation_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def incr_counter(cache, key, delta=1):
+    """Atomically increment ``key``, creating it if needed, and return the new value."""
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        if cache.add(key, delta, timeout=None):
+            return delta
+        return cache.incr(key, delta)
+
+
+def build_response_key(request, models):
+    """Build the cache key of a GET request against views depending on ``models``."""
+    user = request.user
+    auth_state = f"user:{user.pk}" if user.is_authenticated else "anonymous"
+    renderer = getattr(request, "accepted_renderer", None)
+    parts = [
+        request.scheme,
+        request.get_host(),
+        request.path,
+        urlencode(sorted(request.query_params.lists()), doseq=True),
+        auth_state,
+        renderer.format if renderer else "",
+        *get_generations(models),
+    ]
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode(), usedforsecurity=False).hexdigest()
+    return RESPONSE_KEY.format(digest)
+
+
+def cache_response(view_method):
+    """
+    Serve a read-only viewset handler from the response cache.
+
+    The decorated view must expose ``cache_dependencies``, the models whose
+    writes invalidate its responses. Only successful responses are stored,
+    with their validators so that hits can be answered with a 304.
+    """
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        if not settings.API_CACHE_ENABLED:
+            return view_method(self, request, *args, **kwargs)
+
+        cache = get_cache()
+        key = build_response_key(request, self.cache_dependencies)
+        cached = cache.get(key)
+        CACHE_REQUESTS.labels(result="miss" if cached is None else "hit").inc()
+        if cached is not None:
+            response = HttpResponse(cached["content"], status=cached["status"], content_type=cached["content_type"])
+            for header, value in cached.get("headers", {}).items():
+                response[header] = value
+            response["X-Cache"] = "HIT"
+            if "compressed" in cached and settings.API_COMPRESSION_ENABLED:
+                compress_response(request, response, cached["compressed"])
+            if "ETag" in response:
+                # Answer conditional requests from the stored validators
+                last_modified = parse_http_date_safe(response.get("Last-Modified", ""))
+                return get_conditional_response(request, response["ETag"], last_modified, response)
+            return response
+
+        response = view_method(self, request, *args, **kwargs)
+        if response.status_code == 200:
+            response["X-Cache"] = "MISS"
+
+            def store(rendered):
+                entry = {
+                    "content": rendered.content,
+                    "status": rendered.status_code,
+                    "content_type": rendered["Content-Type"],
+                    "headers": {header: rendered[header] for header in VALIDATOR_HEADERS if header in rendered},
+                }
+                if is_compressible(rendered):
+                    entry["compressed"] = compress_all(rendered.content)
+                cache.set(key, entry, settings.API_CACHE_TIMEOUT)
+                if "compressed" in entry:
+                    # Reuse the stored bytes instead of compressing again in CompressionMiddleware
+                    compress_response(request, rendered, entry["compressed"])
+
+            response.add_post_render_callback(store)
+        return response
+
+    return wrapper
+
+
+class CachedResponseMixin:
+    """Cache ``list`` and ``retrieve`` responses of a ModelViewSet."""
+
+    cache_dependencies = ()
+
+    @cache_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
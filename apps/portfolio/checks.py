@@ -0,0 +1,72 @@
+"""
+System checks of the portfolio settings.
+
+They run with every management command, including the ``migrate`` of the
+container entrypoint, so a deployment that cannot work as configured is
+reported before gunicorn starts.
+"""
+
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
+from django.utils.module_loading import import_string
+
+# Cache backends private to one process: gunicorn workers and management
+# commands do not see each other's entries
+LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def shared_cache_features():
+    """Return ``(feature, cache alias)`` for the enabled features that need a cache shared by every process."""
+    features = [
+        ("Buffered view counters", settings.VIEW_COUNTER_CACHE_ALIAS),
+        ("JWT revocation", settings.API_AUTH_REVOCATION_CACHE_ALIAS),
+    ]
+    if settings.API_CACHE_ENABLED:
+        features.append(("The response cache", settings.API_CACHE_ALIAS))
+    if settings.API_THROTTLE_ENABLED:
+        features.append(("Rate limiting", settings.API_THROTTLE_CACHE_ALIAS))
+    return features
+
+
+@register(Tags.caches)
+def check_shared_caches(app_configs, **kwargs):
+    """Report the features relying on a per-process cache (an error in production)."""
+    level = Warning if settings.DEBUG else Error
+    messages = []
+    for feature, alias in shared_cache_features():
+        backend = settings.CACHES[alias]["BACKEND"]
+        if backend in LOCAL_CACHE_BACKENDS:
+            messages.append(
+                level(
+                    f"{feature} uses the {alias!r} cache, which is local to each process ({backend}).",
+                    hint=(
+                        "Set CACHE_URL to a cache shared by the workers, e.g. redis://redis:6379/1: with a "
+                        "per-process cache, each gunicorn worker and management command only sees its own entries."
+                    ),
+                    id="portfolio.E001" if level is Error else "portfolio.W001",
+                )
+            )
+    return messages
+
+
+@register()
+def check_async_middleware(app_configs, **kwargs):
+    """Report the middleware that are not async-capable, which make Django adapt every ASGI request."""
+    messages = []
+    for path in settings.MIDDLEWARE:
+        if not getattr(import_string(path), "async_capable", False):
+            messages.append(
+                Warning(
+                    f"{path} is not async-capable.",
+                    hint=(
+                        "Under ASGI, Django runs the middleware chain around it in a thread, for every request: "
+                        "use an async-capable middleware or move the feature out of Django (static files are "
+                        "served by nginx)."
+                    ),
+                    id="portfolio.W002",
+                )
+            )
+    return messages
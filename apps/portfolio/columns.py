@@ -0,0 +1,107 @@
+"""
+Column pruning for list endpoints.
+
+List pages render a handful of fields but the default querysets load every
+column of the row (long TEXT bodies, the search vector) plus every column of
+the ``select_related`` tables. ``get_serializer_columns`` derives from the
+serializer's readable fields the columns and joins it actually reads, so list
+querysets can be narrowed with ``.only()`` and stripped of unused joins.
+
+Fields whose source is a property or method cannot be analysed; serializers
+declare what they read in ``Meta.column_dependencies`` (an empty list for
+values coming from prefetched relations), otherwise no pruning is done.
+"""
+
+import re
+
+from django.core.exceptions import FieldDoesNotExist
+
+from rest_framework import serializers
+
+DISPLAY_METHOD = re.compile(r"^get_(\w+)_display$")
+
+
+def get_source_columns(model, field):
+    """
+    Return ``(column, relations)`` read by a serializer field, or None if unknown.
+
+    ``column`` is a lookup path usable with ``.only()`` and ``relations`` the
+    forward relations it crosses, to be joined with ``.select_related()``.
+    """
+    if field.source == "*":
+        return None
+    relations, prefix = [], ""
+    for position, attr in enumerate(field.source_attrs):
+        last = position == len(field.source_attrs) - 1
+        try:
+            model_field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            # get_FOO_display() only reads the FOO column
+            match = DISPLAY_METHOD.match(attr)
+            if last and match and not isinstance(getattr(model, attr, None), property):
+                try:
+                    return prefix + model._meta.get_field(match.group(1)).name, relations
+                except FieldDoesNotExist:
+                    return None
+            return None
+
+        if model_field.concrete and not model_field.is_relation:
+            return (prefix + attr, relations) if last else None
+        if not model_field.concrete or not (model_field.many_to_one or model_field.one_to_one):
+            return None
+        if last:
+            # Only the foreign key column is needed to render a primary key
+            if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None:
+                return prefix + attr, relations
+            return None
+        prefix += f"{attr}__"
+        relations.append(prefix[:-2])
+        model = model_field.related_model
+    return None
+
+
+def get_serializer_columns(serializer):
+    """Return ``(columns, relations)`` read by ``serializer``, or None if they cannot be determined."""
+    model = serializer.Meta.model
+    dependencies = getattr(serializer.Meta, "column_dependencies", {})
+    columns, relations = {model._meta.pk.name}, set()
+    for field in serializer._readable_fields:
+        if field.field_name in dependencies:
+            columns.update(dependencies[field.field_name])
+            continue
+        source = get_source_columns(model, field)
+        if source is None:
+            return None
+        columns.add(source[0])
+        relations.update(source[1])
+    return columns, relations
+
+
+def prune_columns(queryset, serializer):
+    """Restrict ``queryset`` to the columns and joins ``serializer`` reads."""
+    read = get_serializer_columns(serializer)
+    if read is None:
+        return queryset
+    columns, relations = read
+
+    # Ordering values are read back by keyset pagination
+    for name in queryset.query.order_by or queryset.model._meta.ordering:
+        if isinstance(name, str):
+            name = name.lstrip("-")
+            if name not in queryset.query.annotations and name not in ("pk", "?") and "__" not in name:
+                columns.add(name)
+
+    queryset = queryset.select_related(None)
+    if relations:
+        queryset = queryset.select_related(*relations)
+    return queryset.only(*columns)
+
+
+class ColumnPruningMixin:
+    """Load only the columns read by the list serializer on ``list`` actions."""
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action != "list":
+            return queryset
+        return prune_columns(queryset, self.get_serializer())
@@ -0,0 +1,130 @@
+"""
+Compiled read-only representation for list serializers.
+
+DRF's ``Serializer.to_representation`` resolves every field of every row
+through generic machinery (source traversal with callable checks, SkipField
+handling, per-field ``to_representation``). For flat read-only serializers
+used on list pages, ``compile_representation`` generates once per serializer
+instance a Python function equivalent to that loop for the declared fields,
+e.g. ``{"id": int(instance.id), "author_name": str(instance.author.username)}``.
+
+Fields the compiler cannot prove equivalent (related or nested fields,
+method fields, sources crossing nullable relations...) keep going through
+DRF's own ``get_attribute``/``to_representation``.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+
+# Builtins behaving exactly like a DRF to_representation (None: returns the value as is)
+BUILTIN_CONVERTERS = {
+    serializers.ReadOnlyField.to_representation: None,
+    serializers.CharField.to_representation: "str",
+    serializers.IntegerField.to_representation: "int",
+}
+
+
+def resolve_source(model, source_attrs):
+    """
+    Return the Python expression reading ``source_attrs`` from ``instance``.
+
+    Returns None if the path cannot be read with plain attribute access while
+    keeping DRF semantics: every hop must be a non-nullable forward relation,
+    and the last attribute a concrete field, a property or a method (called).
+    """
+    expression = "instance"
+    for position, attr in enumerate(source_attrs):
+        if not attr.isidentifier():
+            return None
+        last = position == len(source_attrs) - 1
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            field = None
+
+        if field is not None and field.concrete and not field.is_relation:
+            if not last:
+                return None
+            return f"{expression}.{attr}"
+        if field is not None:
+            if last or not (field.many_to_one or field.one_to_one) or field.null or not field.concrete:
+                return None
+            expression = f"{expression}.{attr}"
+            model = field.related_model
+            continue
+        if not last:
+            return None
+
+        descriptor = getattr(model, attr, None)
+        if isinstance(descriptor, property):
+            return f"{expression}.{attr}"
+        if callable(descriptor):
+            return f"{expression}.{attr}()"
+        return None
+    return None
+
+
+def get_converter(field):
+    """Return the builtin replacing ``field.to_representation``, None for identity, False if there is none."""
+    return BUILTIN_CONVERTERS.get(type(field).to_representation, False)
+
+
+def compile_representation(serializer):
+    """Generate a function turning a model instance into the representation of ``serializer``."""
+    model = serializer.Meta.model
+    namespace = {"SkipField": SkipField, "PKOnlyObject": serializers.PKOnlyObject}
+    lines = ["def to_representation(instance):", "    ret = {}"]
+
+    for index, field in enumerate(serializer._readable_fields):
+        name = repr(field.field_name)
+        source = None
+        if not isinstance(
+            field, (serializers.RelatedField, serializers.BaseSerializer, serializers.SerializerMethodField)
+        ):
+            source = resolve_source(model, field.source_attrs) if field.source != "*" else None
+
+        if source is None:
+            # Fall back to DRF's own resolution for this field
+            namespace[f"field_{index}"] = field
+            lines += [
+                "    try:",
+                f"        value = field_{index}.get_attribute(instance)",
+                "    except SkipField:",
+                "        pass",
+                "    else:",
+                "        check = value.pk if isinstance(value, PKOnlyObject) else value",
+                f"        ret[{name}] = None if check is None else field_{index}.to_representation(value)",
+            ]
+            continue
+
+        converter = get_converter(field)
+        if converter is None:
+            lines.append(f"    ret[{name}] = {source}")
+            continue
+        if converter is False:
+            namespace[f"convert_{index}"] = field.to_representation
+            converter = f"convert_{index}"
+        lines.append(f"    value = {source}")
+        lines.append(f"    ret[{name}] = None if value is None else {converter}(value)")
+
+    lines.append("    return ret")
+    exec("\n".join(lines), namespace)
+    return namespace["to_representation"]
+
+
+class CompiledRepresentationMixin:
+    """
+    Serialize instances through a function compiled from the declared fields.
+
+    The function is compiled on first use and reused for every row handled by
+    the same serializer instance (the child of a ``many=True`` serializer).
+    """
+
+    def to_representation(self, instance):
+        try:
+            compiled = self._compiled_representation
+        except AttributeError:
+            compiled = self._compiled_representation = compile_representation(self)
+        return compiled(instance)
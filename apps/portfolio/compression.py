@@ -0,0 +1,145 @@
+"""
+Compression of JSON responses, negotiated with ``Accept-Encoding``.
+
+``CompressionMiddleware`` encodes JSON responses of at least
+``API_COMPRESSION_MIN_SIZE`` bytes with Brotli (when the ``brotli`` package
+is installed) or gzip, whichever the client prefers (Brotli on ties), and
+adds ``Vary: Accept-Encoding``. Streaming responses (exports) and responses
+that already have a ``Content-Encoding`` are left as they are.
+
+The response cache (cache.py) stores the compressed bytes of every encoding
+along with the rendered content when it stores a response, so cache hits are
+served pre-compressed without compressing anything: the middleware only
+compresses responses that were not served from the cache.
+
+Strong ETags are weakened on compressed responses, as Django's
+``GZipMiddleware`` does: the encoded body is not byte-identical to the
+representation they validate.
+"""
+
+import gzip
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Supported encodings, in order of preference
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+CONTENT_TYPES = ("application/json",)
+
+
+@lru_cache(maxsize=128)
+def negotiate(accept_encoding):
+    """Return the supported encoding ``accept_encoding`` prefers, or None for identity."""
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def get_encoding(request):
+    return negotiate(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+
+
+def compress(content, encoding):
+    if encoding == "br":
+        return brotli.compress(content, mode=brotli.MODE_TEXT, quality=settings.API_COMPRESSION_BROTLI_QUALITY)
+    # mtime=0: the same content always compresses to the same bytes
+    return gzip.compress(content, compresslevel=settings.API_COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def compress_all(content):
+    """Return ``{encoding: compressed content}`` for the supported encodings that make ``content`` smaller."""
+    compressed = {encoding: compress(content, encoding) for encoding in ENCODINGS}
+    return {encoding: value for encoding, value in compressed.items() if len(value) < len(content)}
+
+
+def is_compressible(response):
+    return (
+        settings.API_COMPRESSION_ENABLED
+        and not response.streaming
+        and not response.has_header("Content-Encoding")
+        and response.get("Content-Type", "").startswith(CONTENT_TYPES)
+        and len(response.content) >= settings.API_COMPRESSION_MIN_SIZE
+    )
+
+
+def compress_response(request, response, compressed=None):
+    """
+    Encode ``response`` in the encoding ``request`` prefers.
+
+    ``compressed`` maps encodings to the compressed content when it is known
+    (cached responses): other encodings are then not used.
+    """
+    patch_vary_headers(response, ("Accept-Encoding",))
+    encoding = get_encoding(request)
+    if encoding is None:
+        return
+    if compressed is None:
+        content = compress(response.content, encoding)
+        if len(content) >= len(response.content):
+            return
+    else:
+        content = compressed.get(encoding)
+        if content is None:
+            return
+
+    response.content = content
+    response["Content-Encoding"] = encoding
+    response["Content-Length"] = str(len(content))
+    etag = response.get("ETag")
+    if etag and etag.startswith('"'):
+        response["ETag"] = f"W/{etag}"
+
+
+class CompressionMiddleware:
+    """Compress the JSON responses not compressed by the response cache (works under WSGI and ASGI)."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        response = self.get_response(request)
+        if is_compressible(response):
+            compress_response(request, response)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if is_compressible(response):
+            compress_response(request, response)
+        return response
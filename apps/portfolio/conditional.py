@@ -0,0 +1,97 @@
+"""
+Conditional GET support (ETag / Last-Modified) for the portfolio API.
+
+Validators are computed before the view runs, from a single cheap query:
+``MAX(updated_at)`` and ``COUNT(*)`` over the filtered queryset for lists, the
+row's ``updated_at`` for details. The ETag also covers the request URL, the
+negotiated renderer and the cache generations of the view's dependencies, which
+move on writes that do not touch ``updated_at`` (buffered view counters,
+related users). Matching ``If-None-Match``/``If-Modified-Since`` requests get
+a ``304 Not Modified`` without any serialization.
+
+Lists only carry an ETag: ``MAX(updated_at)`` does not move on deletes, view
+counter flushes or changes to related rows, so a ``Last-Modified`` date would
+let ``If-Modified-Since`` clients keep a stale list.
+"""
+
+import hashlib
+
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .cache import get_generations
+
+
+def build_etag(request, last_modified, *parts):
+    """Build a weak ETag from the request and the state of the data it renders."""
+    renderer = getattr(request, "accepted_renderer", None)
+    values = [
+        request.get_full_path(),
+        renderer.format if renderer else "",
+        last_modified.isoformat() if last_modified else "",
+        *parts,
+    ]
+    digest = hashlib.md5("|".join(str(value) for value in values).encode(), usedforsecurity=False).hexdigest()
+    return f"W/{quote_etag(digest)}"
+
+
+def conditional_response(request, view_method, etag, last_modified, *args, **kwargs):
+    """Return a 304 if the request validators match, otherwise the view response with validators."""
+    validators = HttpResponse()
+    validators["ETag"] = etag
+    if last_modified is not None:
+        validators["Last-Modified"] = http_date(last_modified.timestamp())
+
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+        response=validators,
+    )
+    if response is not validators:
+        return response
+
+    response = view_method(request, *args, **kwargs)
+    if response.status_code == 200:
+        for header in ("ETag", "Last-Modified"):
+            if header in validators:
+                response[header] = validators[header]
+    return response
+
+
+class ConditionalResponseMixin:
+    """
+    Answer conditional ``list`` and ``retrieve`` requests of a ModelViewSet.
+
+    Placed after CachedResponseMixin: cache hits are answered from the stored
+    validators without any query, misses run the validator query first.
+    """
+
+    last_modified_field = "updated_at"
+
+    def list(self, request, *args, **kwargs):
+        # Keyset pages exist to avoid scanning the whole table
+        uses_keyset = getattr(self.paginator, "uses_keyset", None)
+        if uses_keyset is not None and uses_keyset(request):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset()).order_by()
+        state = queryset.aggregate(last_modified=Max(self.last_modified_field), count=Count("pk"))
+        generations = get_generations(getattr(self, "cache_dependencies", ()))
+        etag = build_etag(request, state["last_modified"], state["count"], *generations)
+        return conditional_response(request, super().list, etag, None, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+        rows = list(queryset.values_list("pk", self.last_modified_field)[:1])
+        if not rows:
+            # Let the view raise its usual 404
+            return super().retrieve(request, *args, **kwargs)
+
+        pk, last_modified = rows[0]
+        generations = get_generations(getattr(self, "cache_dependencies", ()))
+        etag = build_etag(request, last_modified, pk, *generations)
+        return conditional_response(request, super().retrieve, etag, last_modified, *args, **kwargs)
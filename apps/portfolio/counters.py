@@ -0,0 +1,132 @@
+"""
+Buffered view counters for blog posts.
+
+Views are accumulated in the cache with atomic increments instead of issuing
+one UPDATE per hit. Every post with pending views is registered once in a
+numbered slot, and ``flush()`` drains those slots into a single
+``UPDATE ... SET views_count = views_count + CASE ...`` statement. When the
+cache is shared (Redis), all gunicorn workers buffer into the same counters.
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Case, F, Value, When
+
+from .cache import bump_generation, get_generations, incr_counter
+from .models import BlogPost
+
+PENDING_KEY = "portfolio:views:pending:{}"
+POST_KEY = "portfolio:views:post:{}:{}"
+SLOT_KEY = "portfolio:views:slot:{}"
+SLOTS_KEY = "portfolio:views:slots"
+FLUSHED_KEY = "portfolio:views:flushed"
+FLUSH_LOCK_KEY = "portfolio:views:flush-lock"
+FLUSH_INTERVAL_KEY = "portfolio:views:flush-interval"
+
+
+def get_counter_cache():
+    """Return the cache backend holding pending view counts."""
+    return caches[settings.VIEW_COUNTER_CACHE_ALIAS]
+
+
+def _register(cache, post_id):
+    """Record that ``post_id`` has pending views to flush."""
+    slot = incr_counter(cache, SLOTS_KEY)
+    cache.set(SLOT_KEY.format(slot), post_id, timeout=None)
+
+
+def lookup_post(slug):
+    """
+    Return the id, status and stored views count of the post with ``slug``.
+
+    The lookup is cached for the current BlogPost generation, so repeated hits
+    on a popular post do not touch the database.
+    """
+    cache = get_counter_cache()
+    (generation,) = get_generations([BlogPost])
+    key = POST_KEY.format(generation, slug)
+    post = cache.get(key)
+    if post is None:
+        post = BlogPost.objects.filter(slug=slug).values("id", "status", "views_count").first()
+        if post is None:
+            return None
+        cache.set(key, post, settings.API_CACHE_TIMEOUT)
+    return post
+
+
+def increment(post_id, amount=1):
+    """Buffer ``amount`` views for ``post_id`` and return its pending count."""
+    cache = get_counter_cache()
+    pending = incr_counter(cache, PENDING_KEY.format(post_id), amount)
+    if pending == amount:
+        _register(cache, post_id)
+    return pending
+
+
+def get_pending(post_id):
+    """Return the number of views buffered for ``post_id``."""
+    return get_counter_cache().get(PENDING_KEY.format(post_id), 0)
+
+
+def flush():
+    """
+    Write all buffered views to the database.
+
+    Returns a mapping of post id to the number of views flushed. Concurrent
+    flushes are serialized with a cache lock; a flush that cannot take the
+    lock does nothing.
+    """
+    cache = get_counter_cache()
+    if not cache.add(FLUSH_LOCK_KEY, 1, timeout=60):
+        return {}
+
+    try:
+        last = cache.get(FLUSHED_KEY, 0)
+        current = cache.get(SLOTS_KEY, 0)
+        if current < last:
+            # The slot counter was evicted and restarted
+            last = 0
+        if current == last:
+            return {}
+
+        slot_keys = [SLOT_KEY.format(slot) for slot in range(last + 1, current + 1)]
+        post_ids = set(cache.get_many(slot_keys).values())
+        pending = cache.get_many([PENDING_KEY.format(post_id) for post_id in post_ids])
+        counts = {}
+        for post_id in post_ids:
+            count = pending.get(PENDING_KEY.format(post_id), 0)
+            if count > 0:
+                counts[post_id] = count
+
+        if counts:
+            BlogPost.objects.filter(pk__in=counts).update(
+                views_count=F("views_count")
+                + Case(*[When(pk=post_id, then=Value(count)) for post_id, count in counts.items()], default=Value(0))
+            )
+        # Marked as flushed before anything else can fail, so the slots written
+        # above are never applied twice
+        cache.set(FLUSHED_KEY, current, timeout=None)
+        cache.delete_many(slot_keys)
+
+        if counts:
+            for post_id, count in counts.items():
+                try:
+                    remaining = cache.decr(PENDING_KEY.format(post_id), count)
+                except ValueError:
+                    # Evicted or expired since it was read: nothing left to flush
+                    continue
+                if remaining > 0:
+                    # Views arrived while flushing; make sure they are picked up next time
+                    _register(cache, post_id)
+            bump_generation(BlogPost)
+        return counts
+    finally:
+        cache.delete(FLUSH_LOCK_KEY)
+
+
+def maybe_flush():
+    """Flush buffered views if ``VIEW_COUNTER_FLUSH_INTERVAL`` has elapsed since the last flush."""
+    interval = settings.VIEW_COUNTER_FLUSH_INTERVAL
+    if interval and get_counter_cache().add(FLUSH_INTERVAL_KEY, 1, timeout=interval):
+        return flush()
+    return {}
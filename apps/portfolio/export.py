@@ -0,0 +1,68 @@
+"""
+Streaming exports of the portfolio ViewSets.
+
+``ExportMixin`` adds a ``GET <list>/export/`` action returning every row
+matching the list filters, search and ordering in one response, as NDJSON
+(default, ``?format=ndjson``) or CSV (``?format=csv``). Rows are read with
+``.iterator(chunk_size=API_EXPORT_CHUNK_SIZE)`` — a server-side cursor on
+PostgreSQL, with the prefetches run per chunk — and serialized chunk by chunk
+into a ``StreamingHttpResponse``, so memory stays constant whatever the number
+of rows.
+
+Under ASGI the chunks are produced in the request's thread through an async
+iterator: Django would otherwise load a synchronous iterator whole before
+sending it.
+"""
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+
+from rest_framework.decorators import action
+
+from asgiref.sync import sync_to_async
+
+from .renderers import CSVRenderer, NDJSONRenderer
+
+
+def stream_rows(queryset, serializer, renderer, chunk_size):
+    """Yield the rendered rows of ``queryset``, ``chunk_size`` rows at a time."""
+    fields = [name for name, field in serializer.fields.items() if not field.write_only]
+    header = renderer.render_header(fields)
+    if header:
+        yield header
+    chunk = []
+    for instance in queryset.iterator(chunk_size=chunk_size):
+        chunk.append(serializer.to_representation(instance))
+        if len(chunk) == chunk_size:
+            yield renderer.render_rows(chunk, fields)
+            chunk = []
+    if chunk:
+        yield renderer.render_rows(chunk, fields)
+
+
+async def iterate_async(chunks):
+    """Consume the synchronous iterator ``chunks`` in the request's thread, where its cursor lives."""
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    while (chunk := await next_chunk(chunks, None)) is not None:
+        yield chunk
+
+
+class ExportMixin:
+    """Stream the filtered list of a ViewSet as NDJSON or CSV (see the module docstring)."""
+
+    # Rate limit scope, set per action with @action(throttle_scope=...) (see throttling.py)
+    throttle_scope = None
+
+    @action(detail=False, methods=["get"], renderer_classes=[NDJSONRenderer, CSVRenderer], throttle_scope="export")
+    def export(self, request, *args, **kwargs):
+        """Export every row matching the list filters as NDJSON or CSV."""
+        queryset = self.filter_queryset(self.get_queryset())
+        renderer = request.accepted_renderer
+        chunks = stream_rows(queryset, self.get_serializer(), renderer, settings.API_EXPORT_CHUNK_SIZE)
+        if isinstance(request._request, ASGIRequest):
+            chunks = iterate_async(chunks)
+
+        response = StreamingHttpResponse(chunks, content_type=f"{renderer.media_type}; charset={renderer.charset}")
+        response["Content-Disposition"] = f'attachment; filename="{self.basename}.{renderer.format}"'
+        return response
@@ -0,0 +1,77 @@
+"""
+Filters for portfolio app.
+"""
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import F
+
+from rest_framework.filters import SearchFilter
+
+from django_filters import rest_framework as filters
+
+from .models import BlogPost, Experience, Project, normalize_term
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    Drop-in replacement for SearchFilter backed by PostgreSQL full-text search.
+
+    Views declaring ``search_vector_field`` are searched through that stored,
+    GIN-indexed tsvector and ordered by ``ts_rank`` (an explicit ``?ordering=``
+    still wins, as OrderingFilter runs afterwards). Other views, and every view
+    on databases other than PostgreSQL, use the regular ``search_fields`` lookups.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        vector_field = getattr(view, "search_vector_field", None)
+        if not vector_field or connection.vendor != "postgresql":
+            return super().filter_queryset(request, queryset, view)
+
+        terms = " ".join(self.get_search_terms(request))
+        if not terms:
+            return queryset
+
+        query = SearchQuery(terms, search_type="websearch", config=settings.FULL_TEXT_SEARCH_CONFIG)
+        return (
+            queryset.filter(**{vector_field: query})
+            .annotate(search_rank=SearchRank(F(vector_field), query))
+            .order_by("-search_rank", *queryset.query.order_by or queryset.model._meta.ordering)
+        )
+
+
+class TagFilterMixin(filters.FilterSet):
+    """Filter by tag name through the indexed normalized relation."""
+
+    tag = filters.CharFilter(method="filter_tag", label="Tag")
+
+    def filter_tag(self, queryset, name, value):
+        return queryset.filter(tag_items__normalized_name=normalize_term(value))
+
+
+class TechnologyFilterMixin(filters.FilterSet):
+    """Filter by technology name through the indexed normalized relation."""
+
+    technology = filters.CharFilter(method="filter_technology", label="Technology")
+
+    def filter_technology(self, queryset, name, value):
+        return queryset.filter(technology_items__normalized_name=normalize_term(value))
+
+
+class ProjectFilter(TagFilterMixin, TechnologyFilterMixin):
+    class Meta:
+        model = Project
+        fields = ["is_featured", "is_published", "user"]
+
+
+class ExperienceFilter(TechnologyFilterMixin):
+    class Meta:
+        model = Experience
+        fields = ["is_current", "company", "user"]
+
+
+class BlogPostFilter(TagFilterMixin):
+    class Meta:
+        model = BlogPost
+        fields = ["status", "is_featured", "author"]
@@ -0,0 +1,148 @@
+"""
+Responsive image derivatives.
+
+Uploaded originals are resized to the widths of ``IMAGE_DERIVATIVE_WIDTHS``
+(never upscaled) and encoded in every format of ``IMAGE_DERIVATIVE_FORMATS``
+supported by the installed Pillow. Derivatives are stored content-addressed
+under ``derivatives/<sha256 of the original>/``, so re-uploading the same
+file reuses them. The manifest is saved in the model's ``*_variants`` field
+(see ``image_fields`` on the models) and rendered by ``ImageSrcsetField``.
+
+Generation runs in a background task (see tasks.py), queued by the upload.
+"""
+
+import hashlib
+import logging
+from io import BytesIO
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Q
+
+from PIL import Image, ImageOps
+
+from .cache import bump_generation
+from .tasks import enqueue, task
+
+logger = logging.getLogger(__name__)
+
+DERIVATIVE_PATH = "derivatives/{digest}/{width}w.{extension}"
+
+# format name -> (Pillow format, MIME type, file extension)
+FORMATS = {
+    "avif": ("AVIF", "image/avif", "avif"),
+    "webp": ("WEBP", "image/webp", "webp"),
+    "jpeg": ("JPEG", "image/jpeg", "jpg"),
+}
+
+
+def get_formats():
+    """Return the configured formats Pillow can encode, in order of preference."""
+    Image.init()
+    return [name for name in settings.IMAGE_DERIVATIVE_FORMATS if FORMATS[name][0] in Image.SAVE]
+
+
+def get_widths(original_width):
+    """Return the derivative widths for an image ``original_width`` pixels wide."""
+    widths = {width for width in settings.IMAGE_DERIVATIVE_WIDTHS if width < original_width}
+    widths.add(min(original_width, max(settings.IMAGE_DERIVATIVE_WIDTHS)))
+    return sorted(widths)
+
+
+def encode(image, width, format_name):
+    """Resize ``image`` to ``width`` and encode it, returning the bytes."""
+    pillow_format = FORMATS[format_name][0]
+    height = max(1, round(image.height * width / image.width))
+    resized = image.resize((width, height), Image.Resampling.LANCZOS) if width != image.width else image
+
+    if pillow_format == "JPEG" and resized.mode != "RGB":
+        # JPEG has no alpha channel: flatten transparent images onto white
+        background = Image.new("RGB", resized.size, "white")
+        background.paste(resized, mask=resized.getchannel("A") if "A" in resized.getbands() else None)
+        resized = background
+
+    output = BytesIO()
+    resized.save(output, pillow_format, quality=settings.IMAGE_DERIVATIVE_QUALITY)
+    return output.getvalue()
+
+
+def build_derivatives(file):
+    """
+    Generate and store the derivatives of an image file.
+
+    Returns the manifest: the source name, its digest and one entry per
+    derivative with its storage name, width and MIME type.
+    """
+    file.open("rb")
+    try:
+        data = file.read()
+    finally:
+        file.close()
+    digest = hashlib.sha256(data).hexdigest()
+
+    with Image.open(BytesIO(data)) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info or "A" in image.getbands() else "RGB")
+
+        variants = []
+        for format_name in get_formats():
+            _, mime_type, extension = FORMATS[format_name]
+            for width in get_widths(image.width):
+                name = DERIVATIVE_PATH.format(digest=digest, width=width, extension=extension)
+                if not default_storage.exists(name):
+                    name = default_storage.save(name, ContentFile(encode(image, width, format_name)))
+                variants.append({"name": name, "width": width, "type": mime_type})
+
+    return {"source": file.name, "digest": digest, "variants": variants}
+
+
+def generate_derivatives(instance, field_name, force=False):
+    """
+    Generate the derivatives of ``instance.<field_name>`` and save the manifest.
+
+    Does nothing if the manifest is already up to date, unless ``force``.
+    Returns the manifest, or None if the image could not be processed.
+    """
+    variants_field = instance.image_fields[field_name]
+    file = getattr(instance, field_name)
+    manifest = getattr(instance, variants_field)
+
+    if not file:
+        if not manifest:
+            return manifest
+        manifest = {}
+    elif force or manifest.get("source") != file.name:
+        try:
+            manifest = build_derivatives(file)
+        except (OSError, ValueError, Image.DecompressionBombError):
+            logger.exception("Could not generate derivatives of %s", file.name)
+            return None
+    else:
+        return manifest
+
+    # Only store the manifest if the image was not replaced in the meantime
+    if file:
+        unchanged = Q(**{field_name: file.name})
+    else:
+        unchanged = Q(**{field_name: ""}) | Q(**{f"{field_name}__isnull": True})
+    updated = type(instance)._default_manager.filter(unchanged, pk=instance.pk).update(**{variants_field: manifest})
+    if updated:
+        setattr(instance, variants_field, manifest)
+        bump_generation(type(instance))
+    return manifest
+
+
+@task("portfolio.image_derivatives")
+def process_derivatives(model_label, pk, field_name):
+    """Load the instance and generate its derivatives."""
+    instance = apps.get_model(model_label)._default_manager.filter(pk=pk).first()
+    if instance is not None:
+        generate_derivatives(instance, field_name)
+
+
+def schedule_derivatives(instance, field_name):
+    """Queue the generation of the derivatives of ``instance.<field_name>``."""
+    enqueue(process_derivatives, model_label=instance._meta.label, pk=instance.pk, field_name=field_name)
@@ -0,0 +1,315 @@
+"""
+Streaming imports of portfolio data.
+
+Files are read record by record:
+
+- NDJSON (``.ndjson``/``.jsonl``): one object per line, like the exports;
+- CSV (``.csv``): one object per row with a header, empty cells being left
+  out so that the field defaults apply;
+- JSON Resume (``.json``, https://jsonresume.org/schema): the ``basics``,
+  ``work``, ``education``, ``skills`` and ``projects`` sections become the
+  profile, experiences, education entries, skills and projects of the owner.
+  A resume is a single document and is loaded whole.
+
+Records are validated in batches with the API serializers (field rules,
+``validate()`` such as the date ordering of experiences, uniqueness) through
+``BulkListSerializer`` and inserted like the bulk endpoints do, one
+transaction per batch: skills and the profile are upserted, the other models
+always get new rows. The number of records handled is saved to an
+``ImportCheckpoint`` row in the transaction of each batch, so an interrupted
+import resumes right after the last committed batch, without inserting any
+of its rows twice.
+"""
+
+import csv
+import json
+from collections import namedtuple
+from functools import partial
+from itertools import islice
+
+from django.db import transaction
+from django.utils.text import slugify
+
+from rest_framework.settings import api_settings
+
+from .bulk import BulkListSerializer, bulk_create_items
+from .cache import bump_generation
+from .models import ImportCheckpoint, Skill
+from .serializers import (
+    BlogPostSerializer,
+    EducationSerializer,
+    ExperienceSerializer,
+    ProjectSerializer,
+    SkillSerializer,
+    UserProfileSerializer,
+)
+
+# Records validated and inserted per transaction
+BATCH_SIZE = 500
+
+# Importable models, named like the API routes and the export files
+RESOURCES = {
+    "profile": (UserProfileSerializer, "user"),
+    "project": (ProjectSerializer, "user"),
+    "experience": (ExperienceSerializer, "user"),
+    "education": (EducationSerializer, "user"),
+    "skill": (SkillSerializer, "user"),
+    "blogpost": (BlogPostSerializer, "author"),
+}
+
+FORMATS = {".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv", ".json": "resume"}
+
+# One record of an import file; ``error`` is set when it could not be parsed
+Record = namedtuple("Record", ["resource", "location", "data", "error"], defaults=[None])
+
+
+def read_ndjson(file, resource):
+    for number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            yield Record(resource, f"line {number}", json.loads(line))
+        except ValueError as exc:
+            yield Record(resource, f"line {number}", None, f"Invalid JSON: {exc}")
+
+
+def read_csv(file, resource):
+    reader = csv.DictReader(file)
+    for row in reader:
+        data = {name: value for name, value in row.items() if name is not None and value not in ("", None)}
+        yield Record(resource, f"line {reader.line_num}", data)
+
+
+def resume_date(value):
+    """Complete the partial dates of JSON Resume (``2020``, ``2020-06``) to a day."""
+    if not isinstance(value, str) or not value:
+        return None
+    return (value + "-01-01")[:10] if len(value) < 10 else value
+
+
+def compact(data):
+    return {name: value for name, value in data.items() if value not in (None, "", [])}
+
+
+def resume_text(summary, items):
+    return "\n".join([summary or "", *(f"- {item}" for item in items or [])]).strip()
+
+
+def resume_profile(basics):
+    first_name, _, last_name = (basics.get("name") or "").partition(" ")
+    location = basics.get("location") or {}
+    data = {
+        "first_name": first_name,
+        "last_name": last_name,
+        "job_title": basics.get("label"),
+        "email": basics.get("email"),
+        "phone": basics.get("phone"),
+        "website_url": basics.get("url"),
+        "bio": basics.get("summary"),
+        "location": ", ".join(filter(None, [location.get("city"), location.get("countryCode")])),
+    }
+    for profile in basics.get("profiles") or []:
+        network = (profile.get("network") or "").lower()
+        network = "twitter" if network == "x" else network
+        if network in ("linkedin", "github", "twitter"):
+            data[f"{network}_url"] = profile.get("url")
+    return compact(data)
+
+
+def resume_experience(work, order):
+    return compact(
+        {
+            "company": work.get("name") or work.get("company"),
+            "position": work.get("position"),
+            "location": work.get("location"),
+            "description": resume_text(work.get("summary"), work.get("highlights")),
+            "start_date": resume_date(work.get("startDate")),
+            "end_date": resume_date(work.get("endDate")),
+            "is_current": not work.get("endDate"),
+            "company_url": work.get("url"),
+            "order": order,
+        }
+    )
+
+
+def resume_education(education, order):
+    return compact(
+        {
+            "institution": education.get("institution"),
+            "degree": education.get("studyType"),
+            "field_of_study": education.get("area"),
+            "description": resume_text(None, education.get("courses")),
+            "start_date": resume_date(education.get("startDate")),
+            "end_date": resume_date(education.get("endDate")),
+            "grade": education.get("score"),
+            "institution_url": education.get("url"),
+            "order": order,
+        }
+    )
+
+
+def resume_skill(skill, order):
+    level = (skill.get("level") or "").lower()
+    level = "expert" if level == "master" else level
+    return compact(
+        {
+            "name": skill.get("name"),
+            # Free-form levels ("Fluent"...) keep the default proficiency
+            "proficiency": level if level in dict(Skill.PROFICIENCY_CHOICES) else None,
+            "description": ", ".join(skill.get("keywords") or []),
+            "order": order,
+        }
+    )
+
+
+def resume_project(project, order):
+    keywords = ", ".join(project.get("keywords") or [])
+    return compact(
+        {
+            "title": project.get("name"),
+            "slug": slugify(project.get("name") or ""),
+            "description": resume_text(project.get("description"), project.get("highlights")),
+            "project_url": project.get("url"),
+            "tags": keywords,
+            "technologies": keywords,
+            "start_date": resume_date(project.get("startDate")),
+            "end_date": resume_date(project.get("endDate")),
+            "order": order,
+        }
+    )
+
+
+RESUME_SECTIONS = [
+    ("work", "experience", resume_experience),
+    ("education", "education", resume_education),
+    ("skills", "skill", resume_skill),
+    ("projects", "project", resume_project),
+]
+
+
+def read_resume(file, resource=None):
+    try:
+        document = json.load(file)
+    except ValueError as exc:
+        yield Record("profile", "document", None, f"Invalid JSON: {exc}")
+        return
+    if not isinstance(document, dict):
+        yield Record("profile", "document", None, "A JSON Resume document is an object.")
+        return
+    if document.get("basics"):
+        yield Record("profile", "basics", resume_profile(document["basics"]))
+    for section, resource, convert in RESUME_SECTIONS:
+        for index, item in enumerate(document.get(section) or []):
+            yield Record(resource, f"{section}[{index}]", convert(item, index))
+
+
+READERS = {"ndjson": read_ndjson, "csv": read_csv, "resume": read_resume}
+
+
+def batches(records, size):
+    """Group consecutive records of the same resource by ``size``."""
+    batch = []
+    for record in records:
+        if batch and (len(batch) == size or record.resource != batch[0].resource):
+            yield batch
+            batch = []
+        batch.append(record)
+    if batch:
+        yield batch
+
+
+def validate_batch(records, owner):
+    """Validate ``records`` for ``owner``; return the serializer and the errors by record location."""
+    serializer_class, owner_field = RESOURCES[records[0].resource]
+    serializer = BulkListSerializer(
+        data=[record.data for record in records],
+        child=serializer_class(),
+        owner_field=owner_field,
+        owner=owner,
+    )
+    if serializer.is_valid():
+        return serializer, {}
+    return serializer, {record.location: errors for record, errors in zip(records, serializer.errors) if errors}
+
+
+def import_batch(records, owner, skip_invalid=False):
+    """
+    Insert the valid records of ``records`` in one transaction.
+
+    Returns the number of rows written and the errors by record location.
+    Nothing is written if a record is invalid, unless ``skip_invalid``.
+    """
+    errors = {
+        record.location: {api_settings.NON_FIELD_ERRORS_KEY: [record.error]} for record in records if record.error
+    }
+    valid = [record for record in records if not record.error]
+    while valid:
+        serializer, invalid = validate_batch(valid, owner)
+        if not invalid:
+            break
+        errors.update(invalid)
+        # Dropping items can only remove conflicts: the next pass validates what is left
+        valid = [record for record in valid if record.location not in invalid]
+
+    if not valid or (errors and not skip_invalid):
+        return 0, errors
+    with transaction.atomic():
+        objs = bulk_create_items(serializer)
+    transaction.on_commit(partial(bump_generation, serializer.model))
+    return len(objs), errors
+
+
+class Checkpoint:
+    """
+    Progress of the import of a file, saved so that the import can resume.
+
+    Stored in the ``ImportCheckpoint`` row named ``key`` and saved in the
+    transaction of the batch it records. Invalid records can be fixed in place
+    before resuming: the records before the checkpoint are not read again. The
+    checkpoint is removed once the file is fully imported.
+    """
+
+    def __init__(self, key):
+        self.key = key
+
+    def load(self):
+        """Return the saved state, None if there is none."""
+        checkpoint = ImportCheckpoint.objects.filter(key=self.key).first()
+        return checkpoint.state if checkpoint else None
+
+    def save(self, state):
+        ImportCheckpoint.objects.update_or_create(key=self.key, defaults={"state": state})
+
+    def clear(self):
+        ImportCheckpoint.objects.filter(key=self.key).delete()
+
+
+def import_records(
+    records, owner, batch_size=BATCH_SIZE, skip_invalid=False, state=None, progress=None, checkpoint=None
+):
+    """
+    Import ``records`` for ``owner`` by batches of ``batch_size``.
+
+    ``state`` holds the counters of a previous run whose first
+    ``state["records"]`` records were handled already. The updated state is
+    saved to ``checkpoint`` in the transaction of each batch. ``progress`` is
+    called with the updated state and the errors of the batch after each
+    batch; the import stops at the first invalid batch unless
+    ``skip_invalid``. Returns the state and whether every batch was imported.
+    """
+    state = {"records": 0, "imported": 0, "invalid": 0, **(state or {})}
+    for batch in batches(islice(records, state["records"], None), batch_size):
+        with transaction.atomic():
+            imported, errors = import_batch(batch, owner, skip_invalid=skip_invalid)
+            if errors and not skip_invalid:
+                if progress:
+                    progress(state, errors)
+                return state, False
+            state["records"] += len(batch)
+            state["imported"] += imported
+            state["invalid"] += len(errors)
+            if checkpoint is not None:
+                checkpoint.save(state)
+        if progress:
+            progress(state, errors)
+    return state, True
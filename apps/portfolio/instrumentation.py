@@ -0,0 +1,278 @@
+"""
+Per-request SQL and timing instrumentation.
+
+``QueryInstrumentationMiddleware`` records, on a sample of requests
+(``INSTRUMENTATION_SAMPLE_RATE``), the number of queries, the SQL time, the
+statements executed more than once (the usual signature of an N+1) and the
+time spent rendering the response. The
+measurements are returned in a ``Server-Timing`` header, logged with
+structured fields and aggregated per route in the cache, where all gunicorn
+workers share them (see ``RequestStatsView``).
+
+Every database connection gets one execute wrapper when it connects,
+``record_query``, which hands the query to the recorder of the current
+request, found in a context variable. Under ASGI, the ORM calls of
+concurrent requests run on the same thread and connection, but each in the
+context of its own request, so the measurements do not mix. Unsampled
+requests only pay for one random draw and a context variable lookup per
+query.
+"""
+
+import logging
+import random
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from .cache import incr_counter
+
+logger = logging.getLogger(__name__)
+
+ROUTE_KEY = "portfolio:stats:route:{}"
+ROUTE_SLOT_KEY = "portfolio:stats:slot:{}"
+ROUTE_SLOTS_KEY = "portfolio:stats:slots"
+STAT_KEY = "portfolio:stats:{}:{}"
+
+# Aggregated per route, durations in microseconds
+STAT_FIELDS = ("requests", "queries", "duplicates", "db_us", "render_us", "total_us")
+
+IN_LIST = re.compile(r"\bIN \((?:%s, )*%s\)")
+LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+
+current_recorder = ContextVar("current_recorder", default=None)
+
+
+def fingerprint(sql):
+    """Normalize ``sql`` so that statements differing only by their parameters compare equal."""
+    return LITERAL.sub("?", IN_LIST.sub("IN (...)", sql))
+
+
+def get_stats_cache():
+    """Return the cache backend holding the aggregated statistics."""
+    return caches[settings.INSTRUMENTATION_CACHE_ALIAS]
+
+
+class QueryRecorder:
+    """Execute wrapper counting and timing the queries of one request."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+        self.timings = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.fingerprints[fingerprint(sql)] += 1
+
+    @contextmanager
+    def installed(self):
+        """Record the queries of the current context while the block runs."""
+        token = current_recorder.set(self)
+        try:
+            yield self
+        finally:
+            current_recorder.reset(token)
+
+    @property
+    def duplicates(self):
+        """Return ``{fingerprint: executions}`` of the statements run more than once."""
+        return {sql: count for sql, count in self.fingerprints.most_common() if count > 1}
+
+    def summary(self):
+        """Return the measurements of the request, durations in milliseconds."""
+        duplicates = self.duplicates
+        return {
+            "queries": self.count,
+            "duplicates": sum(duplicates.values()) - len(duplicates),
+            "db_ms": self.duration * 1000,
+            "render_ms": self.timings["render"] * 1000,
+            "total_ms": (time.perf_counter() - self.started) * 1000,
+        }
+
+
+def record_query(execute, sql, params, many, context):
+    """Execute wrapper passing the query to the recorder of the current request, if any."""
+    recorder = current_recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+@receiver(connection_created, dispatch_uid="portfolio.instrumentation")
+def install_query_recorder(sender, connection, **kwargs):
+    """Wrap the queries of every new database connection with ``record_query``."""
+    # Wrappers outlive reconnections
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@contextmanager
+def timed(name):
+    """Add the duration of the block to the ``name`` timing of the current request, if instrumented."""
+    recorder = current_recorder.get()
+    if recorder is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.timings[name] += time.perf_counter() - start
+
+
+def build_server_timing(summary):
+    """Format a request summary as a ``Server-Timing`` header value."""
+    queries = f"{summary['queries']} queries"
+    if summary["duplicates"]:
+        queries += f", {summary['duplicates']} duplicated"
+    return ", ".join(
+        [
+            f'db;dur={summary["db_ms"]:.2f};desc="{queries}"',
+            f'render;dur={summary["render_ms"]:.2f};desc="Response rendering"',
+            f"total;dur={summary['total_ms']:.2f}",
+        ]
+    )
+
+
+def record_stats(route, summary):
+    """Add a request summary to the statistics of ``route``."""
+    cache = get_stats_cache()
+    requests = incr_counter(cache, STAT_KEY.format(route, "requests"))
+    if requests == 1 and cache.add(ROUTE_KEY.format(route), 1, timeout=None):
+        slot = incr_counter(cache, ROUTE_SLOTS_KEY)
+        cache.set(ROUTE_SLOT_KEY.format(slot), route, timeout=None)
+    for field in ("queries", "duplicates"):
+        if summary[field]:
+            incr_counter(cache, STAT_KEY.format(route, field), summary[field])
+    for field in ("db", "render", "total"):
+        incr_counter(cache, STAT_KEY.format(route, f"{field}_us"), round(summary[f"{field}_ms"] * 1000))
+
+
+def get_stats():
+    """
+    Return the aggregated statistics of every instrumented route.
+
+    Maps route names to their number of sampled requests and the average
+    queries, duplicated queries and durations (ms) per request.
+    """
+    cache = get_stats_cache()
+    slots = cache.get(ROUTE_SLOTS_KEY, 0)
+    routes = cache.get_many([ROUTE_SLOT_KEY.format(slot) for slot in range(1, slots + 1)]).values()
+    values = cache.get_many([STAT_KEY.format(route, field) for route in routes for field in STAT_FIELDS])
+
+    stats = {}
+    for route in sorted(set(routes)):
+        totals = {field: values.get(STAT_KEY.format(route, field), 0) for field in STAT_FIELDS}
+        requests = totals["requests"]
+        if not requests:
+            continue
+        stats[route] = {
+            "requests": requests,
+            "queries": totals["queries"] / requests,
+            "duplicates": totals["duplicates"] / requests,
+            "db_ms": totals["db_us"] / requests / 1000,
+            "render_ms": totals["render_us"] / requests / 1000,
+            "total_ms": totals["total_us"] / requests / 1000,
+        }
+    return stats
+
+
+def reset_stats():
+    """Forget the aggregated statistics."""
+    cache = get_stats_cache()
+    slots = cache.get(ROUTE_SLOTS_KEY, 0)
+    routes = set(cache.get_many([ROUTE_SLOT_KEY.format(slot) for slot in range(1, slots + 1)]).values())
+    cache.delete_many(
+        [ROUTE_SLOTS_KEY]
+        + [ROUTE_SLOT_KEY.format(slot) for slot in range(1, slots + 1)]
+        + [ROUTE_KEY.format(route) for route in routes]
+        + [STAT_KEY.format(route, field) for route in routes for field in STAT_FIELDS]
+    )
+
+
+class QueryInstrumentationMiddleware:
+    """Instrument a sample of the requests (works under WSGI and ASGI)."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def sampled(self):
+        rate = settings.INSTRUMENTATION_SAMPLE_RATE
+        return rate > 0 and (rate >= 1 or random.random() < rate)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not self.sampled():
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        with recorder.installed():
+            response = self.get_response(request)
+        self.finish(request, response, recorder)
+        return response
+
+    async def __acall__(self, request):
+        if not self.sampled():
+            return await self.get_response(request)
+
+        recorder = QueryRecorder()
+        # The context, and the recorder with it, is copied into the threads
+        # running the sync code and ORM calls of this request
+        with recorder.installed():
+            response = await self.get_response(request)
+        self.finish(request, response, recorder)
+        return response
+
+    def finish(self, request, response, recorder):
+        summary = recorder.summary()
+        response["Server-Timing"] = build_server_timing(summary)
+
+        match = request.resolver_match
+        route = match.view_name if match else "unresolved"
+        record_stats(route, summary)
+
+        fields = {"route": route, "method": request.method, "status": response.status_code, **summary}
+        logger.info(
+            "%s %s %s queries=%d duplicates=%d db=%.1fms render=%.1fms total=%.1fms",
+            request.method,
+            route,
+            response.status_code,
+            summary["queries"],
+            summary["duplicates"],
+            summary["db_ms"],
+            summary["render_ms"],
+            summary["total_ms"],
+            extra={"instrumentation": fields},
+        )
+        for sql, count in recorder.duplicates.items():
+            if count >= settings.INSTRUMENTATION_DUPLICATE_THRESHOLD:
+                logger.warning(
+                    "Possible N+1 on %s: %d executions of %s",
+                    route,
+                    count,
+                    sql,
+                    extra={"instrumentation": {"route": route, "executions": count, "sql": sql}},
+                )
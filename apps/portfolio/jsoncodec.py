@@ -0,0 +1,101 @@
+"""
+Fast JSON encoding and decoding for the API renderers and parsers.
+
+DRF's ``JSONRenderer`` builds a new encoder per response, whose ``default``
+hook runs a chain of ``isinstance`` checks on every value the C encoder does
+not know, then copies the document twice to escape U+2028/U+2029 and once
+more to encode it. ``dumps`` returns the same bytes for DRF's default output
+(compact, UTF-8, strict):
+
+- with orjson when it is installed (``pip install orjson``), which writes
+  UTF-8 bytes directly;
+- otherwise with one stdlib encoder built at import.
+
+Both convert dates, times, decimals and UUIDs through ``ENCODERS``, indexed
+by exact type, and hand any other type to DRF's encoder. Documents orjson
+rejects (integers over 64 bits, non-string keys) are encoded by the stdlib
+encoder. Two differences remain with orjson: floats in exponent notation are
+written as ``1e16`` instead of ``1e+16``, and NaN and infinities as ``null``
+instead of raising (the serializers output decimals as strings).
+
+``loads`` parses with orjson when installed and falls back to the stdlib on
+errors, which are then reported with the stdlib's messages.
+"""
+
+import datetime
+import decimal
+import json
+import uuid
+
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.utils.json import strict_constant
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+drf_default = JSONEncoder().default
+
+
+def encode_datetime(value):
+    representation = value.isoformat()
+    if representation.endswith("+00:00"):
+        representation = representation[:-6] + "Z"
+    return representation
+
+
+def encode_time(value):
+    if value.utcoffset() is not None:
+        # Let DRF's encoder raise
+        return drf_default(value)
+    return value.isoformat()
+
+
+# DRF's representation of the types of model fields, by exact type
+ENCODERS = {
+    datetime.datetime: encode_datetime,
+    datetime.date: datetime.date.isoformat,
+    datetime.time: encode_time,
+    decimal.Decimal: float,
+    uuid.UUID: str,
+}
+
+
+def default(value):
+    encode = ENCODERS.get(type(value))
+    if encode is None:
+        return drf_default(value)
+    return encode(value)
+
+
+encoder = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=default)
+
+
+def dumps_json(data):
+    """Encode ``data`` as DRF's compact UTF-8 JSON with the stdlib."""
+    content = encoder.encode(data)
+    # Keep the output a strict subset of JavaScript, as DRF does
+    return content.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029").encode()
+
+
+def dumps_orjson(data):
+    """Encode ``data`` as DRF's compact UTF-8 JSON with orjson."""
+    try:
+        content = orjson.dumps(data, default=default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    except orjson.JSONEncodeError:
+        return dumps_json(data)
+    return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+def loads(content, encoding="utf-8", strict=True):
+    """Parse the JSON document ``content`` (bytes in ``encoding``), rejecting NaN and infinities if ``strict``."""
+    if orjson is not None and strict and encoding.lower().replace("_", "-") in ("utf-8", "utf8"):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content.decode(encoding), parse_constant=strict_constant if strict else None)
+
+
+dumps = dumps_orjson if orjson is not None else dumps_json
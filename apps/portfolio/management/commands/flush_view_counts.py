@@ -0,0 +1,30 @@
+"""
+Management command to flush buffered blog post views to the database.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.portfolio import counters
+
+
+class Command(BaseCommand):
+    help = "Flushes buffered blog post view counts to the database"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="Keep running and flush every INTERVAL seconds (default: flush once and exit)",
+        )
+
+    def handle(self, *args, **options):
+        interval = options["interval"]
+        while True:
+            counts = counters.flush()
+            self.stdout.write(self.style.SUCCESS(f"Flushed {sum(counts.values())} views across {len(counts)} posts"))
+            if not interval:
+                break
+            time.sleep(interval)
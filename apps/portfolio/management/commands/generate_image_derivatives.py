@@ -0,0 +1,43 @@
+"""
+Management command to (re)generate responsive image derivatives.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.portfolio.images import generate_derivatives
+from apps.portfolio.signals import IMAGE_MODELS
+
+
+class Command(BaseCommand):
+    help = "Generates missing or outdated responsive derivatives of uploaded images"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            choices=[model._meta.model_name for model in IMAGE_MODELS],
+            help="Only process this model (default: all models with images)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate derivatives even if they are up to date",
+        )
+
+    def handle(self, *args, **options):
+        for model in IMAGE_MODELS:
+            if options["model"] and model._meta.model_name != options["model"]:
+                continue
+            for field_name in model.image_fields:
+                generated = failed = 0
+                queryset = model.objects.exclude(**{field_name: ""}).exclude(**{f"{field_name}__isnull": True})
+                for instance in queryset.iterator():
+                    manifest = generate_derivatives(instance, field_name, force=options["force"])
+                    if manifest is None:
+                        failed += 1
+                    else:
+                        generated += 1
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"{model._meta.verbose_name_plural} ({field_name}): {generated} processed, {failed} failed"
+                    )
+                )
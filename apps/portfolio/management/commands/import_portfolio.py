@@ -0,0 +1,115 @@
+"""
+Management command to import portfolio data from NDJSON, CSV or JSON Resume files.
+
+The format is guessed from the extension and the model from the file name,
+so that export files load as they are::
+
+    python manage.py import_portfolio project.ndjson --user demo_user
+    python manage.py import_portfolio talks.csv --model blogpost --user demo_user
+    python manage.py import_portfolio resume.json --user demo_user
+
+An interrupted or failed import resumes after the last committed batch when
+run again with the same file.
+"""
+
+import json
+import os
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.portfolio import importing
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Imports portfolio data from an NDJSON, CSV or JSON Resume file in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import")
+        parser.add_argument("--user", required=True, help="Username of the owner of the imported rows")
+        parser.add_argument(
+            "--format",
+            choices=sorted(importing.READERS),
+            help="File format (default: from the extension, .ndjson/.jsonl, .csv or .json)",
+        )
+        parser.add_argument(
+            "--model",
+            choices=sorted(importing.RESOURCES),
+            help="Model of the NDJSON/CSV rows (default: from the file name, e.g. project.ndjson)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=importing.BATCH_SIZE,
+            help="Records validated and inserted per transaction",
+        )
+        parser.add_argument(
+            "--skip-invalid",
+            action="store_true",
+            help="Report invalid records and import the others instead of stopping at the first invalid batch",
+        )
+        parser.add_argument("--checkpoint", help="Checkpoint name (default: <user>:<absolute path of the file>)")
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore the checkpoint and import the file from the beginning",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not os.path.isfile(path):
+            raise CommandError(f"{path} does not exist")
+        try:
+            owner = User.objects.get(username=options["user"])
+        except User.DoesNotExist:
+            raise CommandError(f"Unknown user {options['user']}") from None
+
+        stem, extension = os.path.splitext(os.path.basename(path))
+        file_format = options["format"] or importing.FORMATS.get(extension.lower())
+        if file_format is None:
+            raise CommandError(f"Unknown format for {path}, use --format")
+        resource = options["model"] or (stem if stem in importing.RESOURCES else None)
+        if file_format != "resume" and resource is None:
+            raise CommandError(f"Unknown model for {path}, use --model")
+
+        checkpoint = importing.Checkpoint(options["checkpoint"] or f"{owner.username}:{os.path.abspath(path)}")
+        state = None if options["restart"] else checkpoint.load()
+        if state:
+            self.stdout.write(f"Resuming after {state['records']} records")
+
+        start = time.perf_counter()
+        handled = state["records"] if state else 0
+
+        def progress(state, errors):
+            for location, error in errors.items():
+                self.stderr.write(f"  {location}: {json.dumps(error)}")
+            rate = (state["records"] - handled) / (time.perf_counter() - start)
+            self.stdout.write(
+                f"  {state['records']} records: {state['imported']} imported, "
+                f"{state['invalid']} invalid ({rate:.0f} records/s)"
+            )
+
+        with open(path, encoding="utf-8", newline="") as file:
+            records = importing.READERS[file_format](file, resource)
+            state, complete = importing.import_records(
+                records,
+                owner,
+                batch_size=options["batch_size"],
+                skip_invalid=options["skip_invalid"],
+                state=state,
+                progress=progress,
+                checkpoint=checkpoint,
+            )
+
+        if not complete:
+            raise CommandError(
+                "Invalid records, nothing was imported from their batch. Fix them and run the command again "
+                "to resume after the last committed batch, or use --skip-invalid."
+            )
+        checkpoint.clear()
+        self.stdout.write(
+            self.style.SUCCESS(f"Imported {state['imported']} rows, {state['invalid']} invalid records skipped")
+        )
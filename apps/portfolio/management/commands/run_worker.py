@@ -0,0 +1,99 @@
+"""
+Management command running background tasks from the database queue.
+"""
+
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections, connection
+
+from apps.portfolio import tasks
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Runs queued background tasks (stop with SIGINT/SIGTERM)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Number of tasks run in parallel by this worker (default: 1)",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once the queue has no runnable task instead of waiting for more",
+        )
+
+    def handle(self, *args, **options):
+        self.stop = threading.Event()
+        self.processed = 0
+        self.lock = threading.Lock()
+        self.requeued_at = time.monotonic()
+        name = f"{socket.gethostname()}:{os.getpid()}"
+
+        handlers = {}
+        if threading.current_thread() is threading.main_thread():
+            # Finish the running tasks before exiting
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                handlers[signum] = signal.signal(signum, lambda *_: self.stop.set())
+
+        released = tasks.requeue_expired()
+        if released:
+            self.stdout.write(self.style.WARNING(f"Released {released} abandoned tasks"))
+
+        threads = [
+            threading.Thread(target=self.work, args=(f"{name}:{i}", options["burst"]), name=f"worker-{i}")
+            for i in range(max(1, options["concurrency"]))
+        ]
+        self.stdout.write(f"Worker {name} started with {len(threads)} threads")
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        finally:
+            for signum, handler in handlers.items():
+                signal.signal(signum, handler)
+        self.stdout.write(self.style.SUCCESS(f"Worker {name} stopped after {self.processed} tasks"))
+
+    def work(self, worker, burst):
+        try:
+            while not self.stop.is_set():
+                close_old_connections()
+                try:
+                    ran = tasks.run_next(worker)
+                except DatabaseError:
+                    # Keep the thread alive through database hiccups
+                    logger.exception("Worker %s could not claim a task", worker)
+                    connection.close()
+                    self.stop.wait(settings.TASK_POLL_INTERVAL)
+                    continue
+                if ran:
+                    with self.lock:
+                        self.processed += 1
+                elif burst:
+                    break
+                else:
+                    self.requeue_expired()
+                    self.stop.wait(settings.TASK_POLL_INTERVAL)
+        finally:
+            connection.close()
+
+    def requeue_expired(self):
+        """Release the abandoned tasks, at most once per lease (TASK_LOCK_TIMEOUT) in this process."""
+        with self.lock:
+            now = time.monotonic()
+            if now - self.requeued_at < settings.TASK_LOCK_TIMEOUT:
+                return
+            self.requeued_at = now
+        tasks.requeue_expired()
@@ -1,12 +1,20 @@
 """
 Management command to seed the database with sample data.
+
+Besides the demo portfolio, ``--users N`` generates N synthetic portfolios in
+batches, e.g. for load tests::
+
+    python manage.py seed_data --users 20000 --projects-per-user 20 --posts-per-user 20 --copy
 """
 
+import time
 from datetime import date, datetime, timedelta
 
 from django.contrib.auth import get_user_model
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
 
+from apps.portfolio import seeding
 from apps.portfolio.models import (
     BlogPost,
     Education,
@@ -28,8 +36,35 @@ class Command(BaseCommand):
             action="store_true",
             help="Clear existing data before seeding",
         )
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=0,
+            help="Number of synthetic portfolios to generate in addition to the demo one",
+        )
+        parser.add_argument("--projects-per-user", type=int, default=5, help="Projects per synthetic user")
+        parser.add_argument("--posts-per-user", type=int, default=5, help="Blog posts per synthetic user")
+        parser.add_argument("--skills-per-user", type=int, default=5, help="Skills per synthetic user")
+        parser.add_argument("--experiences-per-user", type=int, default=3, help="Experiences per synthetic user")
+        parser.add_argument("--education-per-user", type=int, default=2, help="Education entries per synthetic user")
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed: the same seed and counts always generate the same content",
+        )
+        parser.add_argument("--prefix", default="seed_user", help="Username prefix of the synthetic users")
+        parser.add_argument("--batch-size", type=int, default=seeding.BATCH_SIZE, help="Rows inserted per statement")
+        parser.add_argument(
+            "--copy",
+            action="store_true",
+            help="Load the synthetic rows with COPY instead of INSERT (PostgreSQL only, fastest)",
+        )
 
     def handle(self, *args, **options):
+        if options["copy"] and connection.vendor != "postgresql":
+            raise CommandError("--copy requires PostgreSQL")
+
         if options["clear"]:
             self.stdout.write("Clearing existing data...")
             UserProfile.objects.all().delete()
@@ -425,3 +460,31 @@ Redis and Memcached can dramatically improve performance...
         self.stdout.write(self.style.SUCCESS("Demo user credentials:"))
         self.stdout.write(self.style.SUCCESS("  Username: demo_user"))
         self.stdout.write(self.style.SUCCESS("  Password: demo123"))
+
+        if options["users"] > 0:
+            self.generate(options)
+
+    def generate(self, options):
+        """Generate the synthetic portfolios."""
+        users = options["users"]
+        self.stdout.write(f"Generating {users} synthetic portfolios...")
+        start = time.perf_counter()
+        created = seeding.generate(
+            users,
+            projects=options["projects_per_user"],
+            posts=options["posts_per_user"],
+            skills=options["skills_per_user"],
+            experiences=options["experiences_per_user"],
+            education=options["education_per_user"],
+            seed=options["seed"],
+            prefix=options["prefix"],
+            batch_size=options["batch_size"],
+            use_copy=options["copy"],
+            progress=lambda done: self.stdout.write(f"  {done}/{users} users"),
+        )
+        elapsed = time.perf_counter() - start
+
+        rows = sum(created.values())
+        for model, count in created.items():
+            self.stdout.write(f"  {model._meta.verbose_name_plural}: {count}")
+        self.stdout.write(self.style.SUCCESS(f"Generated {rows} rows in {elapsed:.1f}s ({rows / elapsed:.0f} rows/s)"))
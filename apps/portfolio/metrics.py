@@ -0,0 +1,162 @@
+"""
+Prometheus metrics.
+
+``PrometheusMetricsMiddleware`` records the latency and status of every
+request per route name, and the response cache records its hits and misses.
+Each worker also reports its start time and resident memory; the connection
+usage of the database server is queried when the metrics are scraped.
+
+Under gunicorn, set ``PROMETHEUS_MULTIPROC_DIR`` to a directory shared by the
+workers (cleaned by ``config/gunicorn.py``): every process writes its samples
+there and ``/metrics`` aggregates them, whichever worker serves the scrape.
+"""
+
+import hmac
+import os
+import resource
+import time
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+from django.http import HttpResponse, HttpResponseForbidden
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+# Seconds between two updates of the per-process gauges
+PROCESS_METRICS_INTERVAL = 10
+
+REQUEST_DURATION = Histogram(
+    "portfolio_http_request_duration_seconds",
+    "Request latency by route name",
+    ["route", "method"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+RESPONSES = Counter("portfolio_http_responses", "Responses by route name and status", ["route", "method", "status"])
+CACHE_REQUESTS = Counter("portfolio_response_cache_requests", "Response cache lookups by result", ["result"])
+WORKERS = Gauge("portfolio_worker_processes", "Live worker processes", multiprocess_mode="livesum")
+WORKER_START_TIME = Gauge(
+    "portfolio_worker_start_time_seconds", "Start time of each worker process", multiprocess_mode="liveall"
+)
+RESIDENT_MEMORY = Gauge(
+    "portfolio_worker_resident_memory_bytes", "Resident memory of each worker process", multiprocess_mode="liveall"
+)
+
+
+def get_resident_memory():
+    """Return the resident memory of the current process in bytes."""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak rather than current usage, in KiB on Linux and bytes on macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class DatabaseCollector:
+    """Connection usage reported by each PostgreSQL server, collected at scrape time."""
+
+    def collect(self):
+        usage = GaugeMetricFamily(
+            "portfolio_db_server_connections", "Server connections to the database by state", labels=["alias", "state"]
+        )
+        limit = GaugeMetricFamily(
+            "portfolio_db_server_max_connections", "Connection limit of the database server", labels=["alias"]
+        )
+        for alias in connections:
+            connection = connections[alias]
+            if connection.vendor != "postgresql":
+                continue
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT COALESCE(state, 'unknown'), COUNT(*) FROM pg_stat_activity "
+                        "WHERE datname = current_database() GROUP BY 1"
+                    )
+                    states = cursor.fetchall()
+                    cursor.execute("SHOW max_connections")
+                    (max_connections,) = cursor.fetchone()
+            except DatabaseError:
+                continue
+            for state, count in states:
+                usage.add_metric([alias, state], count)
+            limit.add_metric([alias], int(max_connections))
+        yield usage
+        yield limit
+
+
+def render_metrics():
+    """Return the metrics of every worker in the Prometheus text format."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    database = CollectorRegistry(auto_describe=True)
+    database.register(DatabaseCollector())
+    return generate_latest(registry) + generate_latest(database)
+
+
+def metrics_view(request):
+    """
+    Prometheus scrape endpoint.
+
+    When ``METRICS_TOKEN`` is set, scrapers must send it as a bearer token.
+    """
+    token = settings.METRICS_TOKEN
+    if token and not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}"):
+        return HttpResponseForbidden()
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE_LATEST)
+
+
+class PrometheusMetricsMiddleware:
+    """Record request latency and status per route name (works under WSGI and ASGI)."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        # The handler is built once per worker process
+        WORKERS.set(1)
+        WORKER_START_TIME.set(time.time())
+        RESIDENT_MEMORY.set(get_resident_memory())
+        self.process_metrics_updated = time.monotonic()
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        start = time.perf_counter()
+        response = self.get_response(request)
+        self.record(request, response, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        response = await self.get_response(request)
+        self.record(request, response, time.perf_counter() - start)
+        return response
+
+    def record(self, request, response, duration):
+        match = request.resolver_match
+        route = match.view_name if match else "unresolved"
+        REQUEST_DURATION.labels(route=route, method=request.method).observe(duration)
+        RESPONSES.labels(route=route, method=request.method, status=response.status_code).inc()
+
+        now = time.monotonic()
+        if now - self.process_metrics_updated >= PROCESS_METRICS_INTERVAL:
+            self.process_metrics_updated = now
+            RESIDENT_MEMORY.set(get_resident_memory())
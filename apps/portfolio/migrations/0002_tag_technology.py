@@ -0,0 +1,173 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("portfolio", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tag",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=500, unique=True)),
+                ("normalized_name", models.CharField(db_index=True, editable=False, max_length=500)),
+            ],
+            options={
+                "verbose_name": "Tag",
+                "verbose_name_plural": "Tags",
+                "ordering": ["name"],
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="Technology",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=500, unique=True)),
+                ("normalized_name", models.CharField(db_index=True, editable=False, max_length=500)),
+            ],
+            options={
+                "verbose_name": "Technology",
+                "verbose_name_plural": "Technologies",
+                "ordering": ["name"],
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="ProjectTag",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("position", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="project_tags", to="portfolio.project"
+                    ),
+                ),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="project_tags", to="portfolio.tag"
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["position"],
+                "unique_together": {("project", "tag")},
+            },
+        ),
+        migrations.CreateModel(
+            name="BlogPostTag",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("position", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="post_tags", to="portfolio.blogpost"
+                    ),
+                ),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="post_tags", to="portfolio.tag"
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["position"],
+                "unique_together": {("post", "tag")},
+            },
+        ),
+        migrations.AddField(
+            model_name="blogpost",
+            name="tag_items",
+            field=models.ManyToManyField(
+                blank=True, related_name="blog_posts", through="portfolio.BlogPostTag", to="portfolio.tag"
+            ),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="tag_items",
+            field=models.ManyToManyField(
+                blank=True, related_name="projects", through="portfolio.ProjectTag", to="portfolio.tag"
+            ),
+        ),
+        migrations.CreateModel(
+            name="ProjectTechnology",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("position", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="project_technologies",
+                        to="portfolio.project",
+                    ),
+                ),
+                (
+                    "technology",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="project_technologies",
+                        to="portfolio.technology",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["position"],
+                "unique_together": {("project", "technology")},
+            },
+        ),
+        migrations.CreateModel(
+            name="ExperienceTechnology",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("position", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "experience",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="experience_technologies",
+                        to="portfolio.experience",
+                    ),
+                ),
+                (
+                    "technology",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="experience_technologies",
+                        to="portfolio.technology",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["position"],
+                "unique_together": {("experience", "technology")},
+            },
+        ),
+        migrations.AddField(
+            model_name="experience",
+            name="technology_items",
+            field=models.ManyToManyField(
+                blank=True,
+                related_name="experiences",
+                through="portfolio.ExperienceTechnology",
+                to="portfolio.technology",
+            ),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="technology_items",
+            field=models.ManyToManyField(
+                blank=True, related_name="projects", through="portfolio.ProjectTechnology", to="portfolio.technology"
+            ),
+        ),
+    ]
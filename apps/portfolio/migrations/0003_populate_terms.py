@@ -0,0 +1,45 @@
+from django.db import migrations
+
+# (model, comma-separated field, through model, owner field, term model, term field)
+RELATIONS = [
+    ("Project", "tags", "ProjectTag", "project", "Tag", "tag"),
+    ("Project", "technologies", "ProjectTechnology", "project", "Technology", "technology"),
+    ("Experience", "technologies", "ExperienceTechnology", "experience", "Technology", "technology"),
+    ("BlogPost", "tags", "BlogPostTag", "post", "Tag", "tag"),
+]
+
+
+def split_terms(value):
+    return list(dict.fromkeys(item.strip() for item in value.split(",") if item.strip()))
+
+
+def populate_terms(apps, schema_editor):
+    for model_name, source_field, through_name, owner_field, term_name, term_field in RELATIONS:
+        model = apps.get_model("portfolio", model_name)
+        through = apps.get_model("portfolio", through_name)
+        term_model = apps.get_model("portfolio", term_name)
+
+        rows = list(model.objects.values_list("pk", source_field))
+        names = {name for _, value in rows for name in split_terms(value)}
+        term_model.objects.bulk_create(
+            [term_model(name=name, normalized_name=name.lower()) for name in names], ignore_conflicts=True
+        )
+        terms = dict(term_model.objects.values_list("name", "pk"))
+
+        links = [
+            through(**{f"{owner_field}_id": pk, f"{term_field}_id": terms[name], "position": position})
+            for pk, value in rows
+            for position, name in enumerate(split_terms(value))
+        ]
+        through.objects.bulk_create(links, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("portfolio", "0002_tag_technology"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_terms, migrations.RunPython.noop),
+    ]
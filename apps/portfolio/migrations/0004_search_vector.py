@@ -0,0 +1,84 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:12
+
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+# table -> [(column, weight)]
+SEARCH_DOCUMENTS = {
+    "portfolio_project": [
+        ("title", "A"),
+        ("short_description", "B"),
+        ("tags", "B"),
+        ("technologies", "B"),
+        ("description", "C"),
+    ],
+    "portfolio_blogpost": [
+        ("title", "A"),
+        ("excerpt", "B"),
+        ("tags", "B"),
+        ("content", "C"),
+    ],
+}
+
+
+def create_search_triggers(apps, schema_editor):
+    """Maintain search_vector with a trigger and index it with GIN (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    config = settings.FULL_TEXT_SEARCH_CONFIG
+    for table, columns in SEARCH_DOCUMENTS.items():
+        document = " || ".join(
+            f"setweight(to_tsvector('{config}', coalesce(NEW.{column}, '')), '{weight}')" for column, weight in columns
+        )
+        column_list = ", ".join(column for column, _ in columns)
+        schema_editor.execute(
+            f"""
+            CREATE FUNCTION {table}_search_vector_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector := {document};
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql;
+            """
+        )
+        schema_editor.execute(
+            f"""
+            CREATE TRIGGER {table}_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF {column_list} ON {table}
+            FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update();
+            """
+        )
+        schema_editor.execute(f"CREATE INDEX {table}_search_vector_gin ON {table} USING gin (search_vector);")
+        # Fire the trigger once for existing rows
+        schema_editor.execute(f"UPDATE {table} SET title = title;")
+
+
+def drop_search_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table in SEARCH_DOCUMENTS:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {table}_search_vector_gin;")
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table};")
+        schema_editor.execute(f"DROP FUNCTION IF EXISTS {table}_search_vector_update();")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("portfolio", "0003_populate_terms"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogpost",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_triggers, drop_search_triggers),
+    ]
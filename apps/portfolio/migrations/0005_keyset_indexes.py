@@ -0,0 +1,56 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("portfolio", "0004_search_vector"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(
+                fields=["status", "-published_at", "-created_at", "-id"], name="portfolio_b_status_3bda07_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(fields=["-published_at", "-created_at", "-id"], name="portfolio_b_publish_bf0e75_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="education",
+            index=models.Index(fields=["-start_date", "-id"], name="portfolio_e_start_d_a1c58f_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="experience",
+            index=models.Index(fields=["-is_current", "-start_date", "-id"], name="portfolio_e_is_curr_0480ec_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["is_published", "-is_featured", "order", "-start_date", "-id"],
+                name="portfolio_p_is_publ_dd5ca2_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["-is_featured", "order", "-start_date", "-id"], name="portfolio_p_is_feat_7a6f15_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="skill",
+            index=models.Index(
+                fields=["-is_featured", "category", "order", "name", "id"], name="portfolio_s_is_feat_676e54_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="userprofile",
+            index=models.Index(fields=["-created_at", "-id"], name="portfolio_u_created_3d699e_idx"),
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.utils import timezone
 
 User = get_user_model()
 
@@ -15,6 +17,50 @@ class TimeStampedModel(models.Model):
         abstract = True
 
 
+def split_terms(value):
+    """Split a comma-separated string into a list of stripped, non-empty items."""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def normalize_term(name):
+    """Return the lookup form of a tag or technology name."""
+    return name.strip().lower()
+
+
+class Term(models.Model):
+    """Abstract base model for normalized tags and technologies."""
+
+    name = models.CharField(max_length=500, unique=True)
+    normalized_name = models.CharField(max_length=500, db_index=True, editable=False)
+
+    class Meta:
+        abstract = True
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+    def save(self, *args, **kwargs):
+        self.normalized_name = normalize_term(self.name)
+        super().save(*args, **kwargs)
+
+
+class Tag(Term):
+    """Tag shared by projects and blog posts."""
+
+    class Meta(Term.Meta):
+        verbose_name = "Tag"
+        verbose_name_plural = "Tags"
+
+
+class Technology(Term):
+    """Technology shared by projects and experiences."""
+
+    class Meta(Term.Meta):
+        verbose_name = "Technology"
+        verbose_name_plural = "Technologies"
+
+
 class UserProfile(TimeStampedModel):
     """User profile with personal information."""
 
@@ -23,6 +69,7 @@ class UserProfile(TimeStampedModel):
     last_name = models.CharField(max_length=100)
     bio = models.TextField(blank=True)
     profile_photo = models.ImageField(upload_to="profiles/", blank=True, null=True)
+    profile_photo_variants = models.JSONField(default=dict, blank=True, editable=False)
     email = models.EmailField()
     phone = models.CharField(max_length=20, blank=True)
     location = models.CharField(max_length=200, blank=True)
@@ -39,10 +86,17 @@ class UserProfile(TimeStampedModel):
 
     is_active = models.BooleanField(default=True)
 
+    # Image field -> responsive derivatives, generated after upload (see images.py)
+    image_fields = {"profile_photo": "profile_photo_variants"}
+
     class Meta:
         verbose_name = "User Profile"
         verbose_name_plural = "User Profiles"
         ordering = ["-created_at"]
+        indexes = [
+            # Keyset pagination over the default ordering
+            models.Index(fields=["-created_at", "-id"]),
+        ]
 
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
@@ -60,6 +114,7 @@ class Project(TimeStampedModel):
     description = models.TextField()
     short_description = models.CharField(max_length=300, blank=True)
     image = models.ImageField(upload_to="projects/", blank=True, null=True)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     project_url = models.URLField(blank=True)
     github_url = models.URLField(blank=True)
     demo_url = models.URLField(blank=True)
@@ -74,6 +129,21 @@ class Project(TimeStampedModel):
     # Relationships
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="projects")
 
+    # Normalized copies of `tags` and `technologies`, kept in sync on save
+    tag_items = models.ManyToManyField(Tag, through="ProjectTag", related_name="projects", blank=True)
+    technology_items = models.ManyToManyField(
+        Technology, through="ProjectTechnology", related_name="projects", blank=True
+    )
+
+    # Comma-separated field -> normalized relation
+    term_fields = {"tags": "tag_items", "technologies": "technology_items"}
+
+    # Image field -> responsive derivatives, generated after upload (see images.py)
+    image_fields = {"image": "image_variants"}
+
+    # Weighted full-text document, maintained by a database trigger on PostgreSQL
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         verbose_name = "Project"
         verbose_name_plural = "Projects"
@@ -81,6 +151,9 @@ class Project(TimeStampedModel):
         indexes = [
             models.Index(fields=["slug"]),
             models.Index(fields=["is_published", "-created_at"]),
+            # Keyset pagination over the default ordering (published only, then all)
+            models.Index(fields=["is_published", "-is_featured", "order", "-start_date", "-id"]),
+            models.Index(fields=["-is_featured", "order", "-start_date", "-id"]),
         ]
 
     def __str__(self):
@@ -89,12 +162,12 @@ class Project(TimeStampedModel):
     @property
     def tag_list(self):
         """Return tags as a list."""
-        return [tag.strip() for tag in self.tags.split(",") if tag.strip()]
+        return [item.tag.name for item in self.project_tags.all()]
 
     @property
     def technology_list(self):
         """Return technologies as a list."""
-        return [tech.strip() for tech in self.technologies.split(",") if tech.strip()]
+        return [item.technology.name for item in self.project_technologies.all()]
 
 
 class Experience(TimeStampedModel):
@@ -114,12 +187,21 @@ class Experience(TimeStampedModel):
     # Relationships
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="experiences")
 
+    # Normalized copy of `technologies`, kept in sync on save
+    technology_items = models.ManyToManyField(
+        Technology, through="ExperienceTechnology", related_name="experiences", blank=True
+    )
+
+    term_fields = {"technologies": "technology_items"}
+
     class Meta:
         verbose_name = "Experience"
         verbose_name_plural = "Experiences"
         ordering = ["-is_current", "-start_date"]
         indexes = [
             models.Index(fields=["-start_date"]),
+            # Keyset pagination over the default ordering
+            models.Index(fields=["-is_current", "-start_date", "-id"]),
         ]
 
     def __str__(self):
@@ -128,7 +210,7 @@ class Experience(TimeStampedModel):
     @property
     def technology_list(self):
         """Return technologies as a list."""
-        return [tech.strip() for tech in self.technologies.split(",") if tech.strip()]
+        return [item.technology.name for item in self.experience_technologies.all()]
 
 
 class Education(TimeStampedModel):
@@ -152,6 +234,10 @@ class Education(TimeStampedModel):
         verbose_name = "Education"
         verbose_name_plural = "Education"
         ordering = ["-start_date"]
+        indexes = [
+            # Keyset pagination over the default ordering
+            models.Index(fields=["-start_date", "-id"]),
+        ]
 
     def __str__(self):
         return f"{self.degree} in {self.field_of_study} from {self.institution}"
@@ -199,6 +285,10 @@ class Skill(TimeStampedModel):
         verbose_name_plural = "Skills"
         ordering = ["-is_featured", "category", "order", "name"]
         unique_together = ["user", "name"]
+        indexes = [
+            # Keyset pagination over the default ordering
+            models.Index(fields=["-is_featured", "category", "order", "name", "id"]),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.get_proficiency_display()})"
@@ -218,6 +308,7 @@ class BlogPost(TimeStampedModel):
     excerpt = models.CharField(max_length=300, blank=True)
     content = models.TextField()
     featured_image = models.ImageField(upload_to="blog/", blank=True, null=True)
+    featured_image_variants = models.JSONField(default=dict, blank=True, editable=False)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="draft")
     published_at = models.DateTimeField(null=True, blank=True)
     tags = models.CharField(max_length=500, blank=True, help_text="Comma-separated tags")
@@ -232,6 +323,17 @@ class BlogPost(TimeStampedModel):
     # Relationships
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name="blog_posts")
 
+    # Normalized copy of `tags`, kept in sync on save
+    tag_items = models.ManyToManyField(Tag, through="BlogPostTag", related_name="blog_posts", blank=True)
+
+    term_fields = {"tags": "tag_items"}
+
+    # Image field -> responsive derivatives, generated after upload (see images.py)
+    image_fields = {"featured_image": "featured_image_variants"}
+
+    # Weighted full-text document, maintained by a database trigger on PostgreSQL
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         verbose_name = "Blog Post"
         verbose_name_plural = "Blog Posts"
@@ -239,6 +341,9 @@ class BlogPost(TimeStampedModel):
         indexes = [
             models.Index(fields=["slug"]),
             models.Index(fields=["status", "-published_at"]),
+            # Keyset pagination over the default ordering (published only, then all)
+            models.Index(fields=["status", "-published_at", "-created_at", "-id"]),
+            models.Index(fields=["-published_at", "-created_at", "-id"]),
         ]
 
     def __str__(self):
@@ -247,4 +352,144 @@ class BlogPost(TimeStampedModel):
     @property
     def tag_list(self):
         """Return tags as a list."""
-        return [tag.strip() for tag in self.tags.split(",") if tag.strip()]
+        return [item.tag.name for item in self.post_tags.all()]
+
+
+class ProjectTag(models.Model):
+    """Ordered link between a project and a tag."""
+
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="project_tags")
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name="project_tags")
+    position = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        ordering = ["position"]
+        unique_together = ["project", "tag"]
+
+
+class ProjectTechnology(models.Model):
+    """Ordered link between a project and a technology."""
+
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="project_technologies")
+    technology = models.ForeignKey(Technology, on_delete=models.CASCADE, related_name="project_technologies")
+    position = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        ordering = ["position"]
+        unique_together = ["project", "technology"]
+
+
+class ExperienceTechnology(models.Model):
+    """Ordered link between an experience and a technology."""
+
+    experience = models.ForeignKey(Experience, on_delete=models.CASCADE, related_name="experience_technologies")
+    technology = models.ForeignKey(Technology, on_delete=models.CASCADE, related_name="experience_technologies")
+    position = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        ordering = ["position"]
+        unique_together = ["experience", "technology"]
+
+
+class BlogPostTag(models.Model):
+    """Ordered link between a blog post and a tag."""
+
+    post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name="post_tags")
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name="post_tags")
+    position = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        ordering = ["position"]
+        unique_together = ["post", "tag"]
+
+
+class Task(TimeStampedModel):
+    """Background task waiting in the database queue (see apps/portfolio/tasks.py)."""
+
+    STATUS_CHOICES = [
+        ("queued", "Queued"),
+        ("running", "Running"),
+        ("failed", "Failed"),
+    ]
+
+    name = models.CharField(max_length=200, help_text="Registered task name")
+    kwargs = models.JSONField(default=dict, blank=True)
+    priority = models.SmallIntegerField(default=0, help_text="Higher priorities run first")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="queued")
+    run_after = models.DateTimeField(default=timezone.now)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    locked_by = models.CharField(max_length=200, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ["-priority", "run_after", "id"]
+        indexes = [
+            # Claim order of runnable tasks
+            models.Index(
+                fields=["-priority", "run_after", "id"],
+                condition=models.Q(status="queued"),
+                name="portfolio_task_queued_idx",
+            ),
+            models.Index(fields=["status", "locked_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.status})"
+
+
+class ImportCheckpoint(TimeStampedModel):
+    """Progress of an interrupted file import (see apps/portfolio/importing.py)."""
+
+    key = models.CharField(max_length=500, unique=True, help_text="Owner and path of the imported file")
+    state = models.JSONField(default=dict, blank=True)
+
+    def __str__(self):
+        return self.key
+
+
+def sync_terms(instance, source_field, relation_name):
+    """
+    Rebuild the normalized relation of ``instance`` from its comma-separated field.
+
+    Missing terms are created; duplicates, compared in their normalized form,
+    keep their first spelling and position.
+    """
+    sync_terms_many([instance], source_field, relation_name)
+
+
+def sync_terms_many(instances, source_field, relation_name):
+    """Rebuild the relation of several instances of one model with a fixed number of queries."""
+    if not instances:
+        return
+    relation = instances[0]._meta.get_field(relation_name)
+    term_model = relation.related_model
+    through = relation.remote_field.through
+    owner_field = relation.m2m_field_name()
+    term_field = relation.m2m_reverse_field_name()
+
+    names = {}
+    for instance in instances:
+        # One row per normalized name, or the filters on it would return the instance twice
+        first = {}
+        for name in split_terms(getattr(instance, source_field)):
+            first.setdefault(normalize_term(name), name)
+        names[instance.pk] = list(first.values())
+    all_names = set().union(*names.values())
+    terms = {term.name: term for term in term_model.objects.filter(name__in=all_names)}
+    missing = [name for name in all_names if name not in terms]
+    if missing:
+        term_model.objects.bulk_create(
+            [term_model(name=name, normalized_name=normalize_term(name)) for name in missing], ignore_conflicts=True
+        )
+        terms = {term.name: term for term in term_model.objects.filter(name__in=all_names)}
+
+    through.objects.filter(**{f"{owner_field}__in": instances}).delete()
+    through.objects.bulk_create(
+        [
+            through(**{f"{owner_field}_id": pk, term_field: terms[name], "position": i})
+            for pk, values in names.items()
+            for i, name in enumerate(values)
+        ]
+    )
@@ -0,0 +1,219 @@
+"""
+Pagination classes for portfolio app.
+"""
+
+import base64
+import datetime
+import json
+from decimal import Decimal
+from functools import reduce
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, Q
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def encode_value(value):
+    """JSON-encode cursor values without losing precision (unlike DjangoJSONEncoder)."""
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination following the queryset ordering.
+
+    The cursor holds the ordering values of the last row of the page, so every
+    page is fetched with ``WHERE (ordering) > (cursor) ORDER BY ... LIMIT n``
+    and costs the same however deep it is; no ``COUNT(*)`` is issued. The
+    primary key is appended to the ordering to make it total. NULLs sort as
+    the largest values on every database, matching PostgreSQL defaults so the
+    composite indexes declared on the models can serve the query.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(queryset)
+        values, reverse = self.decode_cursor(request)
+        self.has_cursor = values is not None
+
+        if self.has_cursor:
+            queryset = queryset.filter(self.get_keyset_filter(values, reverse))
+        queryset = queryset.order_by(*self.get_order_by(reverse))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = self.has_cursor, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.has_cursor
+
+        self.page = results
+        return results
+
+    def get_ordering(self, queryset):
+        """Return the ordering as ``(field, descending)`` pairs, ending with the primary key."""
+        ordering = []
+        for field in queryset.query.order_by or queryset.model._meta.ordering:
+            if not isinstance(field, str):
+                raise NotFound("Keyset pagination only supports ordering by field names.")
+            ordering.append((field.lstrip("-"), field.startswith("-")))
+        if not ordering or ordering[-1][0] not in ("pk", queryset.model._meta.pk.name):
+            descending = ordering[-1][1] if ordering else False
+            ordering.append(("pk", descending))
+        self.model = queryset.model
+        return ordering
+
+    def get_order_by(self, reverse):
+        order_by = []
+        for name, descending in self.ordering:
+            if descending != reverse:
+                order_by.append(F(name).desc(nulls_first=True))
+            else:
+                order_by.append(F(name).asc(nulls_last=True))
+        return order_by
+
+    def get_keyset_filter(self, values, reverse):
+        """Build the predicate selecting rows strictly after ``values``."""
+        after = Q(pk__in=[])
+        equal = Q()
+        for (name, descending), value in zip(self.ordering, values):
+            after |= equal & self.after_value(name, descending != reverse, value)
+            equal &= Q(**{f"{name}__isnull": True}) if value is None else Q(**{name: value})
+
+        # Also bound the leading column on its own so the database can seek the index
+        name, descending = self.ordering[0]
+        descending = descending != reverse
+        if values[0] is not None and descending:
+            after &= Q(**{f"{name}__lte": values[0]})
+        elif values[0] is not None:
+            after &= Q(**{f"{name}__gte": values[0]}) | Q(**{f"{name}__isnull": True})
+        return after
+
+    def after_value(self, name, descending, value):
+        """Return the predicate for values of ``name`` sorting after ``value`` (NULL is largest)."""
+        if descending:
+            return Q(**{f"{name}__isnull": False}) if value is None else Q(**{f"{name}__lt": value})
+        if value is None:
+            return Q(pk__in=[])
+        return Q(**{f"{name}__gt": value}) | Q(**{f"{name}__isnull": True})
+
+    def get_values(self, instance):
+        return [reduce(getattr, name.split("__"), instance) for name, _ in self.ordering]
+
+    def to_python(self, name, value):
+        if value is None:
+            return None
+        try:
+            field = self.model._meta.pk if name == "pk" else self.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return value
+        return field.to_python(value)
+
+    def encode_cursor(self, values, reverse):
+        payload = json.dumps({"v": values, "r": reverse}, default=encode_value, separators=(",", ":"))
+        cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            values = [self.to_python(name, value) for (name, _), value in zip(self.ordering, payload["v"], strict=True)]
+            return values, bool(payload["r"])
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.get_values(self.page[-1]), False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.get_values(self.page[0]), True)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "previous": self.get_previous_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value (with `pagination=cursor`).",
+                "schema": {"type": "string"},
+            }
+        ]
+
+
+class PortfolioPagination(PageNumberPagination):
+    """
+    Page number pagination with opt-in keyset pagination.
+
+    Clients pass ``?pagination=cursor`` to switch a list endpoint to
+    KeysetPagination; existing clients keep getting numbered pages.
+    """
+
+    mode_query_param = "pagination"
+    keyset_class = KeysetPagination
+
+    def uses_keyset(self, request):
+        return request.query_params.get(self.mode_query_param) == "cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.uses_keyset(request):
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        self.keyset = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Set to `cursor` for keyset pagination.",
+                "schema": {"type": "string", "enum": ["cursor"]},
+            },
+            *self.keyset_class().get_schema_operation_parameters(view),
+        ]
@@ -0,0 +1,25 @@
+"""
+Parsers for the portfolio API.
+"""
+
+from django.conf import settings
+
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from . import jsoncodec
+from .renderers import JSONRenderer
+
+
+class JSONParser(parsers.JSONParser):
+    """DRF's JSON parser decoding with jsoncodec.py."""
+
+    renderer_class = JSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        try:
+            return jsoncodec.loads(stream.read(), encoding, strict=self.strict)
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
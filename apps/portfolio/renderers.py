@@ -0,0 +1,79 @@
+"""
+Renderers for the portfolio API.
+"""
+
+import csv
+import io
+import json
+
+from rest_framework import renderers
+from rest_framework.utils import encoders
+
+from . import jsoncodec
+from .instrumentation import timed
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """DRF's JSON renderer encoding with jsoncodec.py, timed on instrumented requests."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with timed("render"):
+            if data is None:
+                return b""
+            indent = self.get_indent(accepted_media_type, renderer_context or {})
+            if indent is not None or self.ensure_ascii or not self.compact or not self.strict:
+                # Pretty printed (browsable API, "; indent=") or non-default output
+                return super().render(data, accepted_media_type, renderer_context)
+            return jsoncodec.dumps(data)
+
+
+def format_cell(value):
+    """Format a serialized value as a CSV cell: nested values are written as JSON."""
+    if value is None:
+        return ""
+    if isinstance(value, (bool, list, dict)):
+        return json.dumps(value, cls=encoders.JSONEncoder, ensure_ascii=False)
+    return value
+
+
+class NDJSONRenderer(renderers.BaseRenderer):
+    """Newline-delimited JSON: one object per line, streamable row by row (see export.py)."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        rows = data if isinstance(data, list) else [data]
+        return self.render_rows(rows, fields=None)
+
+    def render_header(self, fields):
+        return b""
+
+    def render_rows(self, rows, fields):
+        return b"".join(jsoncodec.dumps(row) + b"\n" for row in rows)
+
+
+class CSVRenderer(renderers.BaseRenderer):
+    """CSV with a header row, streamable row by row (see export.py)."""
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        rows = data if isinstance(data, list) else [data]
+        fields = list(rows[0]) if rows else []
+        return (self.render_header(fields) + self.render_rows(rows, fields)).encode()
+
+    def render_header(self, fields):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(fields)
+        return buffer.getvalue()
+
+    def render_rows(self, rows, fields):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([format_cell(row.get(field)) for field in fields])
+        return buffer.getvalue()
@@ -0,0 +1,150 @@
+"""
+Revocation of JWT tokens.
+
+Revoked tokens are kept in the cache ``API_AUTH_REVOCATION_CACHE_ALIAS``,
+shared by the workers (use Redis in production: locmem is per process):
+
+- ``auth:revoked:<jti>`` marks a revoked token until it expires;
+- tokens are grouped by expiry in windows of ``API_AUTH_REVOCATION_WINDOW``
+  seconds, and each window has a log of its revoked ``jti``: an atomic
+  counter and one key per entry, expiring with the window.
+
+Each worker replays the logs into one Bloom filter per window, at most every
+``API_AUTH_REVOCATION_SYNC_INTERVAL`` seconds. Checking a token tests the
+filter of its window in memory, and only a possible match reads the exact key
+to rule out false positives: the cost is constant and almost always without
+any cache access. Windows are dropped once their tokens have expired, so the
+filters stay small (``API_AUTH_REVOCATION_CAPACITY`` revocations per window
+for a 1% false positive rate; more revocations only cost more exact reads).
+"""
+
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+from rest_framework_simplejwt.settings import api_settings
+
+# Bloom filter false positive rate at capacity
+ERROR_RATE = 0.01
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter of strings, with ``k`` bit positions derived from one BLAKE2 digest."""
+
+    def __init__(self, capacity, error_rate=ERROR_RATE):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def add(self, value):
+        for position in self.positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self.positions(value))
+
+
+class WindowFilter:
+    """The Bloom filter of one window and the number of log entries replayed into it."""
+
+    def __init__(self):
+        self.bloom = BloomFilter(settings.API_AUTH_REVOCATION_CAPACITY)
+        self.count = 0
+        # Counter value read at the last sync
+        self.seen = 0
+        self.synced_at = None
+
+
+class RevocationList:
+    """Revoke tokens and check them against the revocations of every worker (see the module docstring)."""
+
+    def __init__(self):
+        self.filters = {}
+        self.lock = threading.Lock()
+
+    @property
+    def cache(self):
+        return caches[settings.API_AUTH_REVOCATION_CACHE_ALIAS]
+
+    def window(self, token):
+        return token["exp"] // settings.API_AUTH_REVOCATION_WINDOW
+
+    def log_timeout(self, window):
+        """Seconds until every token of ``window`` has expired."""
+        return max(1, math.ceil((window + 1) * settings.API_AUTH_REVOCATION_WINDOW - time.time()))
+
+    def revoke(self, token):
+        """Revoke ``token`` until it expires."""
+        jti = token[api_settings.JTI_CLAIM]
+        timeout = math.ceil(token["exp"] - time.time())
+        if timeout <= 0:
+            return
+        cache = self.cache
+        cache.set(f"auth:revoked:{jti}", True, timeout)
+
+        window = self.window(token)
+        counter = f"auth:revocations:{window}"
+        log_timeout = self.log_timeout(window)
+        cache.add(counter, 0, log_timeout)
+        cache.set(f"{counter}:{cache.incr(counter)}", jti, log_timeout)
+        with self.lock:
+            self.get_filter(window).bloom.add(jti)
+
+    def is_revoked(self, token):
+        jti = token[api_settings.JTI_CLAIM]
+        window = self.window(token)
+        with self.lock:
+            window_filter = self.get_filter(window)
+            synced_at = window_filter.synced_at
+            if synced_at is None or time.monotonic() - synced_at >= settings.API_AUTH_REVOCATION_SYNC_INTERVAL:
+                window_filter = self.sync(window, window_filter)
+            maybe_revoked = jti in window_filter.bloom
+        return maybe_revoked and self.cache.get(f"auth:revoked:{jti}") is not None
+
+    def get_filter(self, window):
+        window_filter = self.filters.get(window)
+        if window_filter is None:
+            # The tokens of past windows have expired
+            current = int(time.time()) // settings.API_AUTH_REVOCATION_WINDOW
+            self.filters = {key: value for key, value in self.filters.items() if key >= current}
+            window_filter = self.filters[window] = WindowFilter()
+        return window_filter
+
+    def sync(self, window, window_filter):
+        """Replay the log entries of ``window`` added since the last sync and return the filter."""
+        counter = f"auth:revocations:{window}"
+        count = self.cache.get(counter, 0)
+        if count < window_filter.count:
+            # The cache lost the log: start over
+            window_filter = self.filters[window] = WindowFilter()
+        if count > window_filter.count:
+            keys = [f"{counter}:{number}" for number in range(window_filter.count + 1, count + 1)]
+            entries = self.cache.get_many(keys)
+            for number, key in enumerate(keys, window_filter.count + 1):
+                if key in entries:
+                    window_filter.bloom.add(entries[key])
+                elif number > window_filter.seen:
+                    # Counted but not written yet: read again at the next sync
+                    break
+                # Entries still missing a sync later were evicted and are skipped
+                window_filter.count = number
+        window_filter.seen = count
+        window_filter.synced_at = time.monotonic()
+        return window_filter
+
+    def clear(self):
+        """Forget the local filters (the revocations stay in the cache)."""
+        with self.lock:
+            self.filters = {}
+
+
+revocations = RevocationList()
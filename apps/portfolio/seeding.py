@@ -0,0 +1,327 @@
+"""
+Synthetic portfolio data at scale.
+
+``generate`` creates users named ``<prefix>_<n>`` with a profile and a given
+number of projects, blog posts, skills, experiences and education entries
+each. Rows are inserted in batches with ``bulk_create``, or with ``COPY`` on
+PostgreSQL, so millions of rows load in minutes.
+
+Content only depends on the seed and the user index: a dataset grown from 10
+to 20 users holds the same first 10 portfolios. Bulk inserts skip ``save()``
+and the post_save signals, so the tag/technology relations are built here and
+the response cache generations are bumped at the end. Generated rows have no
+images, hence no derivatives to schedule.
+"""
+
+import io
+import json
+import random
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+
+from .cache import bump_generation
+from .models import (
+    BlogPost,
+    BlogPostTag,
+    Education,
+    Experience,
+    ExperienceTechnology,
+    Project,
+    ProjectTag,
+    ProjectTechnology,
+    Skill,
+    Tag,
+    Technology,
+    UserProfile,
+    normalize_term,
+    split_terms,
+)
+from .signals import CACHED_MODELS
+
+User = get_user_model()
+
+# Rows per INSERT statement, or per COPY
+BATCH_SIZE = 5000
+
+# Dates are computed from a fixed day so that datasets are reproducible
+REFERENCE_DATE = date(2025, 1, 1)
+
+TAGS = ["django", "python", "api", "performance", "devops", "react", "postgres", "testing", "cloud", "security"]
+TECHNOLOGIES = ["Django", "PostgreSQL", "Redis", "Docker", "React", "Vue.js", "Celery", "AWS", "Nginx", "Kubernetes"]
+WORDS = (
+    "build scalable resilient fast api service database cache query index worker queue deploy monitor "
+    "profile benchmark latency throughput request response server client stream batch"
+).split()
+
+
+def sentence(rng, words=12):
+    return " ".join(rng.choices(WORDS, k=words)).capitalize() + "."
+
+
+def paragraph(rng, sentences=8):
+    return " ".join(sentence(rng) for _ in range(sentences))
+
+
+def terms(rng, choices, count=3):
+    return ", ".join(rng.sample(choices, count))
+
+
+def build_portfolio(user, index, counts, rng):
+    """Return the unsaved rows of the portfolio of ``user``, by model."""
+    rows = {
+        UserProfile: [
+            UserProfile(
+                user=user,
+                first_name="Seed",
+                last_name=f"User {index}",
+                bio=paragraph(rng),
+                email=user.email,
+                location="Paris, France",
+                job_title=rng.choice(["Backend Developer", "Full-Stack Developer", "Site Reliability Engineer"]),
+                company="Benchmark Inc.",
+            )
+        ]
+    }
+
+    projects = counts["projects"]
+    rows[Project] = [
+        Project(
+            user=user,
+            title=f"Project {index}-{i}",
+            slug=f"{user.username}-project-{i}".replace("_", "-"),
+            description=paragraph(rng),
+            short_description=sentence(rng),
+            tags=terms(rng, TAGS),
+            technologies=terms(rng, TECHNOLOGIES),
+            start_date=REFERENCE_DATE - timedelta(days=30 * (projects - i)),
+            is_featured=i % 5 == 0,
+            is_published=i % 10 != 9,
+            order=i,
+        )
+        for i in range(projects)
+    ]
+
+    posts = counts["posts"]
+    published = datetime.combine(REFERENCE_DATE, datetime.min.time(), tzinfo=dt_timezone.utc)
+    rows[BlogPost] = [
+        BlogPost(
+            author=user,
+            title=f"Post {index}-{i}",
+            slug=f"{user.username}-post-{i}".replace("_", "-"),
+            excerpt=sentence(rng),
+            content="\n\n".join(paragraph(rng) for _ in range(5)),
+            status="draft" if i % 10 == 9 else "published",
+            published_at=published - timedelta(days=posts - i, minutes=index),
+            tags=terms(rng, TAGS),
+            views_count=rng.randrange(1000),
+            is_featured=i % 5 == 0,
+        )
+        for i in range(posts)
+    ]
+
+    rows[Skill] = [
+        Skill(
+            user=user,
+            name=f"Skill {i}",
+            category=Skill.CATEGORY_CHOICES[i % len(Skill.CATEGORY_CHOICES)][0],
+            proficiency=rng.choice(Skill.PROFICIENCY_CHOICES)[0],
+            level=rng.randint(1, 10),
+            description=sentence(rng),
+            years_of_experience=rng.randint(1, 15),
+            is_featured=i % 3 == 0,
+            order=i,
+        )
+        for i in range(counts["skills"])
+    ]
+
+    experiences = counts["experiences"]
+    rows[Experience] = [
+        Experience(
+            user=user,
+            company=f"Company {i}",
+            position=rng.choice(["Developer", "Senior Developer", "Tech Lead"]),
+            description=paragraph(rng),
+            start_date=REFERENCE_DATE - timedelta(days=365 * (experiences - i)),
+            end_date=None if i == experiences - 1 else REFERENCE_DATE - timedelta(days=365 * (experiences - i - 1)),
+            is_current=i == experiences - 1,
+            technologies=terms(rng, TECHNOLOGIES),
+            order=i,
+        )
+        for i in range(experiences)
+    ]
+
+    rows[Education] = [
+        Education(
+            user=user,
+            institution=f"University {i}",
+            degree="Master of Science",
+            field_of_study="Computer Science",
+            description=sentence(rng),
+            start_date=REFERENCE_DATE - timedelta(days=365 * (10 + i)),
+            end_date=REFERENCE_DATE - timedelta(days=365 * (8 + i)),
+            order=i,
+        )
+        for i in range(counts["education"])
+    ]
+    return rows
+
+
+def copy_value(value):
+    """Format ``value`` for COPY's text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def copy_insert(model, objs):
+    """Insert ``objs`` with COPY, allocating their primary keys from the table's sequence first."""
+    if not objs:
+        return
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s)",
+            [table, model._meta.pk.column, len(objs)],
+        )
+        for obj, (pk,) in zip(objs, cursor.fetchall()):
+            obj.pk = pk
+
+        fields = model._meta.concrete_fields
+        buffer = io.StringIO()
+        for obj in objs:
+            obj._prepare_related_fields_for_save(operation_name="copy_insert")
+            # pre_save() fills auto_now fields like bulk_create() does
+            buffer.write("\t".join(copy_value(field.pre_save(obj, True)) for field in fields) + "\n")
+        buffer.seek(0)
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+        cursor.copy_expert(f"COPY {connection.ops.quote_name(table)} ({columns}) FROM STDIN", buffer)
+        for obj in objs:
+            obj._state.adding = False
+
+
+class Loader:
+    """Insert rows with ``bulk_create`` or ``COPY``, creating missing tags and technologies on the way."""
+
+    def __init__(self, batch_size=BATCH_SIZE, use_copy=False):
+        self.batch_size = batch_size
+        self.use_copy = use_copy
+        self.terms = {Tag: {}, Technology: {}}
+
+    def insert(self, model, objs):
+        if self.use_copy:
+            copy_insert(model, objs)
+        else:
+            model.objects.bulk_create(objs, batch_size=self.batch_size)
+
+    def get_terms(self, term_model, names):
+        """Return ``{name: term id}`` for ``names``, creating the missing terms."""
+        known = self.terms[term_model]
+        missing = [name for name in dict.fromkeys(names) if name not in known]
+        if missing:
+            term_model.objects.bulk_create(
+                [term_model(name=name, normalized_name=normalize_term(name)) for name in missing],
+                batch_size=self.batch_size,
+                ignore_conflicts=True,
+            )
+            known.update(term_model.objects.filter(name__in=missing).values_list("name", "pk"))
+        return known
+
+    def link_terms(self, instances, source_field, through, owner_field, term_field):
+        """Build the term relation of ``instances`` like ``models.sync_terms`` does."""
+        names = {
+            instance.pk: list(dict.fromkeys(split_terms(getattr(instance, source_field)))) for instance in instances
+        }
+        term_model = through._meta.get_field(term_field).related_model
+        ids = self.get_terms(term_model, [name for values in names.values() for name in values])
+        self.insert(
+            through,
+            [
+                through(**{f"{owner_field}_id": pk, f"{term_field}_id": ids[name], "position": position})
+                for pk, values in names.items()
+                for position, name in enumerate(values)
+            ],
+        )
+
+
+def generate(
+    users,
+    projects=5,
+    posts=5,
+    skills=5,
+    experiences=3,
+    education=2,
+    seed=0,
+    prefix="seed_user",
+    batch_size=BATCH_SIZE,
+    use_copy=False,
+    progress=None,
+):
+    """
+    Create the first ``users`` synthetic portfolios that do not exist yet.
+
+    ``progress`` is called with the number of users handled so far after each
+    batch. Returns the number of rows created per model.
+    """
+    if use_copy and connection.vendor != "postgresql":
+        raise ValueError("COPY loading requires PostgreSQL")
+
+    counts = {
+        "projects": projects,
+        "posts": posts,
+        "skills": skills,
+        "experiences": experiences,
+        "education": education,
+    }
+    rows_per_user = 1 + sum(counts.values())
+    users_per_batch = max(1, batch_size // rows_per_user)
+    existing = set(User.objects.filter(username__startswith=f"{prefix}_").values_list("username", flat=True))
+    # Generated users cannot log in: one unusable hash is enough
+    password = make_password(None)
+    loader = Loader(batch_size=batch_size, use_copy=use_copy)
+    created = {}
+
+    for start in range(0, users, users_per_batch):
+        indexes = [
+            index for index in range(start, min(users, start + users_per_batch)) if f"{prefix}_{index}" not in existing
+        ]
+        if not indexes:
+            continue
+
+        with transaction.atomic():
+            new_users = [
+                User(username=f"{prefix}_{index}", email=f"{prefix}_{index}@example.com", password=password)
+                for index in indexes
+            ]
+            loader.insert(User, new_users)
+
+            rows = {}
+            for user, index in zip(new_users, indexes):
+                rng = random.Random(f"{seed}-{index}")
+                for model, objs in build_portfolio(user, index, counts, rng).items():
+                    rows.setdefault(model, []).extend(objs)
+            for model, objs in rows.items():
+                loader.insert(model, objs)
+
+            loader.link_terms(rows[Project], "tags", ProjectTag, "project", "tag")
+            loader.link_terms(rows[Project], "technologies", ProjectTechnology, "project", "technology")
+            loader.link_terms(rows[Experience], "technologies", ExperienceTechnology, "experience", "technology")
+            loader.link_terms(rows[BlogPost], "tags", BlogPostTag, "post", "tag")
+
+        created[User] = created.get(User, 0) + len(new_users)
+        for model, objs in rows.items():
+            created[model] = created.get(model, 0) + len(objs)
+        if progress:
+            progress(min(users, start + users_per_batch))
+
+    if created:
+        for model in CACHED_MODELS:
+            bump_generation(model)
+    return created
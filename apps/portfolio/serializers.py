@@ -3,9 +3,11 @@ Serializers for portfolio app.
 """
 
 from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
 
 from rest_framework import serializers
 
+from .compiled import CompiledRepresentationMixin
 from .models import (
     BlogPost,
     Education,
@@ -18,6 +20,27 @@ from .models import (
 User = get_user_model()
 
 
+class ImageSrcsetField(serializers.ReadOnlyField):
+    """
+    Render an image derivatives manifest (see images.py) as ``srcset`` strings.
+
+    Returns one ``{"type", "srcset"}`` source per MIME type, in order of
+    preference, or None until the derivatives have been generated.
+    """
+
+    def to_representation(self, manifest):
+        if not manifest or not manifest.get("variants"):
+            return None
+        request = self.context.get("request")
+        candidates = {}
+        for variant in manifest["variants"]:
+            url = default_storage.url(variant["name"])
+            if request is not None:
+                url = request.build_absolute_uri(url)
+            candidates.setdefault(variant["type"], []).append(f"{url} {variant['width']}w")
+        return [{"type": mime_type, "srcset": ", ".join(urls)} for mime_type, urls in candidates.items()]
+
+
 class UserSerializer(serializers.ModelSerializer):
     """User serializer."""
 
@@ -31,6 +54,7 @@ class UserProfileSerializer(serializers.ModelSerializer):
     """User profile serializer."""
 
     full_name = serializers.ReadOnlyField()
+    profile_photo_srcset = ImageSrcsetField(source="profile_photo_variants")
     user = UserSerializer(read_only=True)
 
     class Meta:
@@ -43,6 +67,7 @@ class UserProfileSerializer(serializers.ModelSerializer):
             "full_name",
             "bio",
             "profile_photo",
+            "profile_photo_srcset",
             "email",
             "phone",
             "location",
@@ -59,10 +84,11 @@ class UserProfileSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at", "full_name"]
 
 
-class UserProfileListSerializer(serializers.ModelSerializer):
+class UserProfileListSerializer(CompiledRepresentationMixin, serializers.ModelSerializer):
     """Simplified user profile serializer for list views."""
 
     full_name = serializers.ReadOnlyField()
+    profile_photo_srcset = ImageSrcsetField(source="profile_photo_variants")
 
     class Meta:
         model = UserProfile
@@ -73,9 +99,11 @@ class UserProfileListSerializer(serializers.ModelSerializer):
             "full_name",
             "bio",
             "profile_photo",
+            "profile_photo_srcset",
             "job_title",
             "company",
         ]
+        column_dependencies = {"full_name": ["first_name", "last_name"]}
 
 
 class ProjectSerializer(serializers.ModelSerializer):
@@ -83,6 +111,7 @@ class ProjectSerializer(serializers.ModelSerializer):
 
     tag_list = serializers.ReadOnlyField()
     technology_list = serializers.ReadOnlyField()
+    image_srcset = ImageSrcsetField(source="image_variants")
     user_name = serializers.CharField(source="user.username", read_only=True)
 
     class Meta:
@@ -94,6 +123,7 @@ class ProjectSerializer(serializers.ModelSerializer):
             "description",
             "short_description",
             "image",
+            "image_srcset",
             "project_url",
             "github_url",
             "demo_url",
@@ -118,11 +148,12 @@ class ProjectSerializer(serializers.ModelSerializer):
         return value.lower()
 
 
-class ProjectListSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(CompiledRepresentationMixin, serializers.ModelSerializer):
     """Simplified project serializer for list views."""
 
     tag_list = serializers.ReadOnlyField()
     technology_list = serializers.ReadOnlyField()
+    image_srcset = ImageSrcsetField(source="image_variants")
 
     class Meta:
         model = Project
@@ -132,6 +163,7 @@ class ProjectListSerializer(serializers.ModelSerializer):
             "slug",
             "short_description",
             "image",
+            "image_srcset",
             "tag_list",
             "technology_list",
             "is_featured",
@@ -139,6 +171,7 @@ class ProjectListSerializer(serializers.ModelSerializer):
             "start_date",
             "created_at",
         ]
+        column_dependencies = {"tag_list": [], "technology_list": []}
 
 
 class ExperienceSerializer(serializers.ModelSerializer):
@@ -168,6 +201,7 @@ class ExperienceSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["id", "created_at", "updated_at", "technology_list"]
+        column_dependencies = {"technology_list": []}
 
     def validate(self, data):
         """Validate that end_date is after start_date if provided."""
@@ -252,7 +286,7 @@ class SkillSerializer(serializers.ModelSerializer):
         return value
 
 
-class SkillListSerializer(serializers.ModelSerializer):
+class SkillListSerializer(CompiledRepresentationMixin, serializers.ModelSerializer):
     """Simplified skill serializer for list views."""
 
     proficiency_display = serializers.CharField(source="get_proficiency_display", read_only=True)
@@ -275,6 +309,7 @@ class BlogPostSerializer(serializers.ModelSerializer):
     """Blog post serializer."""
 
     tag_list = serializers.ReadOnlyField()
+    featured_image_srcset = ImageSrcsetField(source="featured_image_variants")
     author_name = serializers.CharField(source="author.username", read_only=True)
     status_display = serializers.CharField(source="get_status_display", read_only=True)
 
@@ -287,6 +322,7 @@ class BlogPostSerializer(serializers.ModelSerializer):
             "excerpt",
             "content",
             "featured_image",
+            "featured_image_srcset",
             "status",
             "status_display",
             "published_at",
@@ -309,10 +345,11 @@ class BlogPostSerializer(serializers.ModelSerializer):
         return value.lower()
 
 
-class BlogPostListSerializer(serializers.ModelSerializer):
+class BlogPostListSerializer(CompiledRepresentationMixin, serializers.ModelSerializer):
     """Simplified blog post serializer for list views."""
 
     tag_list = serializers.ReadOnlyField()
+    featured_image_srcset = ImageSrcsetField(source="featured_image_variants")
     author_name = serializers.CharField(source="author.username", read_only=True)
 
     class Meta:
@@ -323,6 +360,7 @@ class BlogPostListSerializer(serializers.ModelSerializer):
             "slug",
             "excerpt",
             "featured_image",
+            "featured_image_srcset",
             "status",
             "published_at",
             "tag_list",
@@ -332,3 +370,23 @@ class BlogPostListSerializer(serializers.ModelSerializer):
             "author_name",
             "created_at",
         ]
+        column_dependencies = {"tag_list": []}
+
+
+class PortfolioBundleSerializer(serializers.ModelSerializer):
+    """
+    Complete public portfolio of a user, rendered as a single document.
+
+    Expects the related lists to be prefetched as in PortfolioBundleViewSet.
+    """
+
+    profile = UserProfileSerializer(read_only=True, allow_null=True)
+    projects = ProjectListSerializer(source="published_projects", many=True, read_only=True)
+    experiences = ExperienceSerializer(many=True, read_only=True)
+    education = EducationSerializer(many=True, read_only=True)
+    skills = SkillListSerializer(source="featured_skills", many=True, read_only=True)
+    blog_posts = BlogPostListSerializer(source="recent_posts", many=True, read_only=True)
+
+    class Meta:
+        model = User
+        fields = ["id", "username", "profile", "projects", "experiences", "education", "skills", "blog_posts"]
@@ -0,0 +1,75 @@
+"""
+Signal handlers for portfolio app.
+"""
+
+from functools import partial
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from .cache import bump_generation
+from .images import schedule_derivatives
+from .models import (
+    BlogPost,
+    Education,
+    Experience,
+    Project,
+    Skill,
+    Tag,
+    Technology,
+    UserProfile,
+    sync_terms,
+)
+
+User = get_user_model()
+
+# Models with comma-separated fields mirrored into normalized relations
+TERM_MODELS = [Project, Experience, BlogPost]
+
+# Models with image fields getting responsive derivatives
+IMAGE_MODELS = [UserProfile, Project, BlogPost]
+
+# Models whose writes invalidate cached API responses
+CACHED_MODELS = [User, UserProfile, Project, Experience, Education, Skill, BlogPost, Tag, Technology]
+
+
+def sync_term_relations(sender, instance, update_fields=None, raw=False, **kwargs):
+    """Mirror the comma-separated tags/technologies of ``instance`` into its relations."""
+    if raw:
+        return
+    for source_field, relation_name in instance.term_fields.items():
+        if update_fields is None or source_field in update_fields:
+            sync_terms(instance, source_field, relation_name)
+
+
+def generate_image_derivatives(sender, instance, update_fields=None, raw=False, **kwargs):
+    """Schedule derivative generation for the images of ``instance`` that changed."""
+    if raw:
+        return
+    for field_name, variants_field in instance.image_fields.items():
+        if update_fields is not None and field_name not in update_fields:
+            continue
+        file = getattr(instance, field_name)
+        manifest = getattr(instance, variants_field)
+        if (file.name or None) != manifest.get("source"):
+            schedule_derivatives(instance, field_name)
+
+
+def invalidate_response_cache(sender, **kwargs):
+    """Bump the cache generation of the model that was written, once the write is committed."""
+    # Bumped before the commit, concurrent requests could still read the old
+    # rows and cache them under the new generation
+    transaction.on_commit(partial(bump_generation, sender))
+
+
+# Connected first so that relations are up to date before caches are invalidated
+for model in TERM_MODELS:
+    post_save.connect(sync_term_relations, sender=model, dispatch_uid=f"terms-{model._meta.label_lower}")
+
+for model in IMAGE_MODELS:
+    post_save.connect(generate_image_derivatives, sender=model, dispatch_uid=f"images-{model._meta.label_lower}")
+
+for model in CACHED_MODELS:
+    post_save.connect(invalidate_response_cache, sender=model, dispatch_uid=f"cache-save-{model._meta.label_lower}")
+    post_delete.connect(invalidate_response_cache, sender=model, dispatch_uid=f"cache-delete-{model._meta.label_lower}")
@@ -0,0 +1,142 @@
+"""
+Database-backed background task queue.
+
+Functions registered with ``@task`` are enqueued as ``Task`` rows, inside the
+caller's transaction: a task only becomes visible to workers if the write that
+produced it commits. Workers (``manage.py run_worker``) claim runnable tasks in
+priority order with ``SELECT ... FOR UPDATE SKIP LOCKED``, so any number of
+worker processes and threads can share the table without claiming the same
+row twice. Failed tasks are retried with exponential backoff, then kept with
+status ``failed`` for inspection; tasks left running by a dead worker are
+requeued once their lock expires. Succeeded tasks are deleted.
+
+With ``TASK_QUEUE_EAGER``, tasks run in-process right after the transaction
+commits instead (development without a worker, tests).
+"""
+
+import logging
+import traceback
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Task
+
+logger = logging.getLogger(__name__)
+
+# Registered task name -> function
+TASKS = {}
+
+
+def task(name):
+    """Register the decorated function as the task ``name``."""
+
+    def decorator(func):
+        if name in TASKS:
+            raise ValueError(f"Task {name!r} is already registered")
+        TASKS[name] = func
+        func.task_name = name
+        return func
+
+    return decorator
+
+
+def run_eager(name, kwargs):
+    try:
+        TASKS[name](**kwargs)
+    except Exception:
+        logger.exception("Task %s failed", name)
+
+
+def enqueue(func, *, priority=0, delay=0, max_attempts=None, **kwargs):
+    """
+    Queue a call of the registered task ``func`` (function or name) with ``kwargs``.
+
+    ``kwargs`` must be JSON serializable. Returns the Task, or None in eager mode.
+    """
+    name = getattr(func, "task_name", func)
+    if name not in TASKS:
+        raise ValueError(f"Unknown task {name!r}")
+
+    if settings.TASK_QUEUE_EAGER:
+        transaction.on_commit(partial(run_eager, name, kwargs))
+        return None
+    return Task.objects.create(
+        name=name,
+        kwargs=kwargs,
+        priority=priority,
+        run_after=timezone.now() + timedelta(seconds=delay),
+        max_attempts=max_attempts or settings.TASK_MAX_ATTEMPTS,
+    )
+
+
+def claim(worker):
+    """Lock the next runnable task for ``worker`` and mark it running, or return None."""
+    now = timezone.now()
+    with transaction.atomic():
+        task = (
+            Task.objects.select_for_update(skip_locked=True)
+            .filter(status="queued", run_after__lte=now)
+            .order_by("-priority", "run_after", "id")
+            .first()
+        )
+        if task is None:
+            return None
+        task.status = "running"
+        task.locked_by = worker
+        task.locked_at = now
+        task.attempts += 1
+        task.save(update_fields=["status", "locked_by", "locked_at", "attempts", "updated_at"])
+    return task
+
+
+def retry_or_fail(task, error):
+    """Record the failure of ``task`` and schedule its retry if attempts remain."""
+    task.last_error = error
+    task.locked_by = ""
+    task.locked_at = None
+    if task.attempts < task.max_attempts:
+        task.status = "queued"
+        task.run_after = timezone.now() + timedelta(seconds=settings.TASK_RETRY_DELAY * 2 ** (task.attempts - 1))
+    else:
+        task.status = "failed"
+    task.save(update_fields=["status", "run_after", "locked_by", "locked_at", "last_error", "updated_at"])
+
+
+def execute(task):
+    """Run a claimed task; return True on success."""
+    func = TASKS.get(task.name)
+    try:
+        if func is None:
+            raise LookupError(f"Unknown task {task.name!r}")
+        func(**task.kwargs)
+    except Exception:
+        logger.exception("Task %s #%s failed (attempt %s/%s)", task.name, task.pk, task.attempts, task.max_attempts)
+        retry_or_fail(task, traceback.format_exc())
+        return False
+    task.delete()
+    return True
+
+
+def requeue_expired():
+    """Release tasks whose worker died while running them; return how many were released."""
+    expired = Task.objects.filter(
+        status="running", locked_at__lt=timezone.now() - timedelta(seconds=settings.TASK_LOCK_TIMEOUT)
+    )
+    released = {"locked_by": "", "locked_at": None, "last_error": "Lock expired", "updated_at": timezone.now()}
+    requeued = expired.filter(attempts__lt=F("max_attempts")).update(status="queued", **released)
+    failed = expired.update(status="failed", **released)
+    return requeued + failed
+
+
+def run_next(worker):
+    """Claim and run one task; return False if none was runnable."""
+    task = claim(worker)
+    if task is None:
+        return False
+    execute(task)
+    return True
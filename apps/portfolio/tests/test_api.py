@@ -8,6 +8,8 @@ from rest_framework import status
 
 import pytest
 
+from apps.portfolio.models import Tag
+
 
 @pytest.mark.django_db
 @pytest.mark.api
@@ -94,6 +96,45 @@ class TestProjectAPI:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) >= 1
 
+    def test_filter_projects_by_tag(self, api_client, project):
+        """Test filtering projects by tag, case-insensitively."""
+        url = reverse("portfolio:project-list")
+
+        assert api_client.get(url, {"tag": "Django"}).data["count"] == 1
+        assert api_client.get(url, {"tag": "flask"}).data["count"] == 0
+
+    def test_filter_projects_by_case_variant_tags(self, api_client, project):
+        """Test that tags differing only by case match each project once."""
+        project.tags = "Python, python, PYTHON"
+        project.save()
+        url = reverse("portfolio:project-list")
+        response = api_client.get(url, {"tag": "python"})
+
+        assert response.data["count"] == 1
+        assert [item["slug"] for item in response.data["results"]] == [project.slug]
+
+    def test_filter_projects_by_technology(self, api_client, project):
+        """Test filtering projects by technology."""
+        url = reverse("portfolio:project-list")
+        response = api_client.get(url, {"technology": "postgresql"})
+
+        assert response.data["count"] == 1
+        assert response.data["results"][0]["technology_list"] == ["Django", "PostgreSQL", "Docker"]
+
+    def test_list_projects_prefetches_terms(self, api_client, user, django_assert_num_queries):
+        """Test that tags and technologies cost a fixed number of queries per page."""
+        from apps.portfolio.models import Project
+
+        for i in range(5):
+            Project.objects.create(
+                user=user, title=f"P{i}", slug=f"p{i}", description="D", tags="a, b", technologies="c, d"
+            )
+        url = reverse("portfolio:project-list")
+
+        # validators (see conditional.py) + count + page + tags + technologies
+        with django_assert_num_queries(5):
+            api_client.get(url)
+
     def test_filter_published_projects(self, api_client, project):
         """Test filtering published projects."""
         url = reverse("portfolio:project-list")
@@ -185,6 +226,53 @@ class TestSkillAPI:
         assert response.status_code == status.HTTP_200_OK
         assert isinstance(response.data, dict)
 
+    def test_skills_by_category_groups_in_one_query(self, api_client, user, django_assert_num_queries):
+        """Test that by_category groups skills with a single query."""
+        from apps.portfolio.models import Skill
+
+        for i in range(6):
+            Skill.objects.create(user=user, name=f"Skill {i}", category=["tool", "database", "language"][i % 3])
+        url = reverse("portfolio:skill-by-category")
+
+        with django_assert_num_queries(1):
+            response = api_client.get(url)
+
+        assert list(response.data) == ["Database", "Language", "Tool"]
+        assert [item["name"] for item in response.data["Tool"]] == ["Skill 0", "Skill 3"]
+
+    def test_skills_by_category_honours_filters(self, api_client, user, skill):
+        """Test that by_category applies the list filters."""
+        from django.contrib.auth import get_user_model
+
+        from apps.portfolio.models import Skill
+
+        other = get_user_model().objects.create_user(username="other", password="pass12345")
+        Skill.objects.create(user=other, name="Rust", category="programming")
+        url = reverse("portfolio:skill-by-category")
+        response = api_client.get(url, {"user": user.pk})
+
+        assert [item["name"] for item in response.data["Programming"]] == ["Python"]
+
+    def test_skills_by_category_limit(self, api_client, user):
+        """Test limiting the number of skills per category."""
+        from apps.portfolio.models import Skill
+
+        for i in range(4):
+            Skill.objects.create(user=user, name=f"Tool {i}", category="tool", order=i)
+        Skill.objects.create(user=user, name="English", category="language")
+        url = reverse("portfolio:skill-by-category")
+        response = api_client.get(url, {"limit": 2})
+
+        assert [item["name"] for item in response.data["Tool"]] == ["Tool 0", "Tool 1"]
+        assert [item["name"] for item in response.data["Language"]] == ["English"]
+
+    def test_skills_by_category_invalid_limit(self, api_client, skill):
+        """Test that a non-positive limit is rejected."""
+        url = reverse("portfolio:skill-by-category")
+        response = api_client.get(url, {"limit": "0"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_filter_skills_by_category(self, api_client, skill):
         """Test filtering skills by category."""
         url = reverse("portfolio:skill-list")
@@ -222,6 +310,13 @@ class TestBlogPostAPI:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) >= 1
 
+    def test_filter_blog_posts_by_tag(self, api_client, blog_post):
+        """Test filtering blog posts by tag."""
+        url = reverse("portfolio:blogpost-list")
+
+        assert api_client.get(url, {"tag": "testing"}).data["count"] == 1
+        assert api_client.get(url, {"tag": "docker"}).data["count"] == 0
+
     def test_increment_views(self, api_client, blog_post):
         """Test incrementing views count."""
         initial_views = blog_post.views_count
@@ -248,6 +343,97 @@ class TestBlogPostAPI:
         assert "draft-post" not in slugs
 
 
+@pytest.mark.django_db
+@pytest.mark.api
+class TestPortfolioBundleAPI:
+    """Test the aggregated portfolio bundle endpoint."""
+
+    def test_bundle_contains_every_section(
+        self, api_client, user, user_profile, project, experience, education, skill, blog_post
+    ):
+        """Test that the bundle assembles the whole portfolio."""
+        url = reverse("portfolio:user-bundle", kwargs={"username": user.username})
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["username"] == "testuser"
+        assert response.data["profile"]["full_name"] == "John Doe"
+        assert response.data["projects"][0]["tag_list"] == ["python", "django", "rest"]
+        assert response.data["experiences"][0]["user_name"] == "testuser"
+        assert response.data["education"][0]["institution"] == "University of Technology"
+        assert response.data["skills"][0]["name"] == "Python"
+        assert response.data["blog_posts"][0]["slug"] == "test-blog-post"
+
+    def test_bundle_only_exposes_public_content(self, api_client, user, project, skill):
+        """Test that unpublished projects, drafts and non-featured skills are left out."""
+        from apps.portfolio.models import BlogPost, Project, Skill
+
+        Project.objects.create(user=user, title="Hidden", slug="hidden", description="D", is_published=False)
+        BlogPost.objects.create(author=user, title="Draft", slug="draft", content="C", status="draft")
+        Skill.objects.create(user=user, name="Minor", is_featured=False)
+        url = reverse("portfolio:user-bundle", kwargs={"username": user.username})
+        response = api_client.get(url)
+
+        assert response.data["profile"] is None
+        assert [item["slug"] for item in response.data["projects"]] == ["test-project"]
+        assert response.data["blog_posts"] == []
+        assert [item["name"] for item in response.data["skills"]] == ["Python"]
+
+    def test_bundle_query_count_is_constant(self, api_client, user, user_profile, django_assert_num_queries):
+        """Test that the bundle costs a fixed number of queries regardless of content size."""
+        from datetime import date
+
+        from apps.portfolio.models import BlogPost, Education, Experience, Project, Skill
+
+        for i in range(5):
+            Project.objects.create(user=user, title=f"P{i}", slug=f"p{i}", description="D", tags="a", technologies="b")
+            Experience.objects.create(
+                user=user, company=f"C{i}", position="Dev", description="D", start_date=date(2020, 1, 1)
+            )
+            Education.objects.create(
+                user=user, institution=f"U{i}", degree="MSc", field_of_study="CS", start_date=date(2015, 1, 1)
+            )
+            Skill.objects.create(user=user, name=f"S{i}", is_featured=True)
+            BlogPost.objects.create(author=user, title=f"B{i}", slug=f"b{i}", content="C", status="published", tags="x")
+        url = reverse("portfolio:user-bundle", kwargs={"username": user.username})
+
+        with django_assert_num_queries(10):
+            api_client.get(url)
+
+    def test_bundle_is_invalidated_by_writes(self, api_client, user, skill, django_capture_on_commit_callbacks):
+        """Test that the cached bundle is rebuilt after a write to any section."""
+        url = reverse("portfolio:user-bundle", kwargs={"username": user.username})
+        api_client.get(url)
+        assert api_client.get(url)["X-Cache"] == "HIT"
+
+        with django_capture_on_commit_callbacks(execute=True):
+            skill.name = "Python 3"
+            skill.save()
+        response = api_client.get(url)
+
+        assert response["X-Cache"] == "MISS"
+        assert response.data["skills"][0]["name"] == "Python 3"
+
+    def test_bundle_is_invalidated_by_term_writes(self, api_client, user, project, django_capture_on_commit_callbacks):
+        """Test that deleting a tag, e.g. from the admin, rebuilds the cached bundle."""
+        url = reverse("portfolio:user-bundle", kwargs={"username": user.username})
+        api_client.get(url)
+        assert api_client.get(url)["X-Cache"] == "HIT"
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Tag.objects.get(normalized_name="rest").delete()
+        response = api_client.get(url)
+
+        assert response["X-Cache"] == "MISS"
+
+    def test_bundle_unknown_user(self, api_client, db):
+        """Test that an unknown username returns 404."""
+        url = reverse("portfolio:user-bundle", kwargs={"username": "nobody"})
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 @pytest.mark.django_db
 @pytest.mark.integration
 class TestHealthCheck:
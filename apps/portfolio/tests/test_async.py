@@ -0,0 +1,94 @@
+"""
+Tests for the async read path.
+"""
+
+from django.urls import reverse
+
+from rest_framework import status
+
+import pytest
+
+from apps.portfolio.models import BlogPost, Project
+
+
+@pytest.fixture
+def published(user, user_profile, project, experience, education, skill, blog_post):
+    """Create a complete public portfolio plus unpublished content."""
+    Project.objects.create(user=user, title="Hidden", slug="hidden", description="Draft", is_published=False)
+    BlogPost.objects.create(author=user, title="Draft", slug="draft", content="Draft", status="draft")
+    return user
+
+
+def assert_same_response(client, drf_url, async_url):
+    expected = client.get(drf_url)
+    response = client.get(async_url)
+    assert response.status_code == expected.status_code
+    assert response["Content-Type"] == "application/json"
+    # Pagination links point to the async endpoints
+    assert response.content == expected.content.replace(b"/api/portfolio/", b"/api/portfolio/async/")
+    return response
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestAsyncReadPath:
+    """Test that async endpoints mirror the anonymous DRF responses."""
+
+    def test_project_list(self, client, published):
+        response = assert_same_response(
+            client, reverse("portfolio:project-list"), reverse("portfolio:async-project-list")
+        )
+        assert [item["slug"] for item in response.json()["results"]] == ["test-project"]
+
+    def test_project_detail(self, client, published, project):
+        kwargs = {"slug": project.slug}
+        assert_same_response(
+            client,
+            reverse("portfolio:project-detail", kwargs=kwargs),
+            reverse("portfolio:async-project-detail", kwargs=kwargs),
+        )
+
+    def test_unpublished_project_is_404(self, client, published):
+        kwargs = {"slug": "hidden"}
+        response = assert_same_response(
+            client,
+            reverse("portfolio:project-detail", kwargs=kwargs),
+            reverse("portfolio:async-project-detail", kwargs=kwargs),
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_blog_list_and_detail(self, client, published, blog_post):
+        assert_same_response(client, reverse("portfolio:blogpost-list"), reverse("portfolio:async-blogpost-list"))
+        kwargs = {"slug": blog_post.slug}
+        assert_same_response(
+            client,
+            reverse("portfolio:blogpost-detail", kwargs=kwargs),
+            reverse("portfolio:async-blogpost-detail", kwargs=kwargs),
+        )
+
+    def test_bundle(self, client, published):
+        kwargs = {"username": published.username}
+        assert_same_response(
+            client,
+            reverse("portfolio:user-bundle", kwargs=kwargs),
+            reverse("portfolio:async-user-bundle", kwargs=kwargs),
+        )
+
+    def test_pagination_links(self, client, user):
+        for i in range(25):
+            Project.objects.create(user=user, title=f"P{i}", slug=f"p{i}", description="D", is_published=True, order=i)
+        for query in ["", "?page=2", "?page=3"]:
+            assert_same_response(
+                client,
+                reverse("portfolio:project-list") + query,
+                reverse("portfolio:async-project-list") + query,
+            )
+
+    def test_bundle_query_count(self, client, published, django_assert_max_num_queries):
+        with django_assert_max_num_queries(10):
+            response = client.get(reverse("portfolio:async-user-bundle", kwargs={"username": published.username}))
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_read_only(self, client, published):
+        response = client.post(reverse("portfolio:async-project-list"), {})
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
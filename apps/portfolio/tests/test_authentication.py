@@ -0,0 +1,108 @@
+"""
+Tests for the stateless JWT authentication.
+"""
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+
+import pytest
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.portfolio import authentication
+from apps.portfolio.authentication import ClaimsUser, token_cache
+from apps.portfolio.models import Project
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    token_cache.clear()
+
+
+@pytest.fixture
+def tokens(api_client, user):
+    response = api_client.post(reverse("token_obtain_pair"), {"username": "testuser", "password": "testpass123"})
+    return response.data
+
+
+def user_queries(queries):
+    return [query["sql"] for query in queries if "auth_user" in query["sql"]]
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestStatelessJWTAuthentication:
+    """Test the JWT authentication without user queries on reads."""
+
+    def test_tokens_carry_user_claims(self, tokens, user):
+        access = AccessToken(tokens["access"])
+        assert (access["user_id"], access["username"], access["is_staff"]) == (str(user.pk), "testuser", False)
+
+    def test_refreshed_tokens_keep_the_claims(self, api_client, tokens):
+        response = api_client.post(reverse("token_refresh"), {"refresh": tokens["refresh"]})
+        assert AccessToken(response.data["access"])["username"] == "testuser"
+
+    def test_reads_skip_the_user_query(self, api_client, tokens, user):
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(reverse("portfolio:project-list"))
+        assert response.status_code == status.HTTP_200_OK
+        assert user_queries(queries) == []
+
+        request_user = response.wsgi_request.user
+        assert isinstance(request_user, ClaimsUser)
+        assert (request_user.pk, request_user.username) == (user.pk, "testuser")
+
+    def test_writes_load_the_user(self, api_client, tokens, user):
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        item = {"title": "A", "slug": "a", "description": "x", "tags": "api", "technologies": "Redis"}
+        response = api_client.post(reverse("portfolio:project-list"), item, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Project.objects.get(slug="a").user == user
+
+    def test_inactive_users_cannot_write(self, api_client, tokens, user):
+        user.is_active = False
+        user.save()
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        response = api_client.post(reverse("portfolio:skill-list"), {"name": "Go"}, format="json")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_tokens_without_claims_load_the_user(self, api_client, user):
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(reverse("portfolio:project-list"))
+        assert response.status_code == status.HTTP_200_OK
+        assert len(user_queries(queries)) == 1
+
+    def test_verified_tokens_are_cached(self, api_client, tokens, monkeypatch):
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        api_client.get(reverse("portfolio:project-list"))
+        assert len(token_cache) == 1
+
+        monkeypatch.setattr(AccessToken, "__init__", lambda *args, **kwargs: pytest.fail("Token decoded again"))
+        assert api_client.get(reverse("portfolio:project-list")).status_code == status.HTTP_200_OK
+
+    def test_cached_tokens_expire(self, api_client, tokens, monkeypatch):
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        api_client.get(reverse("portfolio:project-list"))
+
+        later = authentication.aware_utcnow() + timedelta(days=1)
+        monkeypatch.setattr(authentication, "aware_utcnow", lambda: later)
+        assert api_client.get(reverse("portfolio:project-list")).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_invalid_tokens(self, api_client, tokens):
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}x")
+        assert api_client.get(reverse("portfolio:project-list")).status_code == status.HTTP_401_UNAUTHORIZED
+        assert len(token_cache) == 0
+
+    def test_cache_is_bounded(self, settings, user):
+        settings.API_AUTH_TOKEN_CACHE_SIZE = 2
+        auth = authentication.StatelessJWTAuthentication()
+        raw = [str(AccessToken.for_user(user)).encode() for _ in range(3)]
+        for token in raw:
+            auth.get_validated_token(token)
+        assert len(token_cache) == 2
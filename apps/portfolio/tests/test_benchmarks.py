@@ -0,0 +1,67 @@
+"""
+Tests for the benchmark suite helpers.
+"""
+
+from django.contrib.auth import get_user_model
+
+import pytest
+
+from apps.portfolio.models import BlogPost, Project, Skill
+from benchmarks import json_codec
+from benchmarks.dataset import seed
+from benchmarks.suite import compare, get_endpoints, measure_in_process
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestBenchmarkSuite:
+    """Test the dataset generator and the endpoint measurements."""
+
+    def test_seed_is_incremental(self):
+        assert seed(2, 3) == 2
+        assert seed(3, 3) == 1
+        assert User.objects.filter(username__startswith="bench_user_").count() == 3
+        assert Project.objects.count() == BlogPost.objects.count() == Skill.objects.count() == 9
+
+    def test_seed_is_deterministic(self):
+        seed(1, 2, seed=7)
+        first = list(Project.objects.values_list("description", "tags"))
+        User.objects.filter(username__startswith="bench_user_").delete()
+        seed(1, 2, seed=7)
+        assert list(Project.objects.values_list("description", "tags")) == first
+
+    def test_endpoints_cover_router_actions(self):
+        seed(1, 2)
+        endpoints = get_endpoints()
+        for name in ("projects-featured", "experiences-current", "skills-by_category", "users-bundle"):
+            assert name in endpoints
+        assert endpoints["projects-search"] == "/api/portfolio/projects/?search=django"
+        # Detail lookups only use content visible to anonymous clients
+        project = Project.objects.filter(is_published=True).first()
+        assert endpoints["projects-detail"] == f"/api/portfolio/projects/{project.slug}/"
+
+    def test_measure_in_process(self):
+        seed(1, 2)
+        endpoints = get_endpoints()
+        results = measure_in_process(endpoints, iterations=2)
+        assert results.keys() == endpoints.keys()
+        assert all(result["queries"] > 0 and result["requests"] == 2 for result in results.values())
+
+    def test_json_codec(self):
+        seed(1, 2)
+        payloads = json_codec.get_payloads()
+        assert payloads.keys() == json_codec.PAYLOADS.keys()
+        assert len(payloads["profile"]) == 1 and len(payloads["blogpost"]) == 2
+        results = json_codec.measure(payloads, iterations=1)
+        for result in results.values():
+            assert all(result[codec]["identical"] for codec in json_codec.get_codecs())
+            assert result["drf"]["render"] > 0
+
+    def test_compare(self):
+        baseline = {"in_process": {"projects-list": {"p50": 10.0, "queries": 5}}}
+        results = {"in_process": {"projects-list": {"p50": 15.0, "queries": 3}}}
+        lines = compare(baseline, results)
+        assert "+50%" in lines[1]
+        assert "5 -> 3" in lines[1]
@@ -0,0 +1,198 @@
+"""
+Tests for the bulk create/update/delete endpoints.
+"""
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+from rest_framework import status
+
+import pytest
+
+from apps.portfolio.models import Experience, Project, Skill, Tag
+
+User = get_user_model()
+
+
+def experiences(count):
+    return [
+        {
+            "company": f"Company {i}",
+            "position": "Developer",
+            "description": "Built things.",
+            "start_date": f"20{10 + i}-01-01",
+            "technologies": "Python, Django",
+        }
+        for i in range(count)
+    ]
+
+
+def skills(*names, **fields):
+    return [{"name": name, "category": "tool", "level": 5, **fields} for name in names]
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestBulkCreate:
+    """Test POSTing arrays to the list endpoints."""
+
+    def test_create_in_fixed_queries(self, authenticated_client, user, django_assert_max_num_queries):
+        url = reverse("portfolio:experience-list")
+        with django_assert_max_num_queries(12):
+            response = authenticated_client.post(url, experiences(40), format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(response.data) == 40
+        assert response.data[0]["company"] == "Company 0"
+        assert response.data[0]["technology_list"] == ["Python", "Django"]
+        assert Experience.objects.filter(user=user).count() == 40
+
+    def test_single_objects_still_work(self, authenticated_client):
+        item = {"title": "A", "slug": "a", "description": "x", "tags": "api", "technologies": "Redis"}
+        response = authenticated_client.post(reverse("portfolio:project-list"), item, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["tag_list"] == ["api"]
+
+    def test_invalid_item_rejects_all(self, authenticated_client):
+        items = experiences(3)
+        items[1]["end_date"] = "2000-01-01"
+        response = authenticated_client.post(reverse("portfolio:experience-list"), items, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data[0] == {} and response.data[2] == {}
+        assert "non_field_errors" in response.data[1]
+        assert not Experience.objects.exists()
+
+    def test_unique_fields(self, authenticated_client, project):
+        items = [
+            {"title": "A", "slug": "new", "description": "x", "tags": "a", "technologies": "b"},
+            {"title": "B", "slug": "new", "description": "x", "tags": "a", "technologies": "b"},
+            {"title": "C", "slug": project.slug, "description": "x", "tags": "a", "technologies": "b"},
+        ]
+        response = authenticated_client.post(reverse("portfolio:project-list"), items, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data[0] == {}
+        assert "slug" in response.data[1] and "slug" in response.data[2]
+
+    def test_terms_are_synced(self, authenticated_client):
+        items = [
+            {"title": "A", "slug": "a", "description": "x", "tags": "django, api", "technologies": "Redis"},
+            {"title": "B", "slug": "b", "description": "x", "tags": "api", "technologies": "Redis, Docker"},
+        ]
+        response = authenticated_client.post(reverse("portfolio:project-list"), items, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data[1]["tag_list"] == ["api"]
+        assert Project.objects.get(slug="a").tag_list == ["django", "api"]
+        assert Tag.objects.count() == 2
+
+    def test_skills_are_upserted(self, authenticated_client, user, skill):
+        other = User.objects.create_user(username="other", password="pass")
+        Skill.objects.create(user=other, name="Go", level=2)
+
+        response = authenticated_client.post(
+            reverse("portfolio:skill-list"), skills(skill.name, "Go", level=3), format="json"
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data[0]["id"] == skill.pk
+        assert response.data[0]["created_at"] == skill.created_at.isoformat().replace("+00:00", "Z")
+        skill.refresh_from_db()
+        assert skill.level == 3
+        assert Skill.objects.filter(user=user).count() == 2
+        assert Skill.objects.get(user=other).level == 2
+
+    def test_duplicated_upsert_keys(self, authenticated_client):
+        response = authenticated_client.post(reverse("portfolio:skill-list"), skills("Go", "Go"), format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "non_field_errors" in response.data[1]
+
+    def test_limits(self, authenticated_client, settings):
+        settings.API_BULK_MAX_ITEMS = 2
+        url = reverse("portfolio:skill-list")
+        assert authenticated_client.post(url, skills("a", "b", "c"), format="json").status_code == 400
+        assert authenticated_client.post(url, [], format="json").status_code == 400
+
+    def test_requires_authentication(self, api_client):
+        response = api_client.post(reverse("portfolio:skill-list"), skills("Go"), format="json")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_cache_is_invalidated(self, authenticated_client, skill):
+        url = reverse("portfolio:skill-list")
+        authenticated_client.get(url)
+        authenticated_client.post(url, skills("Go"), format="json")
+        assert len(authenticated_client.get(url).data["results"]) == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestBulkUpdate:
+    """Test PATCHing arrays on the list endpoints."""
+
+    def test_update_by_id(self, authenticated_client, user, django_assert_max_num_queries):
+        created = Experience.objects.bulk_create(
+            [Experience(user=user, **{**item, "technologies": "Go"}) for item in experiences(20)]
+        )
+        items = [{"id": experience.pk, "position": "Lead", "technologies": "Rust"} for experience in created]
+        with django_assert_max_num_queries(12):
+            response = authenticated_client.patch(reverse("portfolio:experience-list"), items, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert {item["position"] for item in response.data} == {"Lead"}
+        assert response.data[0]["technology_list"] == ["Rust"]
+        assert Experience.objects.filter(position="Lead").count() == 20
+
+        experience = Experience.objects.get(pk=created[0].pk)
+        assert experience.updated_at > experience.created_at
+        assert experience.technology_list == ["Rust"]
+
+    def test_unknown_and_foreign_ids(self, authenticated_client, skill):
+        other = User.objects.create_user(username="other", password="pass")
+        foreign = Skill.objects.create(user=other, name="Go")
+        items = [{"id": skill.pk, "level": 1}, {"id": foreign.pk, "level": 1}, {"level": 1}]
+        response = authenticated_client.patch(reverse("portfolio:skill-list"), items, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data[0] == {}
+        assert "id" in response.data[1] and "id" in response.data[2]
+        skill.refresh_from_db()
+        assert skill.level == 9
+
+    def test_unique_together(self, authenticated_client, user, skill):
+        go = Skill.objects.create(user=user, name="Go")
+        url = reverse("portfolio:skill-list")
+
+        response = authenticated_client.patch(url, [{"id": go.pk, "name": skill.name}], format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = authenticated_client.patch(url, [{"id": go.pk, "name": "Rust"}], format="json")
+        assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestBulkDelete:
+    """Test DELETE with filters on the list endpoints."""
+
+    def test_delete_by_filter(self, authenticated_client, user):
+        Skill.objects.bulk_create(
+            [Skill(user=user, name=f"Tool {i}", category="tool") for i in range(3)]
+            + [Skill(user=user, name="Python", category="programming")]
+        )
+        response = authenticated_client.delete(reverse("portfolio:skill-list") + "?category=tool")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"deleted": 3}
+        assert list(Skill.objects.values_list("name", flat=True)) == ["Python"]
+
+    def test_delete_by_ids(self, authenticated_client, user, project):
+        other = User.objects.create_user(username="other", password="pass")
+        foreign = Project.objects.create(user=other, title="F", slug="f", description="x", tags="x")
+        url = reverse("portfolio:project-list") + f"?ids={project.pk},{foreign.pk}"
+        response = authenticated_client.delete(url)
+        assert response.data == {"deleted": 1}
+        assert list(Project.objects.all()) == [foreign]
+
+    def test_filter_is_required(self, authenticated_client, skill):
+        url = reverse("portfolio:skill-list")
+        assert authenticated_client.delete(url).status_code == status.HTTP_400_BAD_REQUEST
+        assert authenticated_client.delete(url + "?unknown=1").status_code == status.HTTP_400_BAD_REQUEST
+        assert authenticated_client.delete(url + "?ids=1,a").status_code == status.HTTP_400_BAD_REQUEST
+        assert Skill.objects.exists()
+
+    def test_profiles_have_no_bulk_routes(self, authenticated_client, user_profile):
+        response = authenticated_client.delete(reverse("portfolio:profile-list") + "?is_active=true")
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
@@ -0,0 +1,102 @@
+"""
+Tests for the API response cache.
+"""
+
+from django.urls import reverse
+
+from rest_framework import status
+
+import pytest
+
+from apps.portfolio.models import Project
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestResponseCache:
+    """Test the versioned read-through response cache."""
+
+    def test_second_request_is_served_from_cache(self, api_client, project, django_assert_num_queries):
+        """Test that a repeated anonymous GET does not touch the database."""
+        url = reverse("portfolio:project-list")
+        first = api_client.get(url)
+        assert first["X-Cache"] == "MISS"
+
+        with django_assert_num_queries(0):
+            second = api_client.get(url)
+
+        assert second.status_code == status.HTTP_200_OK
+        assert second["X-Cache"] == "HIT"
+        assert second.content == first.content
+
+    def test_query_string_is_part_of_the_key(self, api_client, project):
+        """Test that different query strings are cached separately."""
+        url = reverse("portfolio:project-list")
+        api_client.get(url, {"is_featured": "true"})
+        response = api_client.get(url, {"is_featured": "false"})
+
+        assert response["X-Cache"] == "MISS"
+        assert response.json()["count"] == 0
+
+    def test_write_invalidates_cached_list(self, api_client, project, django_capture_on_commit_callbacks):
+        """Test that saving a project invalidates cached project responses."""
+        url = reverse("portfolio:project-list")
+        api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            project.title = "Renamed Project"
+            project.save()
+        response = api_client.get(url)
+
+        assert response["X-Cache"] == "MISS"
+        assert response.json()["results"][0]["title"] == "Renamed Project"
+
+    def test_delete_invalidates_cached_detail(self, api_client, project, django_capture_on_commit_callbacks):
+        """Test that deleting a project invalidates its cached detail."""
+        url = reverse("portfolio:project-detail", kwargs={"slug": project.slug})
+        api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Project.objects.filter(pk=project.pk).delete()
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_invalidated_on_commit(self, api_client, project, django_capture_on_commit_callbacks):
+        """Test that responses cached before the write commits are invalidated by the commit."""
+        url = reverse("portfolio:project-list")
+        with django_capture_on_commit_callbacks() as callbacks:
+            project.title = "Renamed Project"
+            project.save()
+            # A response cached while the write is not committed yet
+            api_client.get(url)
+            assert api_client.get(url)["X-Cache"] == "HIT"
+
+        for callback in callbacks:
+            callback()
+        assert api_client.get(url)["X-Cache"] == "MISS"
+
+    def test_unrelated_write_keeps_cache(self, api_client, project, skill):
+        """Test that writing another model does not invalidate project responses."""
+        url = reverse("portfolio:project-list")
+        api_client.get(url)
+
+        skill.level = 3
+        skill.save()
+        response = api_client.get(url)
+
+        assert response["X-Cache"] == "HIT"
+
+    def test_authenticated_and_anonymous_are_cached_separately(self, api_client, user, project):
+        """Test that unpublished projects cached for an owner never leak to anonymous users."""
+        project.is_published = False
+        project.save()
+        url = reverse("portfolio:project-list")
+
+        api_client.force_authenticate(user=user)
+        assert api_client.get(url).json()["count"] == 1
+
+        api_client.force_authenticate(user=None)
+        response = api_client.get(url)
+        assert response["X-Cache"] == "MISS"
+        assert response.json()["count"] == 0
@@ -0,0 +1,50 @@
+"""
+Tests for the system checks of the portfolio settings.
+"""
+
+import pytest
+
+from apps.portfolio.checks import check_async_middleware, check_shared_caches
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+REDIS = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://redis:6379/1"}}
+
+
+@pytest.mark.unit
+class TestSharedCacheCheck:
+    """Test the check of the features needing a cache shared by the workers."""
+
+    def test_local_cache(self, settings):
+        settings.CACHES = LOCMEM
+        settings.DEBUG = True
+        messages = check_shared_caches(None)
+        assert {message.id for message in messages} == {"portfolio.W001"}
+        assert len(messages) == 4
+        assert any(message.msg.startswith("The response cache") for message in messages)
+
+    def test_production_fails(self, settings):
+        settings.CACHES = LOCMEM
+        settings.DEBUG = False
+        settings.API_CACHE_ENABLED = False
+        settings.API_THROTTLE_ENABLED = False
+        messages = check_shared_caches(None)
+        assert [message.id for message in messages] == ["portfolio.E001", "portfolio.E001"]
+
+    def test_shared_cache(self, settings):
+        settings.CACHES = REDIS
+        settings.DEBUG = False
+        assert check_shared_caches(None) == []
+
+
+@pytest.mark.unit
+class TestAsyncMiddlewareCheck:
+    """Test the check that the middleware chain stays async under ASGI."""
+
+    def test_middleware_is_async(self):
+        assert check_async_middleware(None) == []
+
+    def test_sync_only_middleware(self, settings):
+        settings.MIDDLEWARE = [*settings.MIDDLEWARE, "whitenoise.middleware.WhiteNoiseMiddleware"]
+        messages = check_async_middleware(None)
+        assert [message.id for message in messages] == ["portfolio.W002"]
+        assert messages[0].msg.startswith("whitenoise.middleware.WhiteNoiseMiddleware")
@@ -0,0 +1,106 @@
+"""
+Tests for list endpoint column pruning.
+"""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import serializers
+
+import pytest
+
+from apps.portfolio.columns import get_serializer_columns
+from apps.portfolio.models import Project
+from apps.portfolio.serializers import (
+    BlogPostListSerializer,
+    EducationSerializer,
+    ProjectListSerializer,
+    SkillListSerializer,
+    UserProfileListSerializer,
+)
+
+
+def list_queries(client, url, params=None):
+    """Return the response and the SQL of the main SELECT of a list request."""
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url, params or {})
+    selects = [q["sql"] for q in queries.captured_queries if "COUNT(" not in q["sql"]]
+    return response, selects[0]
+
+
+@pytest.mark.unit
+class TestSerializerColumns:
+    """Test the columns derived from serializer fields."""
+
+    def test_project_list_columns(self):
+        columns, relations = get_serializer_columns(ProjectListSerializer())
+        assert "description" not in columns
+        assert "search_vector" not in columns
+        assert {"id", "title", "slug", "image", "start_date"} <= columns
+        assert relations == set()
+
+    def test_related_source_adds_join(self):
+        columns, relations = get_serializer_columns(BlogPostListSerializer())
+        assert "author__username" in columns
+        assert "content" not in columns
+        assert relations == {"author"}
+
+    def test_display_method_reads_its_field(self):
+        columns, _ = get_serializer_columns(SkillListSerializer())
+        assert "proficiency" in columns
+        assert "description" not in columns
+
+    def test_declared_dependencies(self):
+        columns, _ = get_serializer_columns(UserProfileListSerializer())
+        assert {"first_name", "last_name"} <= columns
+        assert "phone" not in columns
+
+    def test_primary_key_relation_reads_foreign_key(self):
+        columns, relations = get_serializer_columns(EducationSerializer())
+        assert {"user", "user__username"} <= columns
+        assert relations == {"user"}
+
+    def test_unknown_property_disables_pruning(self):
+        class OpaqueSerializer(serializers.ModelSerializer):
+            tag_list = serializers.ReadOnlyField()
+
+            class Meta:
+                model = Project
+                fields = ["id", "tag_list"]
+
+        assert get_serializer_columns(OpaqueSerializer()) is None
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestListColumnPruning:
+    """Test that list endpoints only load the columns they render."""
+
+    def test_project_list_skips_text_and_user(self, api_client, project):
+        response, sql = list_queries(api_client, reverse("portfolio:project-list"))
+        assert response.status_code == 200
+        assert '"portfolio_project"."description"' not in sql
+        assert "search_vector" not in sql
+        assert "auth_user" not in sql
+        assert response.data["results"][0]["tag_list"] == ["python", "django", "rest"]
+
+    def test_project_detail_is_not_pruned(self, api_client, project):
+        response = api_client.get(reverse("portfolio:project-detail", kwargs={"slug": project.slug}))
+        assert response.data["description"] == project.description
+        assert response.data["user_name"] == project.user.username
+
+    def test_blog_list_joins_author_only(self, api_client, blog_post):
+        response, sql = list_queries(api_client, reverse("portfolio:blogpost-list"))
+        assert '"portfolio_blogpost"."content"' not in sql
+        assert '"auth_user"."username"' in sql
+        assert '"auth_user"."password"' not in sql
+        assert response.data["results"][0]["author_name"] == blog_post.author.username
+
+    def test_ordering_fields_are_loaded_for_cursor(self, api_client, blog_post):
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(
+                reverse("portfolio:blogpost-list"), {"pagination": "cursor", "ordering": "-views_count"}
+            )
+        assert response.status_code == 200
+        assert len(queries.captured_queries) == 2  # posts + prefetched tags, no deferred loads
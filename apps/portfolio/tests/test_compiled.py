@@ -0,0 +1,86 @@
+"""
+Tests for compiled list serializer representations.
+"""
+
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+import pytest
+
+from apps.portfolio.compiled import CompiledRepresentationMixin, compile_representation
+from apps.portfolio.models import Skill
+from apps.portfolio.serializers import (
+    BlogPostListSerializer,
+    ProjectListSerializer,
+    SkillListSerializer,
+    UserProfileListSerializer,
+)
+
+
+def render_both(serializer_class, instances, **kwargs):
+    """Render ``instances`` through the compiled path and through plain DRF."""
+    compiled = serializer_class(instances, many=True, **kwargs)
+    child = serializer_class(**kwargs)
+    generic = [super(CompiledRepresentationMixin, child).to_representation(instance) for instance in instances]
+    return JSONRenderer().render(compiled.data), JSONRenderer().render(generic)
+
+
+@pytest.fixture
+def context():
+    return {"request": APIRequestFactory().get("/api/")}
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestCompiledRepresentation:
+    """Test that compiled representations match DRF output byte for byte."""
+
+    def test_project(self, project, context):
+        project.image.name = "projects/cover.png"
+        compiled, generic = render_both(ProjectListSerializer, [project], context=context)
+        assert compiled == generic
+        assert b"http://testserver/media/" in compiled
+
+    def test_blog_post(self, blog_post, context):
+        draft = blog_post.__class__.objects.create(
+            author=blog_post.author, title="Draft", slug="draft", content="Draft", published_at=None
+        )
+        compiled, generic = render_both(BlogPostListSerializer, [blog_post, draft], context=context)
+        assert compiled == generic
+        assert b'"published_at":null' in compiled
+
+    def test_skill(self, skill):
+        other = Skill.objects.create(user=skill.user, name="Go", category="programming", proficiency="beginner")
+        compiled, generic = render_both(SkillListSerializer, [skill, other])
+        assert compiled == generic
+        assert b'"proficiency_display":"Expert"' in compiled
+
+    def test_user_profile(self, user_profile, context):
+        compiled, generic = render_both(UserProfileListSerializer, [user_profile], context=context)
+        assert compiled == generic
+        assert b'"full_name":"John Doe"' in compiled
+
+    def test_unresolvable_fields_fall_back_to_drf(self, skill):
+        class FallbackSerializer(CompiledRepresentationMixin, serializers.ModelSerializer):
+            owner = serializers.PrimaryKeyRelatedField(source="user", read_only=True)
+            everything = serializers.SerializerMethodField()
+            missing = serializers.CharField(source="nope", read_only=True, required=False, default="n/a")
+
+            class Meta:
+                model = Skill
+                fields = ["id", "owner", "everything", "missing"]
+
+            def get_everything(self, obj):
+                return obj.name.upper()
+
+        serializer = FallbackSerializer()
+        assert "field_1" in compile_representation(serializer).__globals__
+        compiled, generic = render_both(FallbackSerializer, [skill])
+        assert compiled == generic
+        assert serializer.to_representation(skill) == {
+            "id": skill.id,
+            "owner": skill.user_id,
+            "everything": "PYTHON",
+            "missing": "n/a",
+        }
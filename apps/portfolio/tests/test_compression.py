@@ -0,0 +1,131 @@
+"""
+Tests for the compression of JSON responses.
+"""
+
+import gzip
+
+from django.test import AsyncClient
+from django.urls import reverse
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from apps.portfolio import compression
+from apps.portfolio.models import Skill
+
+requires_brotli = pytest.mark.skipif(compression.brotli is None, reason="brotli is not installed")
+
+
+@pytest.fixture
+def skills(user):
+    """Enough skills for the list to be worth compressing."""
+    Skill.objects.bulk_create(
+        Skill(user=user, name=f"Skill {i}", category="programming", description="Compressible text " * 5)
+        for i in range(30)
+    )
+
+
+def decompress(response):
+    encoding = response.get("Content-Encoding")
+    if encoding == "br":
+        return compression.brotli.decompress(response.content)
+    if encoding == "gzip":
+        return gzip.decompress(response.content)
+    return response.content
+
+
+@pytest.mark.unit
+class TestNegotiation:
+    """Test the choice of the encoding from Accept-Encoding."""
+
+    @pytest.mark.parametrize(
+        "accept_encoding, encoding",
+        [
+            ("", None),
+            ("identity", None),
+            ("gzip", "gzip"),
+            ("GZIP;q=0.5, deflate", "gzip"),
+            ("gzip;q=0", None),
+            ("*;q=0, identity", None),
+            ("deflate, *", compression.ENCODINGS[0]),
+            ("gzip;q=invalid", None),
+        ],
+    )
+    def test_negotiate(self, accept_encoding, encoding):
+        assert compression.negotiate(accept_encoding) == encoding
+
+    @requires_brotli
+    def test_brotli_preferred(self):
+        assert compression.negotiate("gzip, deflate, br") == "br"
+        assert compression.negotiate("gzip, br;q=0.8") == "gzip"
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestCompression:
+    """Test the compressed responses of the API."""
+
+    def test_gzip(self, api_client, skills):
+        url = reverse("portfolio:skill-list")
+        plain = api_client.get(url)
+        response = api_client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+
+        assert response["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response["Vary"]
+        assert int(response["Content-Length"]) == len(response.content) < len(plain.content)
+        assert decompress(response) == plain.content
+        assert "Content-Encoding" not in plain and "Accept-Encoding" in plain["Vary"]
+
+    @requires_brotli
+    def test_brotli(self, api_client, skills):
+        url = reverse("portfolio:skill-list")
+        response = api_client.get(url, HTTP_ACCEPT_ENCODING="gzip, deflate, br")
+        assert response["Content-Encoding"] == "br"
+        assert decompress(response) == api_client.get(url).content
+
+    def test_cache_hits_are_precompressed(self, api_client, skills, monkeypatch):
+        url = reverse("portfolio:skill-list")
+        miss = api_client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        assert miss["X-Cache"] == "MISS" and miss["Content-Encoding"] == "gzip"
+
+        monkeypatch.setattr(compression, "compress", lambda content, encoding: pytest.fail("compressed a hit"))
+        hit = api_client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        assert hit["X-Cache"] == "HIT" and hit["Content-Encoding"] == "gzip"
+        assert hit.content == miss.content
+        assert "Accept-Encoding" in hit["Vary"]
+
+        plain = api_client.get(url)
+        assert plain["X-Cache"] == "HIT" and "Content-Encoding" not in plain
+        assert plain.content == decompress(hit)
+
+    def test_conditional_hit(self, api_client, skills):
+        url = reverse("portfolio:skill-list")
+        etag = api_client.get(url, HTTP_ACCEPT_ENCODING="gzip")["ETag"]
+        response = api_client.get(url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+
+    def test_small_and_streaming_responses(self, api_client, skill, skills):
+        response = api_client.get(
+            reverse("portfolio:skill-detail", kwargs={"pk": skill.pk}), HTTP_ACCEPT_ENCODING="gzip"
+        )
+        assert "Content-Encoding" not in response
+        response = api_client.get(reverse("portfolio:skill-export"), HTTP_ACCEPT_ENCODING="gzip")
+        assert response.streaming and "Content-Encoding" not in response
+
+    def test_uncached_responses(self, api_client, skills, settings):
+        settings.API_CACHE_ENABLED = False
+        response = api_client.get(reverse("portfolio:skill-list"), HTTP_ACCEPT_ENCODING="gzip")
+        assert response["Content-Encoding"] == "gzip"
+
+    def test_asgi_handler(self, api_client, skills):
+        url = reverse("portfolio:skill-list")
+        response = async_to_sync(AsyncClient().get)(url, headers={"Accept-Encoding": "gzip"})
+        assert response["Content-Encoding"] == "gzip"
+        assert decompress(response) == api_client.get(url).content
+
+    def test_disabled(self, api_client, skills, settings):
+        settings.API_COMPRESSION_ENABLED = False
+        url = reverse("portfolio:skill-list")
+        api_client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        for _ in range(2):
+            assert "Content-Encoding" not in api_client.get(url, HTTP_ACCEPT_ENCODING="gzip")
@@ -0,0 +1,121 @@
+"""
+Tests for conditional GET support.
+"""
+
+from django.urls import reverse
+
+from rest_framework import status
+
+import pytest
+
+from apps.portfolio import counters
+from apps.portfolio.models import Project
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestConditionalList:
+    """Test ETag handling on list endpoints."""
+
+    def test_list_carries_validators(self, api_client, project):
+        response = api_client.get(reverse("portfolio:project-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"].startswith('W/"')
+        assert "Last-Modified" not in response
+
+    def test_matching_etag_returns_304_without_serializing(
+        self, api_client, project, django_assert_num_queries, settings
+    ):
+        settings.API_CACHE_ENABLED = False
+        url = reverse("portfolio:project-list")
+        etag = api_client.get(url)["ETag"]
+
+        # Only the validator query runs
+        with django_assert_num_queries(1):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        assert response.content == b""
+
+    def test_cached_response_answers_without_queries(self, api_client, project, django_assert_num_queries):
+        url = reverse("portfolio:project-list")
+        etag = api_client.get(url)["ETag"]
+
+        with django_assert_num_queries(0):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_if_modified_since_is_ignored(self, api_client, project, django_capture_on_commit_callbacks):
+        """A delete leaves MAX(updated_at) unchanged: only the ETag can tell."""
+        other = Project.objects.create(
+            user=project.user, title="Other", slug="other", description="Other", is_published=True
+        )
+        Project.objects.filter(pk=other.pk).update(updated_at=project.updated_at)
+        url = reverse("portfolio:project-list")
+        api_client.get(url)
+        with django_capture_on_commit_callbacks(execute=True):
+            other.delete()
+
+        response = api_client.get(url, HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["results"]) == 1
+
+    def test_etag_changes_on_update_and_delete(self, api_client, project, user, django_capture_on_commit_callbacks):
+        url = reverse("portfolio:project-list")
+        first = api_client.get(url)["ETag"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            project.title = "Renamed"
+            project.save()
+        updated = api_client.get(url, HTTP_IF_NONE_MATCH=first)
+        assert updated.status_code == status.HTTP_200_OK
+        assert updated["ETag"] != first
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Project.objects.create(user=user, title="Other", slug="other", description="Other", is_published=True)
+            Project.objects.filter(slug="other").delete()
+        deleted = api_client.get(url, HTTP_IF_NONE_MATCH=updated["ETag"])
+        assert deleted.status_code == status.HTTP_200_OK
+
+    def test_etag_depends_on_query(self, api_client, project):
+        url = reverse("portfolio:project-list")
+        etag = api_client.get(url)["ETag"]
+
+        response = api_client.get(url, {"is_featured": "true"}, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestConditionalDetail:
+    """Test ETag / Last-Modified handling on detail endpoints."""
+
+    def test_detail_returns_304(self, api_client, blog_post):
+        url = reverse("portfolio:blogpost-detail", kwargs={"slug": blog_post.slug})
+        etag = api_client.get(url)["ETag"]
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_flushed_views_change_etag(self, api_client, blog_post):
+        url = reverse("portfolio:blogpost-detail", kwargs={"slug": blog_post.slug})
+        etag = api_client.get(url)["ETag"]
+
+        counters.increment(blog_post.pk)
+        counters.flush()
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["views_count"] == blog_post.views_count + 1
+
+    def test_missing_object_is_404(self, api_client, db):
+        response = api_client.get(reverse("portfolio:blogpost-detail", kwargs={"slug": "missing"}))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert "ETag" not in response
@@ -0,0 +1,138 @@
+"""
+Tests for buffered blog post view counters.
+"""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+
+from rest_framework import status
+
+import pytest
+
+from apps.portfolio import counters
+
+
+@pytest.fixture
+def manual_flush(settings):
+    """Disable opportunistic flushing from the request path."""
+    settings.VIEW_COUNTER_FLUSH_INTERVAL = 0
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestViewCounters:
+    """Test the view counter store."""
+
+    def test_increment_is_buffered(self, blog_post):
+        """Test that increments do not write to the database."""
+        counters.increment(blog_post.pk)
+        counters.increment(blog_post.pk)
+
+        blog_post.refresh_from_db()
+        assert blog_post.views_count == 0
+        assert counters.get_pending(blog_post.pk) == 2
+
+    def test_flush_applies_single_update(self, blog_post, user, django_assert_num_queries):
+        """Test that pending views of several posts are flushed in one query."""
+        from apps.portfolio.models import BlogPost
+
+        other = BlogPost.objects.create(author=user, title="Other", slug="other", content="Other", views_count=10)
+        for _ in range(3):
+            counters.increment(blog_post.pk)
+        counters.increment(other.pk)
+
+        with django_assert_num_queries(1):
+            assert counters.flush() == {blog_post.pk: 3, other.pk: 1}
+
+        blog_post.refresh_from_db()
+        other.refresh_from_db()
+        assert blog_post.views_count == 3
+        assert other.views_count == 11
+        assert counters.get_pending(blog_post.pk) == 0
+        assert counters.flush() == {}
+
+    def test_views_after_flush_are_flushed_again(self, blog_post):
+        """Test that a post is re-registered once its pending count was drained."""
+        counters.increment(blog_post.pk)
+        counters.flush()
+        counters.increment(blog_post.pk)
+        counters.flush()
+
+        blog_post.refresh_from_db()
+        assert blog_post.views_count == 2
+
+    def test_evicted_pending_count_is_not_flushed_twice(self, blog_post, user, monkeypatch):
+        """Test that a pending count evicted during a flush does not replay the flushed views."""
+        from apps.portfolio.models import BlogPost
+
+        other = BlogPost.objects.create(author=user, title="Other", slug="other", content="Other")
+        counters.increment(blog_post.pk, amount=3)
+        counters.increment(other.pk, amount=2)
+
+        cache = counters.get_counter_cache()
+        decr = cache.decr
+        evicted = counters.PENDING_KEY.format(other.pk)
+
+        def evict_then_decr(key, delta=1, **kwargs):
+            if key == evicted:
+                cache.delete(key)
+            return decr(key, delta, **kwargs)
+
+        monkeypatch.setattr(cache, "decr", evict_then_decr)
+        assert counters.flush() == {blog_post.pk: 3, other.pk: 2}
+        monkeypatch.undo()
+        assert counters.flush() == {}
+
+        blog_post.refresh_from_db()
+        other.refresh_from_db()
+        assert (blog_post.views_count, other.views_count) == (3, 2)
+
+    def test_flush_command(self, blog_post):
+        """Test the flush_view_counts management command."""
+        counters.increment(blog_post.pk, amount=5)
+        out = StringIO()
+        call_command("flush_view_counts", stdout=out)
+
+        blog_post.refresh_from_db()
+        assert blog_post.views_count == 5
+        assert "Flushed 5 views across 1 posts" in out.getvalue()
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestIncrementViewsAPI:
+    """Test the increment_views endpoint."""
+
+    def test_returns_live_count_without_touching_database(
+        self, api_client, blog_post, manual_flush, django_assert_num_queries
+    ):
+        """Test that repeated views are served from the counter store."""
+        url = reverse("portfolio:blogpost-increment-views", kwargs={"slug": blog_post.slug})
+        api_client.post(url)
+
+        with django_assert_num_queries(0):
+            response = api_client.post(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["views_count"] == 2
+
+    def test_count_survives_flush(self, api_client, blog_post, manual_flush):
+        """Test that the live count stays consistent across a flush."""
+        url = reverse("portfolio:blogpost-increment-views", kwargs={"slug": blog_post.slug})
+        api_client.post(url)
+        counters.flush()
+        response = api_client.post(url)
+
+        assert response.data["views_count"] == 2
+
+    def test_draft_post_is_hidden_from_anonymous(self, api_client, user):
+        """Test that anonymous users cannot count views on drafts."""
+        from apps.portfolio.models import BlogPost
+
+        BlogPost.objects.create(author=user, title="Draft", slug="draft", content="Draft", status="draft")
+        url = reverse("portfolio:blogpost-increment-views", kwargs={"slug": "draft"})
+        response = api_client.post(url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
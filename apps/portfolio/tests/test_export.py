@@ -0,0 +1,111 @@
+"""
+Tests for the streaming NDJSON/CSV exports.
+"""
+
+import csv
+import io
+import json
+import warnings
+
+from django.test import AsyncClient
+from django.urls import reverse
+
+from rest_framework import status
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from apps.portfolio.models import Project, Skill
+
+
+def read(response):
+    return b"".join(response.streaming_content).decode()
+
+
+@pytest.fixture
+def projects(user):
+    return [
+        Project.objects.create(
+            user=user,
+            title=f"Project {i}",
+            slug=f"project-{i}",
+            description="Built with django" if i % 2 else "Built with flask",
+            tags="api, web",
+            technologies="Python",
+            is_published=i != 4,
+            order=i,
+        )
+        for i in range(5)
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestExport:
+    """Test the export action of the ViewSets."""
+
+    def test_ndjson_by_default(self, authenticated_client, projects):
+        response = authenticated_client.get(reverse("portfolio:project-export"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"] == "application/x-ndjson; charset=utf-8"
+        assert response["Content-Disposition"] == 'attachment; filename="project.ndjson"'
+
+        rows = [json.loads(line) for line in read(response).splitlines()]
+        assert [row["slug"] for row in rows] == [project.slug for project in Project.objects.all()]
+        assert rows[0]["tag_list"] == ["api", "web"]
+        # Same representation as the detail endpoint
+        detail = authenticated_client.get(reverse("portfolio:project-detail", kwargs={"slug": rows[0]["slug"]}))
+        assert rows[0] == json.loads(json.dumps(detail.data))
+
+    def test_csv(self, authenticated_client, projects):
+        response = authenticated_client.get(reverse("portfolio:project-export"), {"format": "csv"})
+        assert response["Content-Type"] == "text/csv; charset=utf-8"
+        rows = list(csv.DictReader(io.StringIO(read(response))))
+        assert len(rows) == 5
+        assert rows[0]["tag_list"] == '["api", "web"]'
+        assert rows[0]["is_published"] in ("true", "false")
+        assert rows[0]["image"] == ""
+
+    def test_accept_header(self, authenticated_client, projects):
+        response = authenticated_client.get(reverse("portfolio:project-export"), HTTP_ACCEPT="text/csv")
+        assert response["Content-Type"].startswith("text/csv")
+
+    def test_filters_and_search(self, api_client, projects):
+        url = reverse("portfolio:project-export")
+        # Anonymous clients only export published projects
+        assert len(read(api_client.get(url)).splitlines()) == 4
+        assert len(read(api_client.get(url, {"search": "django"})).splitlines()) == 2
+
+    def test_chunks_bound_queries(self, authenticated_client, projects, settings, django_assert_max_num_queries):
+        settings.API_EXPORT_CHUNK_SIZE = 2
+        with django_assert_max_num_queries(12):
+            response = authenticated_client.get(reverse("portfolio:project-export"))
+            chunks = list(response.streaming_content)
+        # 3 chunks of rows, each with its own prefetch queries
+        assert len(chunks) == 3
+        assert sum(len(chunk.splitlines()) for chunk in chunks) == 5
+
+    def test_every_model(self, authenticated_client, user_profile, experience, education, skill, blog_post):
+        for basename in ("profile", "experience", "education", "skill", "blogpost"):
+            response = authenticated_client.get(reverse(f"portfolio:{basename}-export"), {"format": "csv"})
+            assert response.status_code == status.HTTP_200_OK
+            assert len(read(response).splitlines()) == 2
+
+    def test_empty(self, authenticated_client):
+        response = authenticated_client.get(reverse("portfolio:skill-export"), {"format": "csv"})
+        assert read(response).splitlines()[0].startswith("id,name,")
+        assert read(authenticated_client.get(reverse("portfolio:skill-export"))) == ""
+
+    def test_asgi_streams_asynchronously(self, user):
+        Skill.objects.bulk_create([Skill(user=user, name=f"Skill {i}") for i in range(3)])
+
+        async def export():
+            response = await AsyncClient().get(reverse("portfolio:skill-export"))
+            return [chunk async for chunk in response.streaming_content]
+
+        with warnings.catch_warnings():
+            # Warned when Django has to load a synchronous iterator whole
+            warnings.filterwarnings("error", message="StreamingHttpResponse must consume")
+            chunks = async_to_sync(export)()
+        assert len(b"".join(chunks).splitlines()) == 3
@@ -0,0 +1,168 @@
+"""
+Tests for responsive image derivatives.
+"""
+
+from io import BytesIO
+
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+
+from rest_framework.test import APIRequestFactory
+
+import pytest
+from PIL import Image
+
+from apps.portfolio.cache import bump_generation
+from apps.portfolio.images import get_formats
+from apps.portfolio.models import Project
+from apps.portfolio.serializers import ProjectListSerializer
+
+
+@pytest.fixture(autouse=True)
+def image_settings(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    settings.TASK_QUEUE_EAGER = True
+    settings.IMAGE_DERIVATIVE_WIDTHS = [100, 200]
+    settings.IMAGE_DERIVATIVE_FORMATS = ["webp", "jpeg"]
+
+
+def make_image(width=300, height=150, color=(200, 30, 30, 128), name="photo.png"):
+    output = BytesIO()
+    Image.new("RGBA", (width, height), color).save(output, "PNG")
+    return SimpleUploadedFile(name, output.getvalue(), content_type="image/png")
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestImageDerivatives:
+    """Test derivative generation on upload."""
+
+    def test_derivatives_generated_after_commit(self, project, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            project.image = make_image()
+            project.save()
+
+        project.refresh_from_db()
+        manifest = project.image_variants
+        assert manifest["source"] == project.image.name
+        assert [(v["type"], v["width"]) for v in manifest["variants"]] == [
+            ("image/webp", 100),
+            ("image/webp", 200),
+            ("image/jpeg", 100),
+            ("image/jpeg", 200),
+        ]
+        for variant in manifest["variants"]:
+            assert variant["name"].startswith(f"derivatives/{manifest['digest']}/")
+            with default_storage.open(variant["name"]) as file, Image.open(file) as image:
+                assert image.width == variant["width"]
+                assert image.height == variant["width"] // 2
+
+    def test_small_images_are_not_upscaled(self, project, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            project.image = make_image(width=150, height=150)
+            project.save()
+
+        project.refresh_from_db()
+        assert sorted({v["width"] for v in project.image_variants["variants"]}) == [100, 150]
+
+    def test_identical_uploads_share_derivatives(self, project, user, django_capture_on_commit_callbacks):
+        other = Project.objects.create(user=user, title="Other", slug="other", description="Other")
+        with django_capture_on_commit_callbacks(execute=True):
+            project.image = make_image(name="a.png")
+            project.save()
+            other.image = make_image(name="b.png")
+            other.save()
+
+        project.refresh_from_db()
+        other.refresh_from_db()
+        assert project.image.name != other.image.name
+        assert project.image_variants["variants"] == other.image_variants["variants"]
+
+    def test_replacing_and_clearing_image(self, project, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            project.image = make_image()
+            project.save()
+        first = Project.objects.get(pk=project.pk).image_variants
+
+        with django_capture_on_commit_callbacks(execute=True):
+            project.image = make_image(color=(0, 0, 255, 255))
+            project.save()
+        project.refresh_from_db()
+        assert project.image_variants["digest"] != first["digest"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            project.image = None
+            project.save()
+        project.refresh_from_db()
+        assert project.image_variants == {}
+
+    def test_unrelated_update_does_not_schedule(self, project, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks() as callbacks:
+            project.title = "Renamed"
+            project.save(update_fields=["title"])
+        # Only the response cache invalidation
+        assert [getattr(callback, "func", None) for callback in callbacks] == [bump_generation]
+
+    def test_configured_unsupported_formats_are_skipped(self, settings):
+        settings.IMAGE_DERIVATIVE_FORMATS = ["avif", "webp"]
+        assert set(get_formats()) <= {"avif", "webp"}
+        assert "webp" in get_formats()
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestImageSrcset:
+    """Test the srcset fields of the serializers."""
+
+    def test_srcset_representation(self, project, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            project.image = make_image()
+            project.save()
+        project.refresh_from_db()
+
+        request = APIRequestFactory().get("/")
+        data = ProjectListSerializer(project, context={"request": request}).data
+        digest = project.image_variants["digest"]
+        assert data["image_srcset"][0] == {
+            "type": "image/webp",
+            "srcset": (
+                f"http://testserver/media/derivatives/{digest}/100w.webp 100w, "
+                f"http://testserver/media/derivatives/{digest}/200w.webp 200w"
+            ),
+        }
+
+    def test_srcset_is_null_without_derivatives(self, api_client, project):
+        response = api_client.get(reverse("portfolio:project-detail", kwargs={"slug": project.slug}))
+        assert response.json()["image_srcset"] is None
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestGenerateImageDerivativesCommand:
+    """Test the regeneration command."""
+
+    def test_generates_missing_derivatives(self, project):
+        # Simulate media uploaded before derivatives existed
+        project.image = make_image()
+        project.save()
+        Project.objects.filter(pk=project.pk).update(image_variants={})
+
+        call_command("generate_image_derivatives", "--model", "project")
+
+        project.refresh_from_db()
+        assert project.image_variants["source"] == project.image.name
+        assert len(project.image_variants["variants"]) == 4
+
+    def test_force_regenerates(self, project, tmp_path):
+        project.image = make_image()
+        project.save()
+        call_command("generate_image_derivatives")
+        project.refresh_from_db()
+        derivative = project.image_variants["variants"][0]["name"]
+        default_storage.delete(derivative)
+
+        call_command("generate_image_derivatives", "--force")
+
+        assert default_storage.exists(derivative)
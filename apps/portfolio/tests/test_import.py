@@ -0,0 +1,186 @@
+"""
+Tests for the import_portfolio command.
+"""
+
+import io
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+
+import pytest
+
+from apps.portfolio import importing
+from apps.portfolio.models import Education, Experience, ImportCheckpoint, Project, Skill, UserProfile
+
+User = get_user_model()
+
+
+def experience(i, **fields):
+    return {
+        "company": f"Company {i}",
+        "position": "Developer",
+        "description": "Built things.",
+        "start_date": f"20{10 + i}-01-01",
+        "technologies": "Python, Django",
+        **fields,
+    }
+
+
+def write_ndjson(path, rows):
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+    return path
+
+
+def run(path, *args, **options):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    call_command("import_portfolio", str(path), *args, stdout=stdout, stderr=stderr, **options)
+    return stdout.getvalue(), stderr.getvalue()
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestImportPortfolio:
+    """Test the import_portfolio management command."""
+
+    def test_ndjson(self, tmp_path, user):
+        path = write_ndjson(tmp_path / "experience.ndjson", [experience(i) for i in range(5)])
+        stdout, _ = run(path, user=user.username, batch_size=2)
+
+        assert "Imported 5 rows" in stdout
+        assert stdout.count("records/s") == 3
+        assert Experience.objects.filter(user=user).count() == 5
+        assert Experience.objects.get(company="Company 0").technology_list == ["Python", "Django"]
+        assert not ImportCheckpoint.objects.exists()
+
+    def test_invalid_batch_stops_and_resumes(self, tmp_path, user):
+        rows = [experience(i) for i in range(5)]
+        # Rejected by ExperienceSerializer.validate()
+        rows[3]["end_date"] = "2000-01-01"
+        path = write_ndjson(tmp_path / "experience.ndjson", rows)
+
+        with pytest.raises(CommandError):
+            run(path, user=user.username, batch_size=2)
+        assert Experience.objects.count() == 2
+        checkpoint = ImportCheckpoint.objects.get()
+        assert checkpoint.key == f"{user.username}:{path}"
+        assert checkpoint.state["records"] == 2
+
+        rows[3]["end_date"] = None
+        write_ndjson(path, rows)
+        stdout, _ = run(path, user=user.username, batch_size=2)
+        assert "Resuming after 2 records" in stdout
+        assert Experience.objects.count() == 5
+        assert not ImportCheckpoint.objects.exists()
+
+    def test_crash_before_checkpoint_rolls_back_the_batch(self, tmp_path, user, monkeypatch):
+        path = write_ndjson(tmp_path / "experience.ndjson", [experience(i) for i in range(5)])
+        save = importing.Checkpoint.save
+
+        def crash_on_second_batch(checkpoint, state):
+            if state["records"] > 2:
+                raise RuntimeError("crash")
+            save(checkpoint, state)
+
+        monkeypatch.setattr(importing.Checkpoint, "save", crash_on_second_batch)
+        with pytest.raises(RuntimeError):
+            run(path, user=user.username, batch_size=2)
+        assert Experience.objects.count() == 2
+        assert ImportCheckpoint.objects.get().state["records"] == 2
+
+        monkeypatch.setattr(importing.Checkpoint, "save", save)
+        stdout, _ = run(path, user=user.username, batch_size=2)
+        assert "Resuming after 2 records" in stdout
+        assert sorted(Experience.objects.values_list("company", flat=True)) == [f"Company {i}" for i in range(5)]
+
+    def test_skip_invalid(self, tmp_path, user):
+        path = tmp_path / "experience.ndjson"
+        lines = [json.dumps(experience(0)), "{not json", json.dumps(experience(1, end_date="2000-01-01"))]
+        path.write_text("\n".join(lines) + "\n\n" + json.dumps(experience(2)) + "\n")
+
+        stdout, stderr = run(path, user=user.username, skip_invalid=True)
+        assert "Imported 2 rows, 2 invalid records skipped" in stdout
+        assert "line 2: " in stderr and "Invalid JSON" in stderr
+        assert "line 3: " in stderr and "End date must be after start date." in stderr
+        assert Experience.objects.count() == 2
+
+    def test_unique_fields(self, tmp_path, user, project):
+        rows = [
+            {"title": "A", "slug": "new", "description": "x", "tags": "a", "technologies": "b"},
+            {"title": "B", "slug": "new", "description": "x", "tags": "a", "technologies": "b"},
+            {"title": "C", "slug": project.slug, "description": "x", "tags": "a", "technologies": "b"},
+        ]
+        path = write_ndjson(tmp_path / "projects.jsonl", rows)
+        _, stderr = run(path, user=user.username, model="project", skip_invalid=True)
+        assert "line 2: " in stderr and "line 3: " in stderr
+        assert set(Project.objects.values_list("slug", flat=True)) == {project.slug, "new"}
+
+    def test_csv_export_round_trip(self, tmp_path, authenticated_client, user, skill):
+        response = authenticated_client.get(reverse("portfolio:skill-export"), {"format": "csv"})
+        path = tmp_path / "skill.csv"
+        path.write_bytes(b"".join(response.streaming_content))
+
+        other = User.objects.create_user(username="other", password="pass")
+        run(path, user=other.username)
+        imported = Skill.objects.get(user=other)
+        assert (imported.name, imported.level, imported.category) == (skill.name, skill.level, skill.category)
+
+        # Skills are upserted: importing again updates the same row
+        run(path, user=other.username)
+        assert Skill.objects.filter(user=other).count() == 1
+
+    def test_json_resume(self, tmp_path, user):
+        resume = {
+            "basics": {
+                "name": "Jane Doe",
+                "label": "Backend Developer",
+                "email": "jane@example.com",
+                "location": {"city": "Paris", "countryCode": "FR"},
+                "profiles": [{"network": "GitHub", "url": "https://github.com/jane"}],
+            },
+            "work": [
+                {"name": "Acme", "position": "Developer", "startDate": "2019-03", "summary": "APIs."},
+                {"name": "Initech", "position": "Intern", "startDate": "2018", "endDate": "2018-09-30", "summary": "."},
+            ],
+            "education": [{"institution": "EPFL", "area": "CS", "studyType": "Master", "startDate": "2014"}],
+            "skills": [
+                {"name": "Python", "level": "Master", "keywords": ["Django"]},
+                {"name": "Go", "level": "Fluent"},
+            ],
+            "projects": [{"name": "My API", "description": "An API.", "keywords": ["django", "api"]}],
+        }
+        path = tmp_path / "resume.json"
+        path.write_text(json.dumps(resume))
+        stdout, _ = run(path, user=user.username)
+        assert "Imported 7 rows" in stdout
+
+        profile = UserProfile.objects.get(user=user)
+        assert (profile.first_name, profile.last_name, profile.location) == ("Jane", "Doe", "Paris, FR")
+        assert profile.github_url == "https://github.com/jane"
+        current = Experience.objects.get(company="Acme")
+        assert str(current.start_date) == "2019-03-01" and current.is_current
+        assert not Experience.objects.get(company="Initech").is_current
+        assert Education.objects.get(user=user).degree == "Master"
+        assert Skill.objects.get(name="Python").proficiency == "expert"
+        assert Skill.objects.get(name="Go").proficiency == "intermediate"
+        assert Project.objects.get(slug="my-api").tag_list == ["django", "api"]
+
+    def test_resume_updates_the_profile(self, tmp_path, user, user_profile):
+        path = tmp_path / "resume.json"
+        path.write_text(json.dumps({"basics": {"name": "Jane Doe", "email": "jane@example.com"}}))
+        run(path, user=user.username)
+        user_profile.refresh_from_db()
+        assert user_profile.first_name == "Jane"
+        assert UserProfile.objects.count() == 1
+
+    def test_errors(self, tmp_path, user):
+        path = write_ndjson(tmp_path / "rows.ndjson", [experience(0)])
+        with pytest.raises(CommandError, match="Unknown model"):
+            run(path, user=user.username)
+        with pytest.raises(CommandError, match="Unknown user"):
+            run(path, user="nobody", model="experience")
+        with pytest.raises(CommandError, match="Unknown format"):
+            run(write_ndjson(tmp_path / "rows.txt", []), user=user.username, model="experience")
+        assert not Experience.objects.exists()
@@ -0,0 +1,174 @@
+"""
+Tests for the per-request SQL instrumentation.
+"""
+
+import asyncio
+import logging
+
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import AsyncClient, RequestFactory
+from django.urls import reverse
+
+from rest_framework import status
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+
+from apps.portfolio import instrumentation
+from apps.portfolio.instrumentation import QueryInstrumentationMiddleware, QueryRecorder, fingerprint
+
+User = get_user_model()
+
+
+@pytest.fixture
+def sampled(settings):
+    settings.INSTRUMENTATION_SAMPLE_RATE = 1.0
+    settings.API_CACHE_ENABLED = False
+
+
+def lookup_users(request):
+    """A view with an N+1: one query per user."""
+    for pk in User.objects.values_list("pk", flat=True):
+        User.objects.filter(pk=pk).first()
+    return HttpResponse()
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestQueryRecorder:
+    """Test query recording and fingerprinting."""
+
+    def test_fingerprint(self):
+        assert fingerprint('SELECT "a" FROM "t" WHERE "id" IN (%s, %s, %s) LIMIT 21') == (
+            'SELECT "a" FROM "t" WHERE "id" IN (...) LIMIT ?'
+        )
+        assert fingerprint("SELECT 'x' FROM t2 WHERE id = 3") == "SELECT ? FROM t2 WHERE id = ?"
+
+    def test_records_queries_and_duplicates(self, user):
+        recorder = QueryRecorder()
+        with recorder.installed():
+            for _ in range(3):
+                User.objects.filter(pk=user.pk).first()
+            User.objects.count()
+        summary = recorder.summary()
+        assert summary["queries"] == 4
+        assert summary["duplicates"] == 2
+        assert list(recorder.duplicates.values()) == [3]
+
+    def test_nothing_recorded_outside_block(self, user):
+        recorder = QueryRecorder()
+        with recorder.installed():
+            pass
+        User.objects.count()
+        assert recorder.count == 0
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestQueryInstrumentationMiddleware:
+    """Test the Server-Timing header, logs and aggregated statistics."""
+
+    def test_disabled_by_default(self, api_client, project):
+        response = api_client.get(reverse("portfolio:project-list"))
+        assert "Server-Timing" not in response
+        assert instrumentation.get_stats() == {}
+
+    def test_server_timing(self, api_client, project, sampled, django_assert_num_queries):
+        with django_assert_num_queries(5):
+            response = api_client.get(reverse("portfolio:project-list"))
+        timing = response["Server-Timing"]
+        assert 'desc="5 queries"' in timing
+        for metric in ("db;dur=", "render;dur=", "total;dur="):
+            assert metric in timing
+
+    def test_stats_are_aggregated_per_route(self, api_client, user, project, sampled):
+        for _ in range(2):
+            api_client.get(reverse("portfolio:project-list"))
+        api_client.get(reverse("portfolio:project-detail", kwargs={"slug": project.slug}))
+
+        stats = instrumentation.get_stats()
+        assert stats["portfolio:project-list"]["requests"] == 2
+        assert stats["portfolio:project-list"]["queries"] == 5
+        assert stats["portfolio:project-detail"]["requests"] == 1
+        assert stats["portfolio:project-list"]["render_ms"] > 0
+
+    def test_duplicates_are_logged(self, user, sampled, settings, caplog):
+        settings.INSTRUMENTATION_DUPLICATE_THRESHOLD = 2
+        User.objects.create_user(username="other", password="pass")
+        request = RequestFactory().get("/")
+
+        with caplog.at_level(logging.INFO, logger="apps.portfolio.instrumentation"):
+            response = QueryInstrumentationMiddleware(lookup_users)(request)
+
+        assert 'desc="3 queries, 1 duplicated"' in response["Server-Timing"]
+        warning = next(record for record in caplog.records if record.levelno == logging.WARNING)
+        assert warning.instrumentation["executions"] == 2
+        info = next(record for record in caplog.records if record.levelno == logging.INFO)
+        assert info.instrumentation["route"] == "unresolved"
+        assert info.instrumentation["queries"] == 3
+
+    def test_async_requests(self, user, sampled):
+        async def view(request):
+            await User.objects.acount()
+            return HttpResponse()
+
+        middleware = QueryInstrumentationMiddleware(view)
+        response = async_to_sync(middleware)(RequestFactory().get("/"))
+        assert 'desc="1 queries"' in response["Server-Timing"]
+
+    def test_overlapping_async_requests(self, user, sampled):
+        """Concurrent requests sharing the connection each record their own queries."""
+        started, finished = asyncio.Event(), asyncio.Event()
+
+        async def first(request):
+            await User.objects.acount()
+            started.set()
+            await finished.wait()
+            await User.objects.acount()
+            return HttpResponse()
+
+        async def second(request):
+            await started.wait()
+            for _ in range(3):
+                await User.objects.filter(pk=user.pk).aexists()
+            finished.set()
+            return HttpResponse()
+
+        async def run():
+            return await asyncio.gather(
+                QueryInstrumentationMiddleware(first)(RequestFactory().get("/")),
+                QueryInstrumentationMiddleware(second)(RequestFactory().get("/")),
+            )
+
+        responses = async_to_sync(run)()
+        assert 'desc="2 queries, 1 duplicated"' in responses[0]["Server-Timing"]
+        assert 'desc="3 queries, 2 duplicated"' in responses[1]["Server-Timing"]
+        assert instrumentation.current_recorder.get() is None
+
+    def test_async_sync_views(self, user, sampled):
+        """Sync code run from an async request shares the recorder."""
+        middleware = QueryInstrumentationMiddleware(sync_to_async(lookup_users))
+        response = async_to_sync(middleware)(RequestFactory().get("/"))
+        assert 'desc="2 queries"' in response["Server-Timing"]
+
+    def test_asgi_handler(self, project, sampled):
+        client = AsyncClient()
+        for url in (reverse("portfolio:project-list"), reverse("portfolio:async-project-list")):
+            response = async_to_sync(client.get)(url)
+            assert response.status_code == status.HTTP_200_OK
+            assert "render;dur=" in response["Server-Timing"]
+            assert 'desc="0 queries"' not in response["Server-Timing"]
+
+    def test_stats_view_is_admin_only(self, api_client, authenticated_client, project, sampled):
+        api_client.get(reverse("portfolio:project-list"))
+        assert authenticated_client.get(reverse("portfolio:request-stats")).status_code == status.HTTP_403_FORBIDDEN
+
+        admin = User.objects.create_superuser(username="admin", password="pass")
+        api_client.force_authenticate(admin)
+        response = api_client.get(reverse("portfolio:request-stats"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["routes"]["portfolio:project-list"]["requests"] == 1
+
+        assert api_client.delete(reverse("portfolio:request-stats")).status_code == status.HTTP_204_NO_CONTENT
+        assert "portfolio:project-list" not in instrumentation.get_stats()
@@ -0,0 +1,82 @@
+"""
+Tests for the Prometheus metrics.
+"""
+
+from django.db import connection
+from django.urls import reverse
+
+from rest_framework import status
+
+import pytest
+from prometheus_client import REGISTRY
+
+from config import gunicorn
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestMetrics:
+    """Test request metrics and the scrape endpoint."""
+
+    def test_requests_are_recorded_per_route(self, api_client, project):
+        labels = {"route": "portfolio:project-list", "method": "GET"}
+        count = sample("portfolio_http_request_duration_seconds_count", **labels)
+        responses = sample("portfolio_http_responses_total", status="200", **labels)
+
+        api_client.get(reverse("portfolio:project-list"))
+
+        assert sample("portfolio_http_request_duration_seconds_count", **labels) == count + 1
+        assert sample("portfolio_http_responses_total", status="200", **labels) == responses + 1
+
+    def test_unresolved_requests(self, api_client):
+        labels = {"route": "unresolved", "method": "GET", "status": "404"}
+        responses = sample("portfolio_http_responses_total", **labels)
+        api_client.get("/does-not-exist/")
+        assert sample("portfolio_http_responses_total", **labels) == responses + 1
+
+    def test_cache_hits_and_misses(self, api_client, project):
+        hits = sample("portfolio_response_cache_requests_total", result="hit")
+        misses = sample("portfolio_response_cache_requests_total", result="miss")
+        for _ in range(2):
+            api_client.get(reverse("portfolio:project-list"))
+        assert sample("portfolio_response_cache_requests_total", result="miss") == misses + 1
+        assert sample("portfolio_response_cache_requests_total", result="hit") == hits + 1
+
+    def test_scrape(self, client, project):
+        client.get(reverse("portfolio:project-list"))
+        response = client.get(reverse("metrics"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("text/plain")
+        content = response.content.decode()
+        for name in (
+            "portfolio_http_request_duration_seconds_bucket",
+            "portfolio_worker_processes",
+            "portfolio_worker_resident_memory_bytes",
+        ):
+            assert name in content
+        if connection.vendor == "postgresql":
+            assert 'portfolio_db_server_connections{alias="default",state="active"}' in content
+            assert "portfolio_db_server_max_connections" in content
+
+    def test_scrape_token(self, client, settings):
+        settings.METRICS_TOKEN = "secret"
+        assert client.get(reverse("metrics")).status_code == status.HTTP_403_FORBIDDEN
+        response = client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer secret")
+        assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.unit
+class TestGunicornConfig:
+    """Test the multiprocess directory management."""
+
+    def test_on_starting_empties_directory(self, tmp_path, monkeypatch):
+        directory = tmp_path / "prometheus"
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(directory))
+        gunicorn.on_starting(None)
+        (directory / "counter_123.db").write_bytes(b"")
+        gunicorn.on_starting(None)
+        assert list(directory.iterdir()) == []
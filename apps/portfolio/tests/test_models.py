@@ -14,6 +14,8 @@ from apps.portfolio.models import (
     Experience,
     Project,
     Skill,
+    Tag,
+    Technology,
     UserProfile,
 )
 
@@ -67,6 +69,35 @@ class TestProject:
         """Test technology_list property."""
         assert project.technology_list == ["Django", "PostgreSQL", "Docker"]
 
+    def test_project_tags_are_normalized(self, project):
+        """Test that comma-separated tags are mirrored into Tag rows."""
+        assert set(project.tag_items.values_list("name", flat=True)) == {"python", "django", "rest"}
+        assert Tag.objects.get(name="django").normalized_name == "django"
+
+    def test_project_tags_resync_on_save(self, project):
+        """Test that editing the tag string rebuilds the relation, dropping duplicates."""
+        project.tags = "rest, api, rest"
+        project.save()
+        assert project.tag_list == ["rest", "api"]
+
+    def test_project_case_variant_tags_keep_the_first_spelling(self, project):
+        """Test that tags differing only by case are stored once, as first written."""
+        project.tags = "Python, rest, python"
+        project.save()
+        assert project.tag_list == ["Python", "rest"]
+
+    def test_project_update_fields_skips_resync(self, project):
+        """Test that saves not touching tags leave the relation alone."""
+        Tag.objects.filter(name="python").update(name="py")
+        project.title = "Renamed"
+        project.save(update_fields=["title"])
+        assert project.tag_list == ["py", "django", "rest"]
+
+    def test_terms_are_shared(self, project, experience):
+        """Test that a technology used twice is stored once."""
+        assert Technology.objects.filter(name="Django").count() == 1
+        assert Technology.objects.get(name="Django").experiences.get() == experience
+
     def test_project_ordering(self, user):
         """Test project ordering."""
         project1 = Project.objects.create(
@@ -0,0 +1,114 @@
+"""
+Tests for keyset pagination.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from django.urls import reverse
+
+from rest_framework import status
+
+import pytest
+
+from apps.portfolio.models import BlogPost, Skill
+
+
+@pytest.fixture
+def many_posts(user):
+    """Create posts with tied and missing publication dates."""
+    published = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    posts = []
+    for i in range(25):
+        posts.append(
+            BlogPost.objects.create(
+                author=user,
+                title=f"Post {i}",
+                slug=f"post-{i}",
+                content="Content",
+                status="published",
+                # Every third post is unpublished-dated, and dates repeat in pairs
+                published_at=None if i % 3 == 0 else published + timedelta(days=i // 2),
+            )
+        )
+    return posts
+
+
+def walk(client, url, params, key):
+    """Follow next links and return the visited ``key`` values and pages."""
+    values, pages = [], []
+    response = client.get(url, params)
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        pages.append(response.data)
+        values.extend(item[key] for item in response.data["results"])
+        if not response.data["next"]:
+            return values, pages
+        response = client.get(response.data["next"])
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestKeysetPagination:
+    """Test ?pagination=cursor on list endpoints."""
+
+    def test_cursor_pages_match_default_ordering(self, api_client, many_posts):
+        """Test that walking all cursor pages yields every post once, in order."""
+        url = reverse("portfolio:blogpost-list")
+        slugs, pages = walk(api_client, url, {"pagination": "cursor"}, "slug")
+
+        # NULL dates sort first in descending order, as on PostgreSQL
+        undated = [post for post in many_posts if post.published_at is None]
+        dated = [post for post in many_posts if post.published_at is not None]
+        expected = sorted(undated, key=lambda post: (post.created_at, post.pk), reverse=True) + sorted(
+            dated, key=lambda post: (post.published_at, post.created_at, post.pk), reverse=True
+        )
+        assert slugs == [post.slug for post in expected]
+        assert len(pages) == 2
+        assert "count" not in pages[0]
+
+    def test_previous_link_returns_previous_page(self, api_client, many_posts):
+        """Test that the previous link goes back to the same rows."""
+        url = reverse("portfolio:blogpost-list")
+        first = api_client.get(url, {"pagination": "cursor"}).data
+        assert first["previous"] is None
+
+        second = api_client.get(first["next"]).data
+        back = api_client.get(second["previous"]).data
+
+        assert [item["slug"] for item in back["results"]] == [item["slug"] for item in first["results"]]
+
+    def test_cursor_page_does_not_count(self, api_client, many_posts, django_assert_num_queries):
+        """Test that a cursor page issues no COUNT query."""
+        url = reverse("portfolio:blogpost-list")
+        next_url = api_client.get(url, {"pagination": "cursor"}).data["next"]
+
+        # page + tags prefetch
+        with django_assert_num_queries(2) as context:
+            api_client.get(next_url)
+        assert not any("COUNT(" in query["sql"] for query in context.captured_queries)
+
+    def test_cursor_follows_mixed_direction_ordering(self, api_client, user):
+        """Test keyset pagination over Skill's mixed ascending/descending ordering."""
+        for i in range(7):
+            Skill.objects.create(user=user, name=f"Skill {i}", category=["tool", "database"][i % 2], is_featured=i < 3)
+        url = reverse("portfolio:skill-list")
+        names, _ = walk(api_client, url, {"pagination": "cursor"}, "name")
+
+        assert names == list(
+            Skill.objects.order_by("-is_featured", "category", "order", "name", "pk").values_list("name", flat=True)
+        )
+
+    def test_invalid_cursor(self, api_client, many_posts):
+        """Test that a tampered cursor is rejected."""
+        url = reverse("portfolio:blogpost-list")
+        response = api_client.get(url, {"pagination": "cursor", "cursor": "not-a-cursor"})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_page_number_pagination_is_default(self, api_client, many_posts):
+        """Test that existing clients keep numbered pages."""
+        url = reverse("portfolio:blogpost-list")
+        response = api_client.get(url, {"page": 2})
+
+        assert response.data["count"] == 25
+        assert len(response.data["results"]) == 5
@@ -0,0 +1,153 @@
+"""
+Tests for the JSON renderer and parser.
+"""
+
+import datetime
+import decimal
+import io
+import json
+import uuid
+
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+
+from rest_framework import renderers
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APIRequestFactory
+
+import pytest
+
+from apps.portfolio import jsoncodec
+from apps.portfolio.parsers import JSONParser
+from apps.portfolio.renderers import JSONRenderer
+from apps.portfolio.serializers import (
+    BlogPostSerializer,
+    EducationSerializer,
+    ExperienceSerializer,
+    ProjectSerializer,
+    SkillSerializer,
+    UserProfileSerializer,
+)
+
+BACKENDS = [
+    pytest.param(jsoncodec.dumps_json, id="stdlib"),
+    pytest.param(
+        jsoncodec.dumps_orjson,
+        id="orjson",
+        marks=pytest.mark.skipif(jsoncodec.orjson is None, reason="orjson is not installed"),
+    ),
+]
+
+
+def drf_render(data):
+    return renderers.JSONRenderer().render(data)
+
+
+@pytest.fixture
+def context():
+    return {"request": APIRequestFactory().get("/api/")}
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+@pytest.mark.parametrize("dumps", BACKENDS)
+class TestJSONCodec:
+    """Test that jsoncodec renders the bytes DRF's JSONRenderer renders."""
+
+    @pytest.mark.parametrize(
+        "serializer_class, fixture",
+        [
+            (UserProfileSerializer, "user_profile"),
+            (ProjectSerializer, "project"),
+            (ExperienceSerializer, "experience"),
+            (EducationSerializer, "education"),
+            (SkillSerializer, "skill"),
+            (BlogPostSerializer, "blog_post"),
+        ],
+    )
+    def test_serializers(self, dumps, serializer_class, fixture, request, context):
+        instance = request.getfixturevalue(fixture)
+        single = serializer_class(instance, context=context).data
+        many = serializer_class([instance, instance], many=True, context=context).data
+        assert dumps(single) == drf_render(single)
+        assert dumps(many) == drf_render(many)
+        assert json.loads(dumps(many)) == json.loads(json.dumps(many))
+
+    def test_text(self, dumps, blog_post, context):
+        blog_post.title = 'Café ☕ \u2028 \u2029 "quoted" </script>'
+        data = BlogPostSerializer(blog_post, context=context).data
+        assert dumps(data) == drf_render(data)
+        assert b"\\u2028" in dumps(data) and "Café ☕".encode() in dumps(data)
+
+    def test_python_types(self, dumps):
+        data = {
+            "datetime": datetime.datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+            "aware": timezone.make_aware(
+                datetime.datetime(2024, 6, 1, 12), datetime.timezone(datetime.timedelta(hours=2))
+            ),
+            "naive": datetime.datetime(2024, 1, 2),
+            "date": datetime.date(2024, 1, 2),
+            "time": datetime.time(12, 30, 15, 100),
+            "timedelta": datetime.timedelta(minutes=90),
+            "decimal": decimal.Decimal("5.50"),
+            "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "lazy": gettext_lazy("Expert"),
+            "tuple": (1, 2),
+            "set": {"a"},
+            "bytes": b"raw",
+            "big": 2**70,
+            "float": 0.1,
+            "nested": [{"none": None, "bool": True}],
+        }
+        assert dumps(data) == drf_render(data)
+
+    def test_errors(self, dumps):
+        with pytest.raises(ValueError):
+            dumps({"time": datetime.time(12, tzinfo=datetime.timezone.utc)})
+        with pytest.raises(TypeError):
+            dumps({"object": object()})
+
+
+@pytest.mark.unit
+class TestJSONRendererAndParser:
+    """Test the renderer and parser registered in REST_FRAMEWORK."""
+
+    def test_indent_falls_back_to_drf(self):
+        data = {"a": [1, 2]}
+        assert JSONRenderer().render(data, "application/json; indent=2") == renderers.JSONRenderer().render(
+            data, "application/json; indent=2"
+        )
+        assert JSONRenderer().render(None) == b""
+
+    def test_parse(self):
+        content = json.dumps({"title": "Café", "tags": ["a"], "big": 2**70}).encode()
+        assert JSONParser().parse(io.BytesIO(content)) == {"title": "Café", "tags": ["a"], "big": 2**70}
+        latin = json.dumps({"title": "Café"}, ensure_ascii=False).encode("latin-1")
+        assert JSONParser().parse(io.BytesIO(latin), parser_context={"encoding": "latin-1"}) == {"title": "Café"}
+
+    @pytest.mark.parametrize("content", [b"{", b'{"value": NaN}', b"\xff"])
+    def test_parse_errors(self, content):
+        with pytest.raises(ParseError, match="JSON parse error"):
+            JSONParser().parse(io.BytesIO(content))
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestJSONEndpoints:
+    """Test the API through the renderer and parser."""
+
+    def test_round_trip(self, authenticated_client, skill):
+        url = reverse("portfolio:skill-detail", kwargs={"pk": skill.pk})
+        response = authenticated_client.patch(
+            url, data='{"description": "Café \\u2028 au lait"}', content_type="application/json"
+        )
+        assert response.status_code == 200
+        assert b'"description":"Caf\xc3\xa9 \\u2028 au lait"' in response.content
+
+    def test_invalid_json(self, authenticated_client):
+        response = authenticated_client.post(
+            reverse("portfolio:skill-list"), data="{not json", content_type="application/json"
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("JSON parse error")
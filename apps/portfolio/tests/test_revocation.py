@@ -0,0 +1,155 @@
+"""
+Tests for the revocation of JWT tokens.
+"""
+
+import uuid
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.urls import reverse
+
+from rest_framework import status
+
+import pytest
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from apps.portfolio.authentication import token_cache
+from apps.portfolio.revocation import BloomFilter, RevocationList, revocations
+
+
+@pytest.fixture(autouse=True)
+def clear_local_state():
+    token_cache.clear()
+    revocations.clear()
+
+
+@pytest.fixture
+def tokens(api_client, user):
+    response = api_client.post(reverse("token_obtain_pair"), {"username": "testuser", "password": "testpass123"})
+    return response.data
+
+
+@pytest.mark.unit
+class TestBloomFilter:
+    """Test the Bloom filter of revoked tokens."""
+
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        bloom = BloomFilter(1000)
+        added = [uuid.uuid4().hex for _ in range(1000)]
+        for value in added:
+            bloom.add(value)
+        assert all(value in bloom for value in added)
+        false_positives = sum(uuid.uuid4().hex in bloom for _ in range(10000))
+        assert false_positives < 300
+
+    def test_size(self):
+        # ~9.6 bits per item at 1%
+        assert len(BloomFilter(10000).bits) < 12 * 1024
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestTokenRevocation:
+    """Test the revoke endpoint and the checks of revoked tokens."""
+
+    def test_logout_revokes_both_tokens(self, api_client, tokens):
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        assert api_client.get(reverse("portfolio:project-list")).status_code == status.HTTP_200_OK
+
+        response = api_client.post(reverse("token_revoke"), {"refresh": tokens["refresh"]})
+        assert response.status_code == status.HTTP_200_OK
+
+        response = api_client.get(reverse("portfolio:project-list"))
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.data["detail"] == "Token is revoked"
+
+        api_client.credentials()
+        response = api_client.post(reverse("token_refresh"), {"refresh": tokens["refresh"]})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    @pytest.mark.parametrize("expired", [True, False], ids=["expired", "garbage"])
+    def test_logout_with_an_unusable_access_token(self, api_client, user, tokens, expired):
+        if expired:
+            access = AccessToken.for_user(user)
+            access.set_exp(lifetime=-timedelta(minutes=1))
+        else:
+            access = "garbage"
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        response = api_client.post(reverse("token_revoke"), {"refresh": tokens["refresh"]})
+        assert response.status_code == status.HTTP_200_OK
+
+        api_client.credentials()
+        response = api_client.post(reverse("token_refresh"), {"refresh": tokens["refresh"]})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_revoking_the_refresh_token_only(self, api_client, tokens):
+        assert api_client.post(reverse("token_revoke"), {"refresh": tokens["refresh"]}).status_code == 200
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        assert api_client.get(reverse("portfolio:project-list")).status_code == status.HTTP_200_OK
+
+    def test_invalid_refresh_token(self, api_client, tokens):
+        response = api_client.post(reverse("token_revoke"), {"refresh": tokens["access"]})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_rotated_refresh_tokens_are_revoked(self, api_client, tokens, monkeypatch):
+        monkeypatch.setattr(api_settings, "ROTATE_REFRESH_TOKENS", True)
+        response = api_client.post(reverse("token_refresh"), {"refresh": tokens["refresh"]})
+        assert response.status_code == status.HTTP_200_OK
+        assert "refresh" in response.data
+        response = api_client.post(reverse("token_refresh"), {"refresh": tokens["refresh"]})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestRevocationList:
+    """Test the revocation list shared by the workers."""
+
+    def test_other_workers_sync(self, user, settings):
+        other = RevocationList()
+        first, second = AccessToken.for_user(user), AccessToken.for_user(user)
+        revocations.revoke(first)
+        assert other.is_revoked(first)
+
+        settings.API_AUTH_REVOCATION_SYNC_INTERVAL = 60
+        revocations.revoke(second)
+        assert not other.is_revoked(second)
+        settings.API_AUTH_REVOCATION_SYNC_INTERVAL = 0
+        assert other.is_revoked(second)
+
+    def test_checks_stay_in_memory(self, user, monkeypatch):
+        token = AccessToken.for_user(user)
+        assert not revocations.is_revoked(token)
+        monkeypatch.setattr(cache, "get", lambda *args, **kwargs: pytest.fail("Cache read"))
+        assert not revocations.is_revoked(AccessToken.for_user(user))
+
+    def test_false_positives_are_ruled_out(self, user):
+        token = AccessToken.for_user(user)
+        window = revocations.window(token)
+        revocations.get_filter(window).bloom.add(token["jti"])
+        assert not revocations.is_revoked(token)
+
+    def test_expired_tokens_are_not_stored(self, user):
+        token = RefreshToken.for_user(user)
+        token.set_exp(lifetime=timedelta(seconds=-1))
+        revocations.revoke(token)
+        assert cache.get(f"auth:revoked:{token['jti']}") is None
+
+    def test_entries_expire_with_the_token(self, user):
+        token = AccessToken.for_user(user)
+        revocations.revoke(token)
+        ttl = cache._expire_info[cache.make_and_validate_key(f"auth:revoked:{token['jti']}")]
+        assert ttl <= token["exp"] + 1
+
+    def test_lost_logs(self, user, settings):
+        settings.API_AUTH_REVOCATION_SYNC_INTERVAL = 0
+        other = RevocationList()
+        for _ in range(2):
+            revocations.revoke(AccessToken.for_user(user))
+        other.is_revoked(AccessToken.for_user(user))
+
+        cache.clear()
+        token = AccessToken.for_user(user)
+        revocations.revoke(token)
+        assert other.is_revoked(token)
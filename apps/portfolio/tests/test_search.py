@@ -0,0 +1,72 @@
+"""
+Tests for full-text search.
+"""
+
+from django.db import connection
+from django.urls import reverse
+
+import pytest
+
+from apps.portfolio.models import BlogPost
+
+postgres_only = pytest.mark.skipif(connection.vendor != "postgresql", reason="Full-text search requires PostgreSQL")
+
+
+@pytest.fixture
+def posts(user):
+    """Create posts matching "django" in different fields."""
+    common = {"author": user, "status": "published"}
+    return [
+        BlogPost.objects.create(title="Deploying apps", slug="content-match", content="Notes about Django", **common),
+        BlogPost.objects.create(title="Django in depth", slug="title-match", content="Internals", **common),
+        BlogPost.objects.create(title="Gardening", slug="no-match", content="Tomatoes and basil", **common),
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestFullTextSearch:
+    """Test the full-text search filter backend."""
+
+    def test_search_matches_any_field(self, api_client, posts):
+        """Test that search finds posts by title and content."""
+        url = reverse("portfolio:blogpost-list")
+        response = api_client.get(url, {"search": "django"})
+
+        slugs = {item["slug"] for item in response.data["results"]}
+        assert slugs == {"content-match", "title-match"}
+
+    @postgres_only
+    def test_title_matches_rank_first(self, api_client, posts):
+        """Test that results are ordered by weighted rank."""
+        url = reverse("portfolio:blogpost-list")
+        response = api_client.get(url, {"search": "django"})
+
+        assert [item["slug"] for item in response.data["results"]] == ["title-match", "content-match"]
+
+    @postgres_only
+    def test_search_uses_stemming(self, api_client, posts):
+        """Test that the stored vector is stemmed."""
+        url = reverse("portfolio:blogpost-list")
+        response = api_client.get(url, {"search": "deploy"})
+
+        assert [item["slug"] for item in response.data["results"]] == ["content-match"]
+
+    @postgres_only
+    def test_search_vector_follows_updates(self, api_client, posts):
+        """Test that the trigger refreshes the vector when a post is edited."""
+        post = posts[2]
+        post.content = "Growing Django plugins"
+        post.save()
+        url = reverse("portfolio:blogpost-list")
+        response = api_client.get(url, {"search": "plugins"})
+
+        assert [item["slug"] for item in response.data["results"]] == ["no-match"]
+
+    @postgres_only
+    def test_explicit_ordering_wins(self, api_client, posts):
+        """Test that ?ordering= overrides rank ordering."""
+        url = reverse("portfolio:blogpost-list")
+        response = api_client.get(url, {"search": "django", "ordering": "title"})
+
+        assert [item["slug"] for item in response.data["results"]] == ["content-match", "title-match"]
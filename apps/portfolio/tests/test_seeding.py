@@ -0,0 +1,118 @@
+"""
+Tests for the synthetic data generator and the seed_data command.
+"""
+
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db import connection
+
+import pytest
+
+from apps.portfolio import seeding
+from apps.portfolio.cache import get_generations
+from apps.portfolio.models import BlogPost, Experience, Project, Skill, Tag, sync_terms
+
+User = get_user_model()
+
+postgres_only = pytest.mark.skipif(connection.vendor != "postgresql", reason="COPY requires PostgreSQL")
+
+
+def snapshot():
+    """Return the generated content, without the database ids and timestamps."""
+    return {
+        "projects": list(Project.objects.order_by("slug").values_list("slug", "description", "tags", "start_date")),
+        "posts": list(BlogPost.objects.order_by("slug").values_list("slug", "content", "published_at")),
+        "project_tags": sorted(
+            (project.slug, [tag.name for tag in project.tag_items.order_by("project_tags__position")])
+            for project in Project.objects.all()
+        ),
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestGenerate:
+    """Test the batched generator."""
+
+    def test_counts_and_batches(self, django_assert_max_num_queries):
+        # 1 profile + 2 + 2 + 1 + 1 + 1 rows per user: 2 users per batch
+        with django_assert_max_num_queries(60):
+            created = seeding.generate(5, projects=2, posts=2, skills=1, experiences=1, education=1, batch_size=16)
+        assert created[User] == 5
+        assert created[Project] == Project.objects.count() == 10
+        assert created[Skill] == 5
+        assert Experience.objects.filter(is_current=True).count() == 5
+
+    def test_incremental(self):
+        seeding.generate(2, prefix="grow")
+        created = seeding.generate(3, prefix="grow")
+        assert created[User] == 1
+        assert seeding.generate(3, prefix="grow") == {}
+        assert User.objects.filter(username__startswith="grow_").count() == 3
+
+    def test_deterministic(self):
+        seeding.generate(3, seed=4, batch_size=10)
+        first = snapshot()
+        User.objects.filter(username__startswith="seed_user_").delete()
+        seeding.generate(3, seed=4, batch_size=1000)
+        assert snapshot() == first
+
+        User.objects.filter(username__startswith="seed_user_").delete()
+        seeding.generate(3, seed=5)
+        assert snapshot()["projects"] != first["projects"]
+
+    def test_terms_match_sync_terms(self):
+        seeding.generate(2, projects=3, posts=2)
+        project = Project.objects.first()
+        post = BlogPost.objects.first()
+        generated = (list(project.tag_items.all()), list(project.technology_items.all()), list(post.tag_items.all()))
+        sync_terms(project, "tags", "tag_items")
+        sync_terms(project, "technologies", "technology_items")
+        sync_terms(post, "tags", "tag_items")
+        assert (list(project.tag_items.all()), list(project.technology_items.all()), list(post.tag_items.all())) == (
+            generated
+        )
+        assert Tag.objects.filter(name__in=seeding.TAGS).count() == Tag.objects.count()
+
+    def test_cache_is_invalidated(self):
+        before = get_generations([Project])
+        seeding.generate(1)
+        assert get_generations([Project]) != before
+
+    @postgres_only
+    def test_copy(self):
+        seeding.generate(3, seed=2, use_copy=True)
+        copied = snapshot()
+        assert Project.objects.filter(search_vector__isnull=True).count() == 0
+
+        User.objects.filter(username__startswith="seed_user_").delete()
+        seeding.generate(3, seed=2)
+        assert snapshot() == copied
+
+        # Ids were taken from the sequences: regular inserts still work
+        Project.objects.create(user=User.objects.first(), title="After", slug="after", description="x", tags="x")
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestSeedDataCommand:
+    """Test the seed_data options."""
+
+    def test_demo_only_by_default(self):
+        call_command("seed_data", stdout=StringIO())
+        assert list(User.objects.values_list("username", flat=True)) == ["demo_user"]
+
+    def test_synthetic_users(self):
+        out = StringIO()
+        call_command("seed_data", users=2, projects_per_user=4, posts_per_user=1, prefix="load", stdout=out)
+        assert User.objects.filter(username__startswith="load_").count() == 2
+        assert Project.objects.filter(user__username__startswith="load_").count() == 8
+        assert "Generated" in out.getvalue()
+
+    def test_copy_requires_postgres(self):
+        if connection.vendor == "postgresql":
+            pytest.skip("COPY is available")
+        with pytest.raises(CommandError):
+            call_command("seed_data", users=1, copy=True, stdout=StringIO())
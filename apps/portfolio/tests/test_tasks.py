@@ -0,0 +1,166 @@
+"""
+Tests for the database task queue.
+"""
+
+import threading
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.utils import timezone
+
+import pytest
+
+from apps.portfolio import tasks
+from apps.portfolio.management.commands.run_worker import Command
+from apps.portfolio.models import Task
+
+postgres_only = pytest.mark.skipif(connection.vendor != "postgresql", reason="SKIP LOCKED requires PostgreSQL")
+
+calls = []
+
+
+@tasks.task("tests.record")
+def record(value):
+    calls.append(value)
+
+
+@tasks.task("tests.explode")
+def explode():
+    raise RuntimeError("boom")
+
+
+@pytest.fixture(autouse=True)
+def queue_settings(settings):
+    settings.TASK_QUEUE_EAGER = False
+    settings.TASK_RETRY_DELAY = 10
+    calls.clear()
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestTaskQueue:
+    """Test enqueuing, claiming and retrying tasks."""
+
+    def test_enqueue_and_run(self):
+        task = tasks.enqueue(record, value=1)
+
+        assert task.status == "queued"
+        assert tasks.run_next("test") is True
+        assert calls == [1]
+        assert not Task.objects.exists()
+        assert tasks.run_next("test") is False
+
+    def test_enqueue_by_name_and_unknown_task(self):
+        assert tasks.enqueue("tests.record", value=2).name == "tests.record"
+        with pytest.raises(ValueError):
+            tasks.enqueue("tests.missing")
+
+    def test_priority_then_age_order(self):
+        tasks.enqueue(record, value="low", priority=-1)
+        tasks.enqueue(record, value="first")
+        tasks.enqueue(record, value="urgent", priority=5)
+        tasks.enqueue(record, value="second")
+
+        while tasks.run_next("test"):
+            pass
+
+        assert calls == ["urgent", "first", "second", "low"]
+
+    def test_delayed_task_waits(self):
+        tasks.enqueue(record, value=1, delay=60)
+
+        assert tasks.run_next("test") is False
+        Task.objects.update(run_after=timezone.now())
+        assert tasks.run_next("test") is True
+
+    def test_failures_are_retried_with_backoff_then_kept(self):
+        task = tasks.enqueue(explode, max_attempts=2)
+
+        before = timezone.now()
+        tasks.run_next("test")
+        task.refresh_from_db()
+        assert task.status == "queued"
+        assert task.attempts == 1
+        assert "RuntimeError: boom" in task.last_error
+        assert task.run_after >= before + timedelta(seconds=10)
+
+        Task.objects.update(run_after=timezone.now())
+        tasks.run_next("test")
+        task.refresh_from_db()
+        assert task.status == "failed"
+        assert task.attempts == 2
+        assert tasks.run_next("test") is False
+
+    def test_expired_locks_are_released(self, settings):
+        task = tasks.enqueue(record, value=1)
+        tasks.claim("dead-worker")
+        Task.objects.update(locked_at=timezone.now() - timedelta(seconds=settings.TASK_LOCK_TIMEOUT + 1))
+
+        assert tasks.requeue_expired() == 1
+        task.refresh_from_db()
+        assert task.status == "queued"
+        assert task.locked_by == ""
+
+    def test_eager_mode_runs_on_commit(self, settings, django_capture_on_commit_callbacks):
+        settings.TASK_QUEUE_EAGER = True
+        with django_capture_on_commit_callbacks(execute=True):
+            assert tasks.enqueue(record, value="eager") is None
+            assert calls == []
+
+        assert calls == ["eager"]
+        assert not Task.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.unit
+class TestWorker:
+    """Test the worker command and concurrent claims."""
+
+    def test_run_worker_burst(self):
+        for value in range(5):
+            tasks.enqueue(record, value=value)
+        tasks.enqueue(explode, max_attempts=1)
+
+        # SQLite serializes writers: concurrent threads fail with "table is locked"
+        concurrency = "2" if connection.vendor == "postgresql" else "1"
+        call_command("run_worker", "--burst", "--concurrency", concurrency)
+
+        assert sorted(calls) == [0, 1, 2, 3, 4]
+        assert list(Task.objects.values_list("name", "status")) == [("tests.explode", "failed")]
+
+    def test_requeue_once_per_lease(self, settings):
+        settings.TASK_LOCK_TIMEOUT = 60
+        command = Command()
+        command.lock = threading.Lock()
+        command.requeued_at = 0
+        with mock.patch.object(tasks, "requeue_expired") as requeue, mock.patch("time.monotonic") as monotonic:
+            for now in (30, 61, 90, 122):
+                monotonic.return_value = now
+                command.requeue_expired()
+        assert requeue.call_count == 2
+
+    @postgres_only
+    def test_locked_tasks_are_skipped(self):
+        first = tasks.enqueue(record, value=1)
+        second = tasks.enqueue(record, value=2)
+        locked, release = threading.Event(), threading.Event()
+
+        def hold_first():
+            with transaction.atomic():
+                Task.objects.select_for_update().get(pk=first.pk)
+                locked.set()
+                release.wait(5)
+            connection.close()
+
+        thread = threading.Thread(target=hold_first)
+        thread.start()
+        locked.wait(5)
+        try:
+            claimed = tasks.claim("test")
+        finally:
+            release.set()
+            thread.join()
+
+        assert claimed.pk == second.pk
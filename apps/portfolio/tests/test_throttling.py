@@ -0,0 +1,162 @@
+"""
+Tests for the rate limiting of the API.
+"""
+
+from django.contrib.auth.backends import ModelBackend
+from django.urls import reverse
+
+from rest_framework import status
+
+import pytest
+
+from apps.portfolio.throttling import SlidingWindowThrottle
+
+
+@pytest.fixture
+def rates(settings):
+    """Set the throttle rates of the test."""
+
+    def set_rates(**rates):
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            "DEFAULT_THROTTLE_RATES": {**settings.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"], **rates},
+        }
+
+    return set_rates
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestThrottling:
+    """Test the 429 responses of the throttled endpoints."""
+
+    def test_login_is_throttled_before_hashing(self, api_client, user, rates, monkeypatch):
+        rates(login="3/min")
+        calls = []
+        authenticate = ModelBackend.authenticate
+        monkeypatch.setattr(
+            ModelBackend, "authenticate", lambda *args, **kwargs: calls.append(1) or authenticate(*args, **kwargs)
+        )
+
+        url = reverse("token_obtain_pair")
+        for _ in range(3):
+            response = api_client.post(url, {"username": "testuser", "password": "wrong"})
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        response = api_client.post(url, {"username": "testuser", "password": "testpass123"})
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        # Up to the next window, plus the time a third of the full current window takes to slide out
+        assert 1 <= int(response["Retry-After"]) <= 80
+        assert len(calls) == 3
+
+        # Another client IP has its own budget
+        response = api_client.post(url, {"username": "testuser", "password": "testpass123"}, REMOTE_ADDR="10.0.0.2")
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_login_is_throttled_per_username(self, api_client, user, rates):
+        rates(login_username="2/hour")
+        url = reverse("token_obtain_pair")
+        for i in range(2):
+            api_client.post(url, {"username": "TestUser", "password": "wrong"}, REMOTE_ADDR=f"10.0.0.{i}")
+        response = api_client.post(url, {"username": "testuser", "password": "testpass123"}, REMOTE_ADDR="10.0.0.9")
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_only_failed_logins_count_per_username(self, api_client, user, rates):
+        rates(login_username="2/hour")
+        url = reverse("token_obtain_pair")
+        for i in range(3):
+            response = api_client.post(
+                url, {"username": "testuser", "password": "testpass123"}, REMOTE_ADDR=f"10.0.0.{i}"
+            )
+            assert response.status_code == status.HTTP_200_OK
+        api_client.post(url, {"username": "testuser", "password": "wrong"})
+        response = api_client.post(url, {"username": "testuser", "password": "testpass123"})
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_action_scope(self, api_client, blog_post, rates):
+        rates(views="2/min")
+        url = reverse("portfolio:blogpost-increment-views", kwargs={"slug": blog_post.slug})
+        assert [api_client.post(url).status_code for _ in range(3)] == [200, 200, 429]
+        # Other actions are not limited by the scope
+        assert api_client.get(reverse("portfolio:blogpost-list")).status_code == status.HTTP_200_OK
+
+    def test_bulk_scope(self, authenticated_client, rates):
+        rates(bulk="1/min")
+        url = reverse("portfolio:skill-list")
+        items = [{"name": "Go", "category": "tool", "level": 5}]
+        assert authenticated_client.post(url, items, format="json").status_code == status.HTTP_201_CREATED
+        assert authenticated_client.post(url, items, format="json").status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert authenticated_client.patch(url, [], format="json").status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        # Single creates are not bulk writes
+        project = {"title": "A", "slug": "a", "description": "x", "tags": "api", "technologies": "Redis"}
+        response = authenticated_client.post(reverse("portfolio:project-list"), project, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+
+    def test_anonymous(self, api_client, rates):
+        rates(anon="2/min")
+        url = reverse("portfolio:skill-list")
+        assert [api_client.get(url).status_code for _ in range(3)] == [200, 200, 429]
+
+    def test_users(self, authenticated_client, rates):
+        rates(anon="1/min", user="3/min")
+        url = reverse("portfolio:skill-list")
+        assert [authenticated_client.get(url).status_code for _ in range(4)] == [200, 200, 200, 429]
+
+    def test_disabled(self, api_client, rates, settings):
+        rates(anon="1/min")
+        settings.API_THROTTLE_ENABLED = False
+        url = reverse("portfolio:skill-list")
+        assert {api_client.get(url).status_code for _ in range(3)} == {200}
+
+    def test_forwarded_ip_behind_one_proxy(self, api_client, rates):
+        rates(anon="1/min")
+        url = reverse("portfolio:skill-list")
+        assert api_client.get(url, HTTP_X_FORWARDED_FOR="1.1.1.1, 10.0.0.1").status_code == 200
+        # Spoofed addresses before the one added by the proxy are ignored
+        assert api_client.get(url, HTTP_X_FORWARDED_FOR="2.2.2.2, 10.0.0.1").status_code == 429
+        assert api_client.get(url, HTTP_X_FORWARDED_FOR="1.1.1.1, 10.0.0.2").status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestSlidingWindow:
+    """Test the sliding window counter."""
+
+    def allow(self, throttle, request):
+        return throttle.allow_request(request, None)
+
+    @pytest.fixture
+    def throttle(self, rates, rf):
+        rates(anon="10/min")
+        throttle = SlidingWindowThrottle()
+        throttle.scope = "anon"
+        throttle.timer = Clock(6000.0)
+        throttle.get_cache_key = lambda request, view: "throttle:test"
+        return throttle
+
+    def test_previous_window_slides_out(self, throttle):
+        assert all(self.allow(throttle, None) for _ in range(10))
+        assert not self.allow(throttle, None)
+        assert throttle.wait() == pytest.approx(60 + 6)
+
+        # A quarter into the next window, the previous one still weighs 7.5 requests
+        throttle.timer.now = 6075.0
+        assert [self.allow(throttle, None) for _ in range(3)] == [True, True, False]
+        # One more request fits once half a request more has slid out (3 seconds)
+        assert throttle.wait() == pytest.approx(3)
+        throttle.timer.now = 6079.0
+        assert self.allow(throttle, None)
+
+    def test_rejected_requests_do_not_count(self, throttle):
+        for _ in range(20):
+            self.allow(throttle, None)
+        # The previous window counts 10 requests: the next one is half free half way through
+        throttle.timer.now = 6090.0
+        assert sum(self.allow(throttle, None) for _ in range(10)) == 5
@@ -0,0 +1,187 @@
+"""
+Rate limiting of the API.
+
+DRF's ``SimpleRateThrottle`` stores a list of timestamps per client with a
+get then a set, which concurrent workers overwrite. ``SlidingWindowThrottle``
+counts requests with atomic ``incr`` in the cache ``API_THROTTLE_CACHE_ALIAS``
+(shared by the workers: Redis in production), per fixed window of the rate's
+duration. The previous window weighs in proportion to the part of it the
+sliding window still covers, which approximates a true sliding window with
+two counters per client.
+
+Throttles run in ``APIView.initial()``, before the handler: a rejected request
+gets ``429 Too Many Requests`` with ``Retry-After`` before any serializer,
+password hash or query runs (the user lookup authenticating writes aside).
+
+Rates are set in ``REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]``, None disabling
+a scope:
+
+- ``anon`` and ``user``: every request, per IP or per authenticated user;
+- the scope of a ViewSet action, per user (IP for anonymous clients) and per
+  scope: ``@action(throttle_scope=...)`` or ``throttle_scopes`` mapping action
+  names (or the name ``get_throttle_action()`` returns) to scopes on the view;
+- ``login``: token requests per IP;
+- ``login_username``: failed token requests per username. This throttle only
+  checks the count, ``TokenObtainPairView`` (views.py) records the requests
+  whose credentials are rejected: password guessing uses up the budget of a
+  username, the successful logins of its user do not. ``login`` stays the
+  main control.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class SlidingWindowThrottle(SimpleRateThrottle):
+    """Sliding window counter over atomic cache increments (see the module docstring)."""
+
+    cache_format = "throttle:%(scope)s:%(ident)s"
+
+    def __init__(self):
+        # The rate depends on the scope, resolved per request
+        pass
+
+    def get_scope(self, view):
+        return self.scope
+
+    def get_rate(self):
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def get_window_key(self, request, view):
+        """
+        Return the cache key counting the requests of the current window, or None if ``request`` is not throttled.
+
+        Sets the rate, the time elapsed in the window and the count of the
+        previous window.
+        """
+        if not settings.API_THROTTLE_ENABLED:
+            return None
+        self.scope = self.get_scope(view)
+        rate = self.get_rate() if self.scope else None
+        if rate is None:
+            return None
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return None
+        self.num_requests, self.duration = self.parse_rate(rate)
+
+        self.cache = caches[settings.API_THROTTLE_CACHE_ALIAS]
+        window, self.elapsed = divmod(self.timer(), self.duration)
+        self.previous = self.cache.get(f"{key}:{int(window) - 1}", 0)
+        return f"{key}:{int(window)}"
+
+    def increment(self, current):
+        try:
+            return self.cache.incr(current)
+        except ValueError:
+            # First request of the window; the key lives until the next window ends
+            return 1 if self.cache.add(current, 1, self.duration * 2) else self.cache.incr(current)
+
+    def allow_request(self, request, view):
+        current = self.get_window_key(request, view)
+        if current is None:
+            return True
+        count = self.increment(current)
+        if self.weighted(count) <= self.num_requests:
+            return True
+        # Rejected requests do not count
+        self.cache.decr(current)
+        self.count = count - 1
+        return False
+
+    def weighted(self, count):
+        return self.previous * (1 - self.elapsed / self.duration) + count
+
+    def wait(self):
+        """Seconds until the next request is allowed, if no other request comes meanwhile."""
+        if not self.num_requests:
+            return None
+        count = self.count + 1
+        if count <= self.num_requests:
+            # Once enough of the previous window has slid out
+            return max(0.0, self.duration * (1 - (self.num_requests - count) / self.previous) - self.elapsed)
+        # In the next window, once enough of the current one has slid out
+        slide = max(0.0, self.duration * (1 - (self.num_requests - 1) / self.count))
+        return self.duration - self.elapsed + slide
+
+
+class AnonThrottle(SlidingWindowThrottle):
+    """Every request of anonymous clients, per IP."""
+
+    scope = "anon"
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return None
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+
+class UserThrottle(SlidingWindowThrottle):
+    """Every request of authenticated users, per user."""
+
+    scope = "user"
+
+    def get_cache_key(self, request, view):
+        if not (request.user and request.user.is_authenticated):
+            return None
+        return self.cache_format % {"scope": self.scope, "ident": request.user.pk}
+
+
+class ScopedThrottle(SlidingWindowThrottle):
+    """Requests to the view actions with a throttle scope, per scope and per user or IP."""
+
+    scope = None
+
+    def get_scope(self, view):
+        scopes = getattr(view, "throttle_scopes", {})
+        get_action = getattr(view, "get_throttle_action", None)
+        action = get_action() if get_action else getattr(view, "action", None)
+        return scopes.get(action) or getattr(view, "throttle_scope", None)
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = f"user:{request.user.pk}"
+        else:
+            ident = f"ip:{self.get_ident(request)}"
+        return self.cache_format % {"scope": self.scope, "ident": ident}
+
+
+class LoginThrottle(SlidingWindowThrottle):
+    """Token requests, per IP."""
+
+    scope = "login"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+
+class LoginUsernameThrottle(SlidingWindowThrottle):
+    """Failed token requests, per username tried, whatever the IP (see the module docstring)."""
+
+    scope = "login_username"
+
+    def allow_request(self, request, view):
+        current = self.get_window_key(request, view)
+        if current is None:
+            return True
+        self.count = self.cache.get(current, 0)
+        return self.weighted(self.count + 1) <= self.num_requests
+
+    def record_failure(self, request, view):
+        """Count a token request whose credentials were rejected."""
+        current = self.get_window_key(request, view)
+        if current is not None:
+            self.increment(current)
+
+    def get_cache_key(self, request, view):
+        username = request.data.get("username") if hasattr(request.data, "get") else None
+        if not isinstance(username, str) or not username:
+            return None
+        # Hashed: usernames are not valid cache keys for every backend
+        ident = hashlib.sha256(username.lower().encode()).hexdigest()
+        return self.cache_format % {"scope": self.scope, "ident": ident}
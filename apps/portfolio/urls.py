@@ -4,13 +4,15 @@ URL configuration for portfolio app.
 
 from django.urls import include, path
 
-from rest_framework.routers import DefaultRouter
-
+from . import async_views
+from .bulk import BulkRouter
 from .views import (
     BlogPostViewSet,
     EducationViewSet,
     ExperienceViewSet,
+    PortfolioBundleViewSet,
     ProjectViewSet,
+    RequestStatsView,
     SkillViewSet,
     UserProfileViewSet,
 )
@@ -18,14 +20,26 @@ from .views import (
 app_name = "portfolio"
 
 # Create a router and register our viewsets
-router = DefaultRouter()
+router = BulkRouter()
 router.register(r"profiles", UserProfileViewSet, basename="profile")
 router.register(r"projects", ProjectViewSet, basename="project")
 router.register(r"experiences", ExperienceViewSet, basename="experience")
 router.register(r"education", EducationViewSet, basename="education")
 router.register(r"skills", SkillViewSet, basename="skill")
 router.register(r"blog", BlogPostViewSet, basename="blogpost")
+router.register(r"users", PortfolioBundleViewSet, basename="user")
+
+# Async read-only mirror of the public endpoints (see async_views.py)
+async_urlpatterns = [
+    path("projects/", async_views.project_list, name="async-project-list"),
+    path("projects/<slug:slug>/", async_views.project_detail, name="async-project-detail"),
+    path("blog/", async_views.blogpost_list, name="async-blogpost-list"),
+    path("blog/<slug:slug>/", async_views.blogpost_detail, name="async-blogpost-detail"),
+    path("users/<str:username>/bundle/", async_views.user_bundle, name="async-user-bundle"),
+]
 
 urlpatterns = [
+    path("async/", include(async_urlpatterns)),
+    path("stats/", RequestStatsView.as_view(), name="request-stats"),
     path("", include(router.urls)),
 ]
@@ -2,27 +2,55 @@
 Views for portfolio app.
 """
 
+from itertools import groupby
+from operator import itemgetter
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.db import connection
+from django.db.models import F, Prefetch, Window
+from django.db.models.functions import RowNumber
 from django.http import JsonResponse
 
-from rest_framework import viewsets
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
-from rest_framework.permissions import AllowAny, IsAuthenticatedOrReadOnly
+from rest_framework.exceptions import AuthenticationFailed, NotFound, ValidationError
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
-
+from rest_framework.views import APIView
+
+from rest_framework_simplejwt.views import TokenObtainPairView as BaseTokenObtainPairView
+from rest_framework_simplejwt.views import TokenViewBase
+
+from . import counters, instrumentation
+from .authentication import StatelessJWTAuthentication, TokenRevokeSerializer
+from .bulk import BulkWriteMixin
+from .cache import CachedResponseMixin, cache_response
+from .columns import ColumnPruningMixin
+from .conditional import ConditionalResponseMixin
+from .export import ExportMixin
+from .filters import BlogPostFilter, ExperienceFilter, ProjectFilter
 from .models import (
     BlogPost,
+    BlogPostTag,
     Education,
     Experience,
+    ExperienceTechnology,
     Project,
+    ProjectTag,
+    ProjectTechnology,
     Skill,
+    Tag,
+    Technology,
     UserProfile,
 )
+from .revocation import revocations
 from .serializers import (
     BlogPostListSerializer,
     BlogPostSerializer,
     EducationSerializer,
     ExperienceSerializer,
+    PortfolioBundleSerializer,
     ProjectListSerializer,
     ProjectSerializer,
     SkillListSerializer,
@@ -30,9 +58,14 @@ from .serializers import (
     UserProfileListSerializer,
     UserProfileSerializer,
 )
+from .throttling import AnonThrottle, LoginThrottle, LoginUsernameThrottle
+
+User = get_user_model()
 
 
-class UserProfileViewSet(viewsets.ModelViewSet):
+class UserProfileViewSet(
+    ExportMixin, CachedResponseMixin, ConditionalResponseMixin, ColumnPruningMixin, viewsets.ModelViewSet
+):
     """
     ViewSet for UserProfile.
 
@@ -41,10 +74,12 @@ class UserProfileViewSet(viewsets.ModelViewSet):
     create: Create a new user profile
     update: Update a user profile
     destroy: Delete a user profile
+    export: Export the filtered list as NDJSON or CSV
     """
 
     queryset = UserProfile.objects.select_related("user").all()
     permission_classes = [IsAuthenticatedOrReadOnly]
+    cache_dependencies = [UserProfile, User]
     filterset_fields = ["is_active", "job_title"]
     search_fields = ["first_name", "last_name", "bio", "job_title", "company"]
     ordering_fields = ["created_at", "first_name", "last_name"]
@@ -58,7 +93,14 @@ class UserProfileViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(
+    BulkWriteMixin,
+    ExportMixin,
+    CachedResponseMixin,
+    ConditionalResponseMixin,
+    ColumnPruningMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet for Project.
 
@@ -67,13 +109,19 @@ class ProjectViewSet(viewsets.ModelViewSet):
     create: Create a new project
     update: Update a project
     destroy: Delete a project
+    export: Export the filtered list as NDJSON or CSV
     featured: Get featured projects
     """
 
-    queryset = Project.objects.select_related("user").all()
+    queryset = Project.objects.select_related("user").prefetch_related(
+        Prefetch("project_tags", queryset=ProjectTag.objects.select_related("tag")),
+        Prefetch("project_technologies", queryset=ProjectTechnology.objects.select_related("technology")),
+    )
     permission_classes = [IsAuthenticatedOrReadOnly]
-    filterset_fields = ["is_featured", "is_published", "user"]
+    cache_dependencies = [Project, User, Tag, Technology]
+    filterset_class = ProjectFilter
     search_fields = ["title", "description", "tags", "technologies"]
+    search_vector_field = "search_vector"
     ordering_fields = ["created_at", "start_date", "order", "title"]
     lookup_field = "slug"
 
@@ -93,6 +141,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
     @action(detail=False, methods=["get"])
+    @cache_response
     def featured(self, request):
         """Get featured projects."""
         featured_projects = self.get_queryset().filter(is_featured=True, is_published=True)
@@ -100,7 +149,14 @@ class ProjectViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class ExperienceViewSet(viewsets.ModelViewSet):
+class ExperienceViewSet(
+    BulkWriteMixin,
+    ExportMixin,
+    CachedResponseMixin,
+    ConditionalResponseMixin,
+    ColumnPruningMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet for Experience.
 
@@ -109,13 +165,17 @@ class ExperienceViewSet(viewsets.ModelViewSet):
     create: Create a new experience
     update: Update an experience
     destroy: Delete an experience
+    export: Export the filtered list as NDJSON or CSV
     current: Get current experiences
     """
 
-    queryset = Experience.objects.select_related("user").all()
+    queryset = Experience.objects.select_related("user").prefetch_related(
+        Prefetch("experience_technologies", queryset=ExperienceTechnology.objects.select_related("technology"))
+    )
     serializer_class = ExperienceSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
-    filterset_fields = ["is_current", "company", "user"]
+    cache_dependencies = [Experience, User, Technology]
+    filterset_class = ExperienceFilter
     search_fields = ["company", "position", "description", "technologies"]
     ordering_fields = ["start_date", "end_date", "order"]
 
@@ -123,6 +183,7 @@ class ExperienceViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
     @action(detail=False, methods=["get"])
+    @cache_response
     def current(self, request):
         """Get current experiences."""
         current_experiences = self.get_queryset().filter(is_current=True)
@@ -130,7 +191,14 @@ class ExperienceViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class EducationViewSet(viewsets.ModelViewSet):
+class EducationViewSet(
+    BulkWriteMixin,
+    ExportMixin,
+    CachedResponseMixin,
+    ConditionalResponseMixin,
+    ColumnPruningMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet for Education.
 
@@ -139,11 +207,13 @@ class EducationViewSet(viewsets.ModelViewSet):
     create: Create a new education record
     update: Update an education record
     destroy: Delete an education record
+    export: Export the filtered list as NDJSON or CSV
     """
 
     queryset = Education.objects.select_related("user").all()
     serializer_class = EducationSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    cache_dependencies = [Education, User]
     filterset_fields = ["institution", "degree", "user"]
     search_fields = ["institution", "degree", "field_of_study", "description"]
     ordering_fields = ["start_date", "end_date", "order"]
@@ -152,7 +222,14 @@ class EducationViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
 
-class SkillViewSet(viewsets.ModelViewSet):
+class SkillViewSet(
+    BulkWriteMixin,
+    ExportMixin,
+    CachedResponseMixin,
+    ConditionalResponseMixin,
+    ColumnPruningMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet for Skill.
 
@@ -161,12 +238,14 @@ class SkillViewSet(viewsets.ModelViewSet):
     create: Create a new skill
     update: Update a skill
     destroy: Delete a skill
+    export: Export the filtered list as NDJSON or CSV
     featured: Get featured skills
     by_category: Get skills by category
     """
 
     queryset = Skill.objects.select_related("user").all()
     permission_classes = [IsAuthenticatedOrReadOnly]
+    cache_dependencies = [Skill, User]
     filterset_fields = ["category", "proficiency", "is_featured", "user"]
     search_fields = ["name", "description"]
     ordering_fields = ["name", "level", "order", "years_of_experience"]
@@ -180,6 +259,7 @@ class SkillViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
     @action(detail=False, methods=["get"])
+    @cache_response
     def featured(self, request):
         """Get featured skills."""
         featured_skills = self.get_queryset().filter(is_featured=True)
@@ -187,18 +267,43 @@ class SkillViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"])
+    @cache_response
     def by_category(self, request):
-        """Get skills grouped by category."""
-        categories = {}
-        for skill in self.get_queryset():
-            category = skill.get_category_display()
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(SkillListSerializer(skill).data)
+        """
+        Get skills grouped by category.
+
+        Honours the list filters (e.g. ``?user=``); ``?limit=N`` keeps the
+        first N skills of each category.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        ordering = queryset.query.order_by or Skill._meta.ordering
+        queryset = queryset.order_by("category", *ordering)
+
+        limit = request.query_params.get("limit")
+        if limit is not None:
+            if not limit.isdigit() or int(limit) < 1:
+                raise ValidationError({"limit": "A positive integer is required."})
+            queryset = queryset.annotate(
+                category_rank=Window(RowNumber(), partition_by=F("category"), order_by=ordering)
+            ).filter(category_rank__lte=int(limit))
+
+        labels = dict(Skill.CATEGORY_CHOICES)
+        skills = SkillListSerializer(queryset, many=True).data
+        categories = {
+            labels.get(category, category): list(items)
+            for category, items in groupby(skills, key=itemgetter("category"))
+        }
         return Response(categories)
 
 
-class BlogPostViewSet(viewsets.ModelViewSet):
+class BlogPostViewSet(
+    BulkWriteMixin,
+    ExportMixin,
+    CachedResponseMixin,
+    ConditionalResponseMixin,
+    ColumnPruningMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet for BlogPost.
 
@@ -207,14 +312,21 @@ class BlogPostViewSet(viewsets.ModelViewSet):
     create: Create a new blog post
     update: Update a blog post
     destroy: Delete a blog post
+    export: Export the filtered list as NDJSON or CSV
     featured: Get featured blog posts
     increment_views: Increment views count
     """
 
-    queryset = BlogPost.objects.select_related("author").all()
+    owner_field = "author"
+
+    queryset = BlogPost.objects.select_related("author").prefetch_related(
+        Prefetch("post_tags", queryset=BlogPostTag.objects.select_related("tag"))
+    )
     permission_classes = [IsAuthenticatedOrReadOnly]
-    filterset_fields = ["status", "is_featured", "author"]
+    cache_dependencies = [BlogPost, User, Tag]
+    filterset_class = BlogPostFilter
     search_fields = ["title", "excerpt", "content", "tags"]
+    search_vector_field = "search_vector"
     ordering_fields = ["created_at", "published_at", "views_count", "title"]
     lookup_field = "slug"
 
@@ -234,19 +346,150 @@ class BlogPostViewSet(viewsets.ModelViewSet):
         serializer.save(author=self.request.user)
 
     @action(detail=False, methods=["get"])
+    @cache_response
     def featured(self, request):
         """Get featured blog posts."""
         featured_posts = self.get_queryset().filter(is_featured=True, status="published")
         serializer = self.get_serializer(featured_posts, many=True)
         return Response(serializer.data)
 
-    @action(detail=True, methods=["post"], permission_classes=[AllowAny])
+    @action(detail=True, methods=["post"], permission_classes=[AllowAny], throttle_scope="views")
     def increment_views(self, request, slug=None):
-        """Increment the views count for a blog post."""
-        post = self.get_object()
-        post.views_count += 1
-        post.save(update_fields=["views_count"])
-        return Response({"views_count": post.views_count})
+        """
+        Increment the views count for a blog post.
+
+        Views are buffered and flushed to the database in bulk (see counters.py);
+        the returned count is the stored count plus the pending views.
+        """
+        post = counters.lookup_post(slug)
+        if post is None or (post["status"] != "published" and not request.user.is_authenticated):
+            raise NotFound()
+        pending = counters.increment(post["id"])
+        counters.maybe_flush()
+        return Response({"views_count": post["views_count"] + pending})
+
+
+def get_bundle_queryset(recent_posts_count):
+    """Return active users with everything their public portfolio shows prefetched."""
+    technologies = Prefetch(
+        "experience_technologies", queryset=ExperienceTechnology.objects.select_related("technology")
+    )
+    return (
+        User.objects.filter(is_active=True)
+        .select_related("profile")
+        .prefetch_related(
+            Prefetch(
+                "projects",
+                queryset=Project.objects.filter(is_published=True).prefetch_related(
+                    Prefetch("project_tags", queryset=ProjectTag.objects.select_related("tag")),
+                    Prefetch("project_technologies", queryset=ProjectTechnology.objects.select_related("technology")),
+                ),
+                to_attr="published_projects",
+            ),
+            Prefetch("experiences", queryset=Experience.objects.prefetch_related(technologies)),
+            "education",
+            Prefetch("skills", queryset=Skill.objects.filter(is_featured=True), to_attr="featured_skills"),
+            Prefetch(
+                "blog_posts",
+                queryset=BlogPost.objects.filter(status="published").prefetch_related(
+                    Prefetch("post_tags", queryset=BlogPostTag.objects.select_related("tag"))
+                )[:recent_posts_count],
+                to_attr="recent_posts",
+            ),
+        )
+    )
+
+
+class PortfolioBundleViewSet(viewsets.GenericViewSet):
+    """
+    ViewSet assembling a user's whole public portfolio.
+
+    bundle: Get the profile, published projects, experiences, education,
+    featured skills and recent published posts of a user in one response
+    """
+
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    cache_dependencies = [User, UserProfile, Project, Experience, Education, Skill, BlogPost, Tag, Technology]
+    serializer_class = PortfolioBundleSerializer
+    lookup_field = "username"
+    lookup_value_regex = r"[\w.@+-]+"
+    recent_posts_count = 5
+
+    def get_queryset(self):
+        return get_bundle_queryset(self.recent_posts_count)
+
+    @action(detail=True, methods=["get"])
+    @cache_response
+    def bundle(self, request, username=None):
+        """Get the complete portfolio of a user."""
+        serializer = self.get_serializer(self.get_object())
+        return Response(serializer.data)
+
+
+class RequestStatsView(APIView):
+    """
+    Per-route statistics of the instrumented requests (admin only).
+
+    get: Get the sampled request count and the average queries, duplicated
+    queries and timings per request of every route
+    delete: Reset the statistics
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(
+            {
+                "sample_rate": settings.INSTRUMENTATION_SAMPLE_RATE,
+                "routes": instrumentation.get_stats(),
+            }
+        )
+
+    def delete(self, request):
+        instrumentation.reset_stats()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class TokenObtainPairView(BaseTokenObtainPairView):
+    """Obtain a token pair, counting the rejected credentials per username (see throttling.py)."""
+
+    # Throttled before the password is hashed
+    throttle_classes = [AnonThrottle, LoginThrottle, LoginUsernameThrottle]
+
+    def post(self, request, *args, **kwargs):
+        try:
+            return super().post(request, *args, **kwargs)
+        except AuthenticationFailed:
+            for throttle in self.get_throttles():
+                if isinstance(throttle, LoginUsernameThrottle):
+                    throttle.record_failure(request, self)
+            raise
+
+
+class TokenRevokeView(TokenViewBase):
+    """Revoke a refresh token, and the access token sent in the Authorization header if it is valid (logout)."""
+
+    serializer_class = TokenRevokeSerializer
+    # Clients often log out once their access token has expired: the header
+    # must not prevent revoking the refresh token
+    authentication_classes = []
+
+    def post(self, request, *args, **kwargs):
+        response = super().post(request, *args, **kwargs)
+        access = self.get_access_token(request)
+        if access is not None:
+            revocations.revoke(access)
+        return response
+
+    def get_access_token(self, request):
+        """Return the validated access token of the Authorization header, None if missing, invalid or expired."""
+        authentication = StatelessJWTAuthentication()
+        header = authentication.get_header(request)
+        try:
+            raw_token = authentication.get_raw_token(header) if header is not None else None
+            return authentication.get_validated_token(raw_token) if raw_token is not None else None
+        except AuthenticationFailed:
+            return None
 
 
 def health_check(request):
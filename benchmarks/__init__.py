@@ -0,0 +1,6 @@
+"""
+Performance benchmarks for the portfolio API.
+
+Not part of the test suite: these scripts start real servers against the
+configured database and measure throughput and latency. See README.md.
+"""
@@ -0,0 +1,70 @@
+"""
+Compare the sync (WSGI) and async (ASGI) read paths at equal worker count.
+
+Starts gunicorn with sync workers serving the DRF endpoints, then gunicorn
+with uvicorn workers serving the async mirror (``/api/portfolio/async/``),
+and drives both with the same concurrent load.
+
+    python -m benchmarks.async_vs_sync --workers 3 --concurrency 50 --duration 15
+"""
+
+import argparse
+import json
+import os
+
+import django
+
+from benchmarks.load import drive
+from benchmarks.servers import ASYNC, SYNC, gunicorn
+
+ENDPOINTS = ["projects/", "blog/", "users/{username}/bundle/"]
+
+
+def default_username():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+    from apps.portfolio.models import UserProfile
+
+    profile = UserProfile.objects.select_related("user").filter(user__is_active=True).first()
+    if profile is None:
+        raise SystemExit("No user profile found: seed the database first (manage.py seed_data)")
+    return profile.user.username
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds per run")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--username", help="User whose bundle is requested (default: first profile)")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    username = args.username or default_username()
+    endpoints = [endpoint.format(username=username) for endpoint in ENDPOINTS]
+    runs = {
+        "sync": (SYNC, ["/api/portfolio/" + endpoint for endpoint in endpoints]),
+        "async": (ASYNC, ["/api/portfolio/async/" + endpoint for endpoint in endpoints]),
+    }
+
+    results = {}
+    for name, (server, paths) in runs.items():
+        with gunicorn(port=args.port, workers=args.workers, **server) as base_url:
+            drive(base_url, paths, concurrency=args.concurrency, duration=2)  # warm up
+            results[name] = drive(base_url, paths, concurrency=args.concurrency, duration=args.duration)
+
+    print(f"{args.workers} workers, {args.concurrency} concurrent clients, {args.duration:g}s per run")
+    print(f"{'':8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for name, result in results.items():
+        print(
+            f"{name:8}{result['throughput']:>10.1f}{result['p50']:>10.1f}"
+            f"{result['p95']:>10.1f}{result['p99']:>10.1f}{result['errors']:>8}"
+        )
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"workers": args.workers, "concurrency": args.concurrency, "results": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Synthetic benchmark dataset.
+
+``seed`` creates ``users`` portfolios of ``items`` projects, blog posts,
+skills, experiences and education entries each, generated by
+``apps.portfolio.seeding`` with deterministic content so that runs against the
+same dataset size are comparable. Benchmark users are named ``bench_user_<n>``.
+"""
+
+from apps.portfolio import seeding
+
+PREFIX = "bench_user"
+USERNAME = PREFIX + "_{}"
+
+
+def seed(users, items, seed=0):
+    """Create the benchmark users that do not exist yet, returning how many were created."""
+    created = seeding.generate(
+        users,
+        projects=items,
+        posts=items,
+        skills=items,
+        experiences=items,
+        education=items,
+        seed=seed,
+        prefix=PREFIX,
+    )
+    return created.get(seeding.User, 0)
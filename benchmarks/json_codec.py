@@ -0,0 +1,127 @@
+"""
+Compare DRF's JSON renderer and parser with apps.portfolio.jsoncodec.
+
+Seeds ``--users`` benchmark portfolios of ``--items`` rows of each kind, then
+serializes every row of each model with its detail serializer and, for each
+payload, times rendering and parsing with DRF's ``JSONRenderer``/``JSONParser``,
+the stdlib fallback and orjson (when installed). Encoders whose output
+differs from DRF's are flagged.
+
+    python -m benchmarks.json_codec --users 20 --items 50 --iterations 20
+"""
+
+import argparse
+import io
+import json
+import os
+import statistics
+import time
+
+import django
+
+# Models and their detail serializers, with the queryset of the benchmark users
+PAYLOADS = {
+    "profile": ("UserProfileSerializer", "UserProfile", "user__username"),
+    "project": ("ProjectSerializer", "Project", "user__username"),
+    "experience": ("ExperienceSerializer", "Experience", "user__username"),
+    "education": ("EducationSerializer", "Education", "user__username"),
+    "skill": ("SkillSerializer", "Skill", "user__username"),
+    "blogpost": ("BlogPostSerializer", "BlogPost", "author__username"),
+}
+
+
+def get_payloads():
+    """Return ``{name: data}``, the serialized rows of the benchmark users for each model."""
+    from rest_framework.test import APIRequestFactory
+
+    from apps.portfolio import models, serializers
+    from benchmarks.dataset import PREFIX
+
+    context = {"request": APIRequestFactory().get("/api/portfolio/")}
+    payloads = {}
+    for name, (serializer_name, model_name, owner) in PAYLOADS.items():
+        queryset = getattr(models, model_name).objects.filter(**{f"{owner}__startswith": PREFIX}).order_by("pk")
+        payloads[name] = getattr(serializers, serializer_name)(queryset, many=True, context=context).data
+    return payloads
+
+
+def get_codecs():
+    """Return ``{name: (render, parse)}`` for DRF and each jsoncodec backend available."""
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+
+    from apps.portfolio import jsoncodec
+
+    codecs = {"drf": (JSONRenderer().render, lambda content: JSONParser().parse(io.BytesIO(content)))}
+    codecs["stdlib"] = (jsoncodec.dumps_json, lambda content: json.loads(content.decode()))
+    if jsoncodec.orjson is not None:
+        codecs["orjson"] = (jsoncodec.dumps_orjson, jsoncodec.loads)
+    return codecs
+
+
+def timing(function, argument, iterations):
+    """Median milliseconds of ``iterations`` calls of ``function(argument)``."""
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        function(argument)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations) * 1000
+
+
+def measure(payloads, iterations):
+    """Time rendering and parsing each payload with each codec."""
+    codecs = get_codecs()
+    results = {}
+    for name, data in payloads.items():
+        expected = codecs["drf"][0](data)
+        results[name] = {"rows": len(data), "bytes": len(expected)}
+        for codec, (render, parse) in codecs.items():
+            results[name][codec] = {
+                "render": timing(render, data, iterations),
+                "parse": timing(parse, expected, iterations),
+                "identical": render(data) == expected,
+            }
+    return results
+
+
+def report(results):
+    codecs = [codec for codec in next(iter(results.values()), {}) if codec not in ("rows", "bytes")]
+    lines = [f"{'payload':26}" + "".join(f"{codec + ' render':>20}{codec + ' parse':>14}" for codec in codecs)]
+    for name, result in results.items():
+        cells = []
+        for codec in codecs:
+            timings = result[codec]
+            render = f"{timings['render']:.2f} x{result['drf']['render'] / timings['render']:.1f}"
+            if not timings["identical"]:
+                render += "*"
+            cells.append(f"{render:>20}{timings['parse']:>14.2f}")
+        size = f"{name} ({result['bytes'] // 1024} KiB)"
+        lines.append(f"{size:26}" + "".join(cells))
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20, help="Benchmark users to seed (default: 20)")
+    parser.add_argument("--items", type=int, default=50, help="Rows of each kind per user (default: 50)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the generated content")
+    parser.add_argument("--iterations", type=int, default=20, help="Calls per payload and codec")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+    from benchmarks.dataset import seed
+
+    seed(args.users, args.items, seed=args.seed)
+    results = measure(get_payloads(), args.iterations)
+    print("Median milliseconds per call (render speedup over DRF, * output differs from DRF):")
+    print("\n".join(report(results)))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Minimal closed-loop HTTP load generator.
+
+Each client thread keeps one persistent connection and sends requests back to
+back for the duration of the run, cycling through the given paths.
+"""
+
+import http.client
+import itertools
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+def percentiles(latencies):
+    """Return p50/p95/p99 of ``latencies`` (seconds) in milliseconds."""
+    if len(latencies) < 2:
+        value = latencies[0] * 1000 if latencies else None
+        return {"p50": value, "p95": value, "p99": value}
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {"p50": cuts[49] * 1000, "p95": cuts[94] * 1000, "p99": cuts[98] * 1000}
+
+
+def drive(base_url, paths, concurrency=10, duration=10.0, headers=None):
+    """
+    Send requests to ``base_url`` for ``duration`` seconds from ``concurrency`` clients.
+
+    Returns the number of requests and errors, the throughput (requests per
+    second) and latency percentiles.
+    """
+    url = urlsplit(base_url)
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client(offset):
+        connection = http.client.HTTPConnection(url.hostname, url.port, timeout=30)
+        local, failed = [], 0
+        for path in itertools.islice(itertools.cycle(paths), offset, None):
+            if time.perf_counter() >= deadline:
+                break
+            start = time.perf_counter()
+            try:
+                connection.request("GET", path, headers=headers or {})
+                response = connection.getresponse()
+                response.read()
+                if response.status >= 400:
+                    failed += 1
+            except (OSError, http.client.HTTPException):
+                failed += 1
+                connection.close()
+                connection = http.client.HTTPConnection(url.hostname, url.port, timeout=30)
+                continue
+            local.append(time.perf_counter() - start)
+        connection.close()
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "errors": errors[0],
+        "throughput": len(latencies) / elapsed,
+        **percentiles(latencies),
+    }
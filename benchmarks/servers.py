@@ -0,0 +1,55 @@
+"""
+Local gunicorn servers for benchmarks.
+"""
+
+import http.client
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+SYNC = {"app": "config.wsgi:application"}
+ASYNC = {"app": "config.asgi:application", "worker_class": "uvicorn_worker.UvicornWorker"}
+
+
+def wait_until_ready(port, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/health/")
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server on port {port} did not start within {timeout}s")
+
+
+@contextmanager
+def gunicorn(app, port, workers=3, worker_class=None, env=None):
+    """
+    Run gunicorn serving ``app`` on ``port`` and yield its base URL.
+
+    The response cache is disabled so that every request reaches the views.
+    """
+    command = [sys.executable, "-m", "gunicorn", app, "--bind", f"127.0.0.1:{port}", "--workers", str(workers)]
+    if worker_class:
+        command += ["--worker-class", worker_class]
+    command += ["--log-level", "warning"]
+    process = subprocess.Popen(
+        command,
+        cwd=BASE_DIR,
+        env={**os.environ, "API_CACHE_ENABLED": "False", "API_THROTTLE_ENABLED": "False", **(env or {})},
+    )
+    try:
+        wait_until_ready(port, process)
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
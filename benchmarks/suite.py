@@ -0,0 +1,235 @@
+"""
+Latency and throughput baseline of every REST endpoint.
+
+Seeds ``--users`` benchmark portfolios of ``--items`` rows of each kind, then
+measures each router endpoint (list, detail, extra actions such as
+``featured``/``current``/``by_category``/``bundle``, search and ordering):
+
+- in-process with the Django test client: p50/p95/p99 latency, throughput of
+  a single client and the number of SQL queries per request;
+- through a local gunicorn: p50/p95/p99 latency and throughput under
+  ``--concurrency`` clients.
+
+The response cache is disabled in both modes. Results are written as JSON so
+that baselines taken on different commits can be compared:
+
+    python -m benchmarks.suite --users 50 --items 20 --output before.json
+    python -m benchmarks.suite --users 50 --items 20 --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import time
+from datetime import datetime, timezone
+
+import django
+
+from benchmarks.load import drive, percentiles
+from benchmarks.servers import ASYNC, BASE_DIR, SYNC, gunicorn
+
+API_PREFIX = "/api/portfolio/"
+SERVERS = {"sync": SYNC, "async": ASYNC}
+METRICS = ["p50", "p95", "p99", "throughput", "queries"]
+
+
+def get_endpoints(search="django"):
+    """Return ``{name: path}`` for every GET endpoint of the portfolio router."""
+    from django.contrib.auth.models import AnonymousUser
+    from django.http import HttpRequest
+
+    from apps.portfolio.urls import router
+
+    request = HttpRequest()
+    request.user = AnonymousUser()
+
+    endpoints = {}
+    for prefix, viewset, _ in router.registry:
+        view = viewset(request=request, format_kwarg=None, kwargs={})
+        instance = view.get_queryset().first()
+        lookup = getattr(instance, view.lookup_field) if instance is not None else None
+        base = f"{API_PREFIX}{prefix}/"
+
+        if hasattr(viewset, "list"):
+            endpoints[f"{prefix}-list"] = base
+            if getattr(viewset, "search_fields", None):
+                endpoints[f"{prefix}-search"] = f"{base}?search={search}"
+            if getattr(viewset, "ordering_fields", None):
+                endpoints[f"{prefix}-ordering"] = f"{base}?ordering=-{viewset.ordering_fields[0]}"
+        if hasattr(viewset, "retrieve") and lookup is not None:
+            endpoints[f"{prefix}-detail"] = f"{base}{lookup}/"
+
+        for action in viewset.get_extra_actions():
+            if "get" not in action.mapping:
+                continue
+            if not action.detail:
+                endpoints[f"{prefix}-{action.url_path}"] = f"{base}{action.url_path}/"
+            elif lookup is not None:
+                endpoints[f"{prefix}-{action.url_path}"] = f"{base}{lookup}/{action.url_path}/"
+    return endpoints
+
+
+def fetch(client, path):
+    """GET ``path``, reading streamed bodies (exports) to the end."""
+    response = client.get(path)
+    if response.streaming:
+        b"".join(response.streaming_content)
+    return response
+
+
+def measure_in_process(endpoints, iterations):
+    """Request each endpoint ``iterations`` times with the test client."""
+    from django.conf import settings
+    from django.db import connection, reset_queries
+    from django.test import Client, override_settings
+    from django.test.utils import CaptureQueriesContext
+
+    client = Client()
+    results = {}
+    with override_settings(
+        API_CACHE_ENABLED=False, API_THROTTLE_ENABLED=False, ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]
+    ):
+        for name, path in endpoints.items():
+            # The first request warms up and counts the queries, untimed. The
+            # query log is bounded: empty it so the count cannot be truncated
+            reset_queries()
+            with CaptureQueriesContext(connection) as queries:
+                response = fetch(client, path)
+            query_count = len(queries)
+            if response.status_code != 200:
+                raise RuntimeError(f"GET {path} returned {response.status_code}")
+
+            latencies = []
+            started = time.perf_counter()
+            for _ in range(iterations):
+                start = time.perf_counter()
+                fetch(client, path)
+                latencies.append(time.perf_counter() - start)
+            elapsed = time.perf_counter() - started
+            results[name] = {
+                "queries": query_count,
+                "requests": iterations,
+                "throughput": iterations / elapsed,
+                **percentiles(latencies),
+            }
+    return results
+
+
+def measure_server(endpoints, server, workers, port, concurrency, duration):
+    """Load each endpoint in turn through gunicorn."""
+    results = {}
+    with gunicorn(port=port, workers=workers, **SERVERS[server]) as base_url:
+        for name, path in endpoints.items():
+            drive(base_url, [path], concurrency=concurrency, duration=1)  # warm up
+            results[name] = drive(base_url, [path], concurrency=concurrency, duration=duration)
+    return results
+
+
+def get_commit():
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR, capture_output=True, text=True)
+    except OSError:
+        return None
+    return output.stdout.strip() or None
+
+
+def compare(baseline, results):
+    """Return report lines comparing ``results`` with a previous ``baseline``."""
+    lines = []
+    for mode in ("in_process", "server"):
+        before, after = baseline.get(mode) or {}, results.get(mode) or {}
+        if not before or not after:
+            continue
+        lines.append(f"{mode + ':':32}" + "".join(f"{metric:>22}" for metric in METRICS))
+        for name in sorted(before.keys() & after.keys()):
+            cells = []
+            for metric in METRICS:
+                old, new = before[name].get(metric), after[name].get(metric)
+                if old is None or new is None:
+                    cells.append(f"{'-':>22}")
+                elif metric == "queries":
+                    cells.append(f"{old:>10} -> {new:<9}")
+                else:
+                    change = f"{(new - old) / old * 100:+.0f}%" if old else "n/a"
+                    cells.append(f"{new:>13.1f} {change:>8}")
+            lines.append(f"  {name:30}" + "".join(cells))
+    return lines
+
+
+def report(results):
+    lines = []
+    for mode in ("in_process", "server"):
+        if not results.get(mode):
+            continue
+        lines.append(f"{mode + ':':32}" + "".join(f"{metric:>12}" for metric in METRICS))
+        for name, result in results[mode].items():
+            cells = [f"{'-':>12}" if result.get(metric) is None else f"{result[metric]:>12.1f}" for metric in METRICS]
+            lines.append(f"  {name:30}" + "".join(cells))
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20, help="Benchmark users to seed (default: 20)")
+    parser.add_argument("--items", type=int, default=10, help="Rows of each kind per user (default: 10)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the generated content")
+    parser.add_argument("--mode", choices=["all", "in-process", "server"], default="all")
+    parser.add_argument("--iterations", type=int, default=50, help="In-process requests per endpoint")
+    parser.add_argument("--server", choices=SERVERS, default="async", help="Gunicorn worker type (default: async)")
+    parser.add_argument("--workers", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds of load per endpoint")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--compare", help="Previous results file to compare with")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+    from django.db import connection
+
+    from benchmarks.dataset import seed
+
+    created = seed(args.users, args.items, seed=args.seed)
+    print(f"Seeded {created} benchmark users ({args.users} requested, {args.items} items each)")
+    endpoints = get_endpoints()
+
+    results = {
+        "meta": {
+            "commit": get_commit(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "database": connection.vendor,
+            "users": args.users,
+            "items": args.items,
+            "iterations": args.iterations,
+            "server": args.server,
+            "workers": args.workers,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+        },
+        "endpoints": endpoints,
+    }
+    if args.mode in ("all", "in-process"):
+        results["in_process"] = measure_in_process(endpoints, args.iterations)
+    if args.mode in ("all", "server"):
+        connection.close()
+        results["server"] = measure_server(
+            endpoints, args.server, args.workers, args.port, args.concurrency, args.duration
+        )
+
+    print("\n".join(report(results)))
+    if args.compare:
+        with open(args.compare) as file:
+            print(f"\nCompared with {args.compare}:")
+            print("\n".join(compare(json.load(file), results)))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
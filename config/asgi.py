@@ -13,4 +13,6 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
+# Static files are served by nginx (STATIC_ROOT, see nginx/nginx.conf): every
+# middleware must stay async-capable (see apps/portfolio/checks.py)
 application = get_asgi_application()
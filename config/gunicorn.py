@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration.
+
+Manages the directory shared by the workers for Prometheus metrics
+(``PROMETHEUS_MULTIPROC_DIR``, see apps/portfolio/metrics.py): emptied when
+the server starts, and the files of exited workers are marked dead so that
+their live gauges stop being reported.
+"""
+
+import os
+from pathlib import Path
+
+
+def on_starting(server):
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if path:
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        for file in directory.glob("*.db"):
+            file.unlink()
+
+
+def child_exit(server, worker):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
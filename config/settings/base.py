@@ -52,8 +52,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "apps.portfolio.metrics.PrometheusMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "apps.portfolio.compression.CompressionMiddleware",
+    "apps.portfolio.instrumentation.QueryInstrumentationMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -96,6 +98,61 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# CACHE_URL examples: locmemcache://, filecache:///var/tmp/django_cache, redis://redis:6379/1
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
+# API response cache (see apps/portfolio/cache.py)
+API_CACHE_ENABLED = env.bool("API_CACHE_ENABLED", default=True)
+API_CACHE_ALIAS = "default"
+API_CACHE_TIMEOUT = env.int("API_CACHE_TIMEOUT", default=60 * 60)
+
+# Compression of JSON responses (see apps/portfolio/compression.py): Brotli needs the brotli package
+API_COMPRESSION_ENABLED = env.bool("API_COMPRESSION_ENABLED", default=True)
+API_COMPRESSION_MIN_SIZE = env.int("API_COMPRESSION_MIN_SIZE", default=1024)
+API_COMPRESSION_GZIP_LEVEL = 6
+API_COMPRESSION_BROTLI_QUALITY = 5
+
+# Bulk writes on the list endpoints (see apps/portfolio/bulk.py)
+API_BULK_MAX_ITEMS = env.int("API_BULK_MAX_ITEMS", default=1000)
+
+# Streaming exports (see apps/portfolio/export.py): rows fetched and rendered per chunk
+API_EXPORT_CHUNK_SIZE = 500
+
+# Buffered blog post view counters (see apps/portfolio/counters.py)
+# Set the interval to 0 to only flush through `manage.py flush_view_counts`.
+VIEW_COUNTER_CACHE_ALIAS = "default"
+VIEW_COUNTER_FLUSH_INTERVAL = env.int("VIEW_COUNTER_FLUSH_INTERVAL", default=60)
+
+# Full-text search configuration used by the PostgreSQL search triggers and queries
+# (changing it requires rebuilding the search_vector columns)
+FULL_TEXT_SEARCH_CONFIG = "english"
+
+# Responsive image derivatives (see apps/portfolio/images.py)
+# Formats Pillow cannot encode are skipped; regenerate with `manage.py generate_image_derivatives`.
+IMAGE_DERIVATIVE_WIDTHS = [320, 640, 1280]
+IMAGE_DERIVATIVE_FORMATS = ["avif", "webp", "jpeg"]
+IMAGE_DERIVATIVE_QUALITY = 80
+
+# Background task queue (see apps/portfolio/tasks.py), run by `manage.py run_worker`.
+# In eager mode tasks run in-process once the enqueuing transaction commits.
+TASK_QUEUE_EAGER = env.bool("TASK_QUEUE_EAGER", default=False)
+TASK_MAX_ATTEMPTS = 3
+TASK_RETRY_DELAY = 30  # seconds, doubled on every attempt
+TASK_LOCK_TIMEOUT = 15 * 60  # seconds before a running task is considered abandoned
+TASK_POLL_INTERVAL = 1  # seconds between polls of an empty queue
+
+# Per-request SQL instrumentation (see apps/portfolio/instrumentation.py)
+# Fraction of requests instrumented, 0 disables it. Sampled responses carry a Server-Timing header.
+INSTRUMENTATION_SAMPLE_RATE = env.float("INSTRUMENTATION_SAMPLE_RATE", default=0.0)
+INSTRUMENTATION_CACHE_ALIAS = "default"
+INSTRUMENTATION_DUPLICATE_THRESHOLD = 5  # executions of one statement logged as a possible N+1
+
+# Prometheus metrics (see apps/portfolio/metrics.py), scraped at /metrics.
+# When set, scrapers must send "Authorization: Bearer <METRICS_TOKEN>".
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 AUTH_PASSWORD_VALIDATORS = [
@@ -136,20 +193,51 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # REST Framework Configuration
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": ("rest_framework_simplejwt.authentication.JWTAuthentication",),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("apps.portfolio.authentication.StatelessJWTAuthentication",),
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
     ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_RENDERER_CLASSES": [
+        "apps.portfolio.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    # orjson when installed, the stdlib otherwise (see apps/portfolio/jsoncodec.py)
+    "DEFAULT_PARSER_CLASSES": [
+        "apps.portfolio.parsers.JSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+    "DEFAULT_PAGINATION_CLASS": "apps.portfolio.pagination.PortfolioPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
-        "rest_framework.filters.SearchFilter",
+        "apps.portfolio.filters.FullTextSearchFilter",
         "rest_framework.filters.OrderingFilter",
     ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # Rate limiting (see apps/portfolio/throttling.py)
+    "DEFAULT_THROTTLE_CLASSES": [
+        "apps.portfolio.throttling.AnonThrottle",
+        "apps.portfolio.throttling.UserThrottle",
+        "apps.portfolio.throttling.ScopedThrottle",
+    ],
+    "DEFAULT_THROTTLE_RATES": {
+        "anon": "600/min",
+        "user": "1200/min",
+        "login": "10/min",
+        "login_username": "30/hour",
+        "views": "30/min",
+        "export": "20/min",
+        "bulk": "60/min",
+    },
+    # Proxies in front of gunicorn (nginx), whose X-Forwarded-For gives the client IP; 0 without proxy
+    "NUM_PROXIES": env.int("API_NUM_PROXIES", default=1),
 }
 
+# Rate limiting counters, in a cache shared by the workers
+API_THROTTLE_ENABLED = env.bool("API_THROTTLE_ENABLED", default=True)
+API_THROTTLE_CACHE_ALIAS = "default"
+
 # JWT Settings
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=env.int("JWT_ACCESS_TOKEN_LIFETIME_MINUTES", default=60)),
@@ -168,8 +256,19 @@ SIMPLE_JWT = {
     "USER_ID_CLAIM": "user_id",
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
     "TOKEN_TYPE_CLAIM": "token_type",
+    "TOKEN_OBTAIN_SERIALIZER": "apps.portfolio.authentication.TokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "apps.portfolio.authentication.TokenRefreshSerializer",
 }
 
+# Stateless JWT authentication (see apps/portfolio/authentication.py): verified tokens kept per worker
+API_AUTH_TOKEN_CACHE_SIZE = env.int("API_AUTH_TOKEN_CACHE_SIZE", default=10000)
+
+# Token revocation (see apps/portfolio/revocation.py), in a cache shared by the workers
+API_AUTH_REVOCATION_CACHE_ALIAS = "default"
+API_AUTH_REVOCATION_WINDOW = 60 * 60  # seconds of token expiry covered by one Bloom filter
+API_AUTH_REVOCATION_CAPACITY = 10000  # revocations per window at a 1% false positive rate
+API_AUTH_REVOCATION_SYNC_INTERVAL = 1  # seconds before a worker reads the revocations of the others
+
 # CORS Settings
 CORS_ALLOWED_ORIGINS = env.list("CORS_ALLOWED_ORIGINS", default=["http://localhost:3000", "http://localhost:8080"])
 CORS_ALLOW_CREDENTIALS = True
@@ -12,18 +12,18 @@ from drf_spectacular.views import (
     SpectacularRedocView,
     SpectacularSwaggerView,
 )
-from rest_framework_simplejwt.views import (
-    TokenObtainPairView,
-    TokenRefreshView,
-)
+from rest_framework_simplejwt.views import TokenRefreshView
 
-from apps.portfolio.views import health_check
+from apps.portfolio.metrics import metrics_view
+from apps.portfolio.views import TokenObtainPairView, TokenRevokeView, health_check
 
 urlpatterns = [
     # Admin
     path("admin/", admin.site.urls),
     # Health check
     path("health/", health_check, name="health-check"),
+    # Prometheus metrics
+    path("metrics", metrics_view, name="metrics"),
     # API Documentation
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
     path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
@@ -31,6 +31,7 @@ urlpatterns = [
     # JWT Authentication
     path("api/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path("api/token/revoke/", TokenRevokeView.as_view(), name="token_revoke"),
     # API endpoints
     path("api/portfolio/", include("apps.portfolio.urls")),
     # Add other apps URLs as needed
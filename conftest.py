@@ -3,6 +3,7 @@ Pytest configuration and fixtures.
 """
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
 from rest_framework.test import APIClient
 from apps.portfolio.models import (
     UserProfile,
@@ -16,6 +17,13 @@ from apps.portfolio.models import (
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start every test with empty caches."""
+    for cache in caches.all():
+        cache.clear()
+
+
 @pytest.fixture
 def api_client():
     """Return an API client."""